@@ -0,0 +1,213 @@
+"""Benchmarks for the data pipeline and training engine.
+
+Synthetic regression and classification datasets are generated at each
+requested size and every stage the app runs is timed on them: CSV ingestion,
+the Preprocessing page steps, gradient descent, metrics and the Export
+archive. Results are written as JSON so two runs can be compared.
+
+    python -m benchmarks.bench --suite quick --output before.json
+    python -m benchmarks.bench --suite quick --output after.json --compare before.json
+
+Sizes whose feature matrix would exceed `--max-cells` values are skipped.
+"""
+import argparse
+import json
+import os
+import pickle
+import platform
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from mlstudio import archive, kernels
+from mlstudio.metrics import compute_metrics
+from mlstudio.training import gradient_descent, normalize_inplace, predict
+
+SUITES = {
+    "quick": {"rows": [10_000, 100_000], "features": [10, 100]},
+    "full": {"rows": [10_000, 100_000, 1_000_000, 10_000_000], "features": [10, 100, 1000]},
+}
+TASKS = ["Regression", "Classification"]
+STAGES = ["ingest", "preprocess", "train", "metrics", "export"]
+DEFAULT_MAX_CELLS = 200_000_000
+
+
+def make_dataset(n_rows, n_features, task, seed=0, missing=0.01):
+    """Features, a few missing values, one categorical column and a target named `y`."""
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((n_rows, n_features), dtype=np.float64)
+    coef = rng.standard_normal(n_features)
+    y = X @ coef + 0.1 * rng.standard_normal(n_rows)
+    if task == "Classification":
+        y = (y > 0).astype(int)
+
+    df = pd.DataFrame(X, columns=[f"x{i}" for i in range(n_features)])
+    df.iloc[rng.random(n_rows) < missing, 0] = np.nan
+    df["category"] = rng.choice(["a", "b", "c", "d"], size=n_rows)
+    df["y"] = y
+    return df
+
+
+def best_time(fn, repeat):
+    """Fastest of `repeat` runs; returns `(seconds, result of the last run)`."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def preprocess(df):
+    # Same steps as the Preprocessing page: mean imputation, one-hot encoding, z-score
+    df = df.copy()
+    df["x0"] = df["x0"].fillna(df["x0"].mean())
+    df = pd.get_dummies(df, columns=["category"], drop_first=True, dtype=int)
+    features = [col for col in df.columns if col.startswith("x")]
+    df[features] = StandardScaler().fit_transform(df[features])
+    return df
+
+
+def train(df, task, n_iter, dtype, n_threads=1, backend="NumPy"):
+    # Same steps as a single run on the Model page
+    features = [col for col in df.columns if col != "y"]
+    X = df[features].to_numpy(dtype=dtype)
+    y = df["y"].to_numpy(dtype=dtype).reshape(-1, 1)
+    train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=0.2, random_state=42)
+    X_train, X_test, y_train, y_test = X[train_idx], X[test_idx], y[train_idx], y[test_idx]
+    X_mean, X_std = normalize_inplace(X_train, X_test)
+    np.random.seed(42)
+    weights, bias, history = gradient_descent(X_train, y_train, task, 0.01, n_iter,
+                                              n_threads=n_threads, backend=backend)
+    return {"weights": weights, "bias": bias, "X_mean": X_mean, "X_std": X_std,
+            "X_test": X_test, "y_test": y_test, "n_train": len(X_train)}
+
+
+def run_case(task, n_rows, n_features, args):
+    df = make_dataset(n_rows, n_features, task, seed=args.seed)
+    case = {"task": task, "rows": n_rows, "features": n_features}
+    results = []
+
+    def add(stage, seconds, **extra):
+        results.append({**case, "stage": stage, "seconds": round(seconds, 6), **extra})
+        print(f"{task:<14} {n_rows:>10,} x {n_features:<5} {stage:<10} {seconds:10.4f}s "
+              + " ".join(f"{key}={value:,.0f}" for key, value in extra.items()), flush=True)
+
+    if "ingest" in args.stages:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.csv")
+            df.to_csv(path, index=False)
+            seconds, _ = best_time(lambda: pd.read_csv(path), args.repeat)
+            add("ingest", seconds, rows_per_sec=n_rows / seconds, mb=os.path.getsize(path) / 1024 ** 2)
+
+    if "preprocess" in args.stages or not set(args.stages).isdisjoint({"train", "metrics"}):
+        seconds, prepared = best_time(lambda: preprocess(df), args.repeat)
+        if "preprocess" in args.stages:
+            add("preprocess", seconds, rows_per_sec=n_rows / seconds)
+
+    if not set(args.stages).isdisjoint({"train", "metrics"}):
+        seconds, model = best_time(lambda: train(prepared, task, args.iterations, args.dtype,
+                                                       args.threads, args.backend), args.repeat)
+        if "train" in args.stages:
+            add("train", seconds, iterations_per_sec=args.iterations / seconds,
+                rows_per_sec=args.iterations * model["n_train"] / seconds)
+
+    if "metrics" in args.stages:
+        y_pred = predict(model["X_test"], model["weights"], model["bias"], task)
+        seconds, _ = best_time(lambda: compute_metrics(model["y_test"], y_pred, task), args.repeat)
+        add("metrics", seconds, rows_per_sec=len(y_pred) / seconds)
+
+    if "export" in args.stages:
+        def export():
+            members = [
+                ("raw_data.csv", lambda: archive.csv_bytes(df)),
+                ("trained_model.pkl", pickle.dumps({"weights": np.zeros((n_features, 1)), "bias": 0.0}))
+            ]
+            return archive.build_archive(members)
+        seconds, data = best_time(export, args.repeat)
+        add("export", seconds, rows_per_sec=n_rows / seconds, mb=len(data) / 1024 ** 2)
+
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def compare(results, baseline_path):
+    """Print the speedup of each case/stage over a previous JSON output."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (r["task"], r["rows"], r["features"], r["stage"]): r["seconds"]
+            for r in json.load(f)["results"]
+        }
+    print(f"\nSpeedup vs {baseline_path} (>1 is faster):")
+    for r in results:
+        before = baseline.get((r["task"], r["rows"], r["features"], r["stage"]))
+        if before:
+            print(f"{r['task']:<14} {r['rows']:>10,} x {r['features']:<5} {r['stage']:<10} "
+                  f"{before:10.4f}s -> {r['seconds']:10.4f}s  x{before / r['seconds']:.2f}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--suite", choices=SUITES, default="quick")
+    parser.add_argument("--rows", type=int, nargs="+", help="overrides the suite's row counts")
+    parser.add_argument("--features", type=int, nargs="+", help="overrides the suite's feature counts")
+    parser.add_argument("--tasks", nargs="+", choices=TASKS, default=TASKS)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--iterations", type=int, default=100, help="gradient descent iterations")
+    parser.add_argument("--threads", type=int, default=1, help="gradient threads (row shards)")
+    parser.add_argument("--backend", choices=kernels.BACKENDS, default="NumPy", help="gradient kernels")
+    parser.add_argument("--dtype", choices=["float64", "float32"], default="float64")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the fastest is kept")
+    parser.add_argument("--max-cells", type=int, default=DEFAULT_MAX_CELLS,
+                        help="skip sizes with more rows x features than this")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="previous JSON output to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows = args.rows or SUITES[args.suite]["rows"]
+    features = args.features or SUITES[args.suite]["features"]
+
+    results = []
+    for task in args.tasks:
+        for n_rows in rows:
+            for n_features in features:
+                if n_rows * n_features > args.max_cells:
+                    print(f"{task:<14} {n_rows:>10,} x {n_features:<5} skipped (over --max-cells)")
+                    continue
+                results.extend(run_case(task, n_rows, n_features, args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "config": vars(args), "results": results}, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Helpers shared by the ML Visual Studio Streamlit pages."""
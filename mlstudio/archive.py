@@ -0,0 +1,130 @@
+"""ZIP archive builder used by the Export page.
+
+Members are serialized and compressed concurrently on a thread pool (zlib,
+pandas' CSV writer and pyarrow all release the GIL for most of their work),
+then appended to the archive in their original order.
+"""
+import io
+import os
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Archive-level codecs offered in the UI
+ARCHIVE_CODECS = {
+    "Deflate": zipfile.ZIP_DEFLATED,
+    "Store": zipfile.ZIP_STORED,
+}
+
+# Parquet column codecs; Parquet members are already compressed and are stored as-is
+PARQUET_CODECS = ["zstd", "lz4", "snappy", "gzip", "none"]
+
+DEFAULT_LEVEL = 6
+
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def default_workers():
+    return min(8, os.cpu_count() or 1)
+
+
+def csv_bytes(df):
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+
+def parquet_bytes(df, codec="zstd"):
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False, compression=None if codec == "none" else codec)
+    return buffer.getvalue()
+
+
+def _pack_member(name, payload, compress_type, level, compress=True):
+    data = payload() if callable(payload) else payload
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.external_attr = 0o600 << 16
+    zinfo.compress_type = compress_type
+    if not compress:
+        return zinfo, data
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+
+    if compress_type == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+
+# ZipFile internals used to append already-compressed members; private, so checked before use
+_ZIPFILE_INTERNALS = ["_lock", "_seekable", "start_dir", "_writecheck", "_didModify", "fp", "filelist", "NameToInfo"]
+
+
+def _can_append_compressed(zip_file):
+    return all(hasattr(zip_file, name) for name in _ZIPFILE_INTERNALS)
+
+
+def _append_compressed(zip_file, zinfo, data):
+    # Same bookkeeping as ZipFile.mkdir, followed by the already-compressed payload
+    with zip_file._lock:
+        if zip_file._seekable:
+            zip_file.fp.seek(zip_file.start_dir)
+        zinfo.header_offset = zip_file.fp.tell()
+        zip_file._writecheck(zinfo)
+        zip_file._didModify = True
+        zip_file.filelist.append(zinfo)
+        zip_file.NameToInfo[zinfo.filename] = zinfo
+        zip_file.fp.write(zinfo.FileHeader())
+        zip_file.fp.write(data)
+        zip_file.start_dir = zip_file.fp.tell()
+
+
+def build_archive(members, codec="Deflate", level=DEFAULT_LEVEL, max_workers=None):
+    """Return the bytes of a ZIP archive containing `members`.
+
+    `members` is a list of `(name, payload)` or `(name, payload, precompressed)`
+    tuples, where `payload` is bytes, str, or a zero-argument callable returning
+    either. Precompressed members (e.g. Parquet) are always stored.
+    """
+    compress_type = ARCHIVE_CODECS[codec]
+    max_workers = max_workers or default_workers()
+
+    jobs = []
+    for member in members:
+        name, payload = member[0], member[1]
+        precompressed = len(member) > 2 and member[2]
+        jobs.append((name, payload, zipfile.ZIP_STORED if precompressed else compress_type))
+
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zip_file:
+        # Without the ZipFile internals, members are only serialized in parallel and compressed by writestr
+        compress = _can_append_compressed(zip_file)
+
+        def append(zinfo, data):
+            if compress:
+                _append_compressed(zip_file, zinfo, data)
+            else:
+                zip_file.writestr(zinfo, data, compresslevel=level)
+
+        if max_workers <= 1 or len(jobs) <= 1:
+            for name, payload, member_type in jobs:
+                append(*_pack_member(name, payload, member_type, level, compress))
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+                futures = [pool.submit(_pack_member, name, payload, member_type, level, compress)
+                           for name, payload, member_type in jobs]
+                for future in futures:
+                    append(*future.result())
+
+    return zip_buffer.getvalue()
@@ -0,0 +1,141 @@
+"""Periodic training checkpoints on local disk, and resume support.
+
+Each run writes `<run_id>.pkl` (weights, bias, normalization stats, optimizer
+state and cost history) plus a small `<run_id>.json` summary used to list
+resumable runs without unpickling them. Files are replaced atomically, so an
+interrupted write never corrupts the previous checkpoint.
+
+Checkpoints are kept in one directory per owner (a user or session), and a
+run's config records the fingerprint of its training data, so runs are only
+listed and resumed for their owner and the same data.
+"""
+import hashlib
+import json
+import os
+import pickle
+import time
+import uuid
+
+CHECKPOINT_DIR = os.environ.get(
+    "ML_STUDIO_CHECKPOINT_DIR",
+    os.path.join(os.path.expanduser("~"), ".ml_studio", "checkpoints")
+)
+
+DEFAULT_INTERVAL = 30
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _owner_dir(owner):
+    # Owner names (e-mails, session ids) are hashed into safe directory names
+    return os.path.join(CHECKPOINT_DIR, hashlib.sha256(owner.encode("utf-8")).hexdigest()[:32])
+
+
+def data_fingerprint(df=None, path=None):
+    """Identifies training data: a content hash of `df`, or the path, size and modification time of a file."""
+    if path is not None:
+        info = os.stat(path)
+        return f"{os.path.abspath(path)}:{info.st_size}:{info.st_mtime_ns}"
+    import pandas as pd
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def list_checkpoints(owner, **match):
+    """Summaries of `owner`'s saved runs whose config matches `match`, most recent first."""
+    directory = _owner_dir(owner)
+    if not os.path.isdir(directory):
+        return []
+
+    summaries = []
+    for name in os.listdir(directory):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if all(summary["config"].get(key) == value for key, value in match.items()):
+            summaries.append(summary)
+
+    return sorted(summaries, key=lambda summary: summary["updated"], reverse=True)
+
+
+def load_checkpoint(owner, run_id):
+    with open(os.path.join(_owner_dir(owner), f"{run_id}.pkl"), "rb") as f:
+        return pickle.load(f)
+
+
+def delete_checkpoint(owner, run_id):
+    for ext in (".pkl", ".json"):
+        try:
+            os.remove(os.path.join(_owner_dir(owner), f"{run_id}{ext}"))
+        except FileNotFoundError:
+            pass
+
+
+class Checkpointer:
+    """Saves the state of one training run at most every `interval` seconds.
+
+    `config` must be JSON-serializable and include `n_iter_total`, the number
+    of iterations the run should reach, and `data_fingerprint` (see
+    `data_fingerprint()`). Files are written for `owner`. `start_iteration` and `history_prefix`
+    carry over the progress of a resumed or warm-started run. `stats` holds the
+    `(X_mean, X_std)` normalization and is set once known.
+    """
+
+    def __init__(self, config, owner, interval=DEFAULT_INTERVAL, run_id=None, start_iteration=0,
+                 history_prefix=None):
+        self.config = config
+        self.owner = owner
+        self.interval = interval
+        self.run_id = run_id or f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.start_iteration = start_iteration
+        self.history_prefix = list(history_prefix or [])
+        self.stats = None
+        self.last_save = time.monotonic()
+
+    def maybe_save(self, iteration, weights, bias, optimizer, history):
+        if time.monotonic() - self.last_save >= self.interval:
+            self.save(iteration, weights, bias, optimizer, history)
+
+    def save(self, iteration, weights, bias, optimizer, history):
+        directory = _owner_dir(self.owner)
+        os.makedirs(directory, exist_ok=True)
+        full_history = self.history_prefix + list(history)
+        state = {
+            "run_id": self.run_id,
+            "config": self.config,
+            "iteration": self.start_iteration + iteration,
+            "weights": weights,
+            "bias": bias,
+            "X_mean": self.stats[0] if self.stats else None,
+            "X_std": self.stats[1] if self.stats else None,
+            "optimizer": self.config.get("optimizer"),
+            "optimizer_state": optimizer.state_dict(),
+            "history": full_history
+        }
+        summary = {
+            "run_id": self.run_id,
+            "config": self.config,
+            "iteration": state["iteration"],
+            "cost": full_history[-1] if full_history else None,
+            "updated": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+        base = os.path.join(directory, self.run_id)
+        _write_atomic(f"{base}.pkl", pickle.dumps(state))
+        _write_atomic(f"{base}.json", json.dumps(summary).encode("utf-8"))
+        self.last_save = time.monotonic()
+
+    def discard(self):
+        delete_checkpoint(self.owner, self.run_id)
@@ -0,0 +1,67 @@
+"""K-fold cross-validation with folds trained in parallel worker processes.
+
+The full feature matrix and target are published once in shared memory;
+each worker slices its fold, normalizes with the fold's training statistics
+and reports the metrics bundle of its held-out rows.
+"""
+from concurrent.futures import as_completed
+
+import numpy as np
+from sklearn.model_selection import KFold, StratifiedKFold
+
+from mlstudio.metrics import compute_metrics
+from mlstudio.parallel import SharedArrays, attach, process_pool
+from mlstudio.training import gradient_descent, normalize_inplace, predict
+
+
+def fold_indices(y, n_splits, stratified=False, seed=42):
+    splitter = StratifiedKFold if stratified else KFold
+    folds = splitter(n_splits=n_splits, shuffle=True, random_state=seed)
+    return list(folds.split(np.zeros(len(y)), np.ravel(y)))
+
+
+def _run_fold(spec, fold, train_idx, test_idx, model_type, params, seed):
+    data = attach(spec)
+    X_train, X_test = data["X"][train_idx], data["X"][test_idx]
+    y_train, y_test = data["y"][train_idx], data["y"][test_idx]
+    normalize_inplace(X_train, X_test)
+
+    np.random.seed(seed)
+    weights, bias, history = gradient_descent(X_train, y_train, model_type, **params)
+
+    return {
+        "fold": fold,
+        "metrics": compute_metrics(y_test, predict(X_test, weights, bias, model_type), model_type),
+        "final_cost": history[-1] if history else float("nan")
+    }
+
+
+def cross_validate(X, y, model_type, params, n_splits=5, stratified=False, max_workers=None, seed=42, on_result=None):
+    """Return per-fold results sorted by fold number.
+
+    `params` are keyword arguments for `training.gradient_descent`
+    (learning_rate, n_iter, optimizer, regularization, alpha).
+    `on_result(done, total, result)` is called in the parent as folds finish.
+    """
+    folds = fold_indices(y, n_splits, stratified, seed)
+    results = []
+    with SharedArrays(X=X, y=y) as shared:
+        with process_pool(max_workers) as pool:
+            futures = [pool.submit(_run_fold, shared.spec, fold, train_idx, test_idx, model_type, params, seed)
+                       for fold, (train_idx, test_idx) in enumerate(folds, start=1)]
+            for future in as_completed(futures):
+                results.append(future.result())
+                if on_result is not None:
+                    on_result(len(results), n_splits, results[-1])
+
+    return sorted(results, key=lambda result: result["fold"])
+
+
+def summarize(results):
+    """Mean and standard deviation of each scalar metric across folds."""
+    names = [name for name in results[0]["metrics"] if name != "confusion_matrix"]
+    rows = []
+    for name in names:
+        values = np.array([result["metrics"][name] for result in results], dtype=float)
+        rows.append({"Metric": name, "Mean": float(values.mean()), "Std": float(values.std())})
+    return rows
@@ -0,0 +1,294 @@
+"""Data-parallel training over TCP: one coordinator, many workers.
+
+Each worker holds a shard of the training rows. Every step the coordinator
+broadcasts the weights, the workers return the summed loss and gradient of
+their shard, and the coordinator reduces them and applies the optimizer step,
+which is equivalent to full-batch gradient descent on all rows.
+
+Workers are separate processes, on this machine or on other hosts, connected
+with `multiprocessing.connection` (length-prefixed pickles, HMAC-authenticated
+with a shared key). Start a remote worker with
+
+    ML_STUDIO_DIST_AUTHKEY=<key> python -m mlstudio.distributed --address <host>:<port> [--data shard.csv]
+
+With `--data`, the worker trains on its own local file instead of its share
+(every n-th row) of the file named by the coordinator. Only run workers on trusted networks:
+the authkey is the only protection.
+"""
+import argparse
+import os
+import secrets
+import socket
+import subprocess
+import sys
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+
+from mlstudio.streaming import DEFAULT_CHUNKSIZE, iter_arrays, streaming_stats
+from mlstudio.threads import thread_env, worker_threads
+from mlstudio.training import (init_weights, loss_and_gradient, make_optimizer, normalize_inplace, penalty,
+                               predict)
+
+AUTHKEY_ENV = "ML_STUDIO_DIST_AUTHKEY"
+DEFAULT_PORT = 5555
+ACCEPT_TIMEOUT = 120
+
+
+# === Worker ===
+
+class _Shard:
+    def __init__(self):
+        self.X = self.y = None
+        self.X_test = self.y_test = None
+
+    def load_file(self, path, features, target, chunksize, test_fraction, seed, dtype, rank, world, local_path):
+        """Every `world`-th row of each chunk, from `rank`, belongs to this worker, unless it has its own file."""
+        if local_path:
+            path, rank, world = local_path, 0, 1
+        chunks = [(X[rank::world], y[rank::world], is_test[rank::world])
+                  for X, y, is_test in iter_arrays(path, features, target, chunksize, test_fraction, seed, dtype)]
+        if not sum(len(X) for X, _, _ in chunks):
+            raise ValueError(f"Worker {rank} received no rows")
+        self.X = np.concatenate([X[~is_test] for X, _, is_test in chunks])
+        self.y = np.concatenate([y[~is_test] for _, y, is_test in chunks])
+        self.X_test = np.concatenate([X[is_test] for X, _, is_test in chunks])
+        self.y_test = np.concatenate([y[is_test] for _, y, is_test in chunks])
+        n, mean, std = streaming_stats([(self.X, self.y, np.zeros(len(self.X), dtype=bool))])
+        return n, mean, std
+
+    def handle(self, command, args):
+        if command == "arrays":
+            self.X, self.y = args
+            return len(self.X)
+        if command == "file":
+            return self.load_file(**args)
+        if command == "normalize":
+            normalize_inplace(self.X, self.X_test, stats=args)
+            return None
+        if command == "gradient":
+            weights, bias, model_type = args
+            return loss_and_gradient(self.X, self.y, weights, bias, model_type)
+        if command == "evaluate":
+            weights, bias, model_type = args
+            return self.y_test, predict(self.X_test, weights, bias, model_type)
+        raise ValueError(f"Unknown command {command!r}")
+
+
+def run_worker(address, authkey, local_path=None):
+    """Serve one coordinator until it closes the connection."""
+    shard = _Shard()
+    with Client(address, authkey=authkey) as conn:
+        while True:
+            try:
+                command, args = conn.recv()
+            except EOFError:
+                return
+            if command == "close":
+                return
+            if command == "file":
+                args = {**args, "local_path": local_path}
+            try:
+                conn.send(("ok", shard.handle(command, args)))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+# === Coordinator ===
+
+def merge_stats(parts):
+    """Combine per-worker `(n, mean, std)` into the statistics of all rows (Chan et al.)."""
+    n, mean, m2 = 0, None, None
+    for n_b, mean_b, std_b in parts:
+        m2_b = std_b ** 2 * n_b
+        if mean is None:
+            n, mean, m2 = n_b, mean_b, m2_b
+            continue
+        delta = mean_b - mean
+        total = n + n_b
+        mean = mean + delta * n_b / total
+        m2 = m2 + m2_b + delta ** 2 * n * n_b / total
+        n = total
+    return n, mean, np.sqrt(m2 / n)
+
+
+class Coordinator:
+    """Accepts `n_workers` connections and drives them through a training run.
+
+    Use as a context manager; `start_local_workers(k)` spawns `k` worker
+    processes on this machine for the rest to be remote.
+    """
+
+    def __init__(self, n_workers, host="127.0.0.1", port=0, authkey=None):
+        self.n_workers = n_workers
+        self.authkey = authkey or secrets.token_bytes(16)
+        self.listener = Listener((host, port), authkey=self.authkey)
+        self.address = self.listener.address
+        self.connections = []
+        self.processes = []
+        self.rows = 0
+        self._accept_thread = None
+        self._closing = False
+
+    def start_local_workers(self, count):
+        # Workers import mlstudio from the directory this package lives in
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        host, port = self.address
+        # Local workers share this job's thread budget
+        env = {**os.environ, **thread_env(worker_threads(count)), AUTHKEY_ENV: self.authkey.hex()}
+        for _ in range(count):
+            self.processes.append(subprocess.Popen(
+                [sys.executable, "-m", "mlstudio.distributed", "--address", f"127.0.0.1:{port}"],
+                cwd=root, env=env
+            ))
+
+    def accept(self, timeout=ACCEPT_TIMEOUT):
+        def accept_all():
+            while len(self.connections) < self.n_workers:
+                try:
+                    conn = self.listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    if self._closing:
+                        return
+                    continue  # a client that failed the handshake
+                if self._closing:
+                    conn.close()
+                    return
+                self.connections.append(conn)
+
+        self._accept_thread = threading.Thread(target=accept_all, daemon=True)
+        self._accept_thread.start()
+        self._accept_thread.join(timeout)
+        if len(self.connections) < self.n_workers:
+            raise TimeoutError(f"Only {len(self.connections)} of {self.n_workers} workers connected")
+
+    def _stop_accepting(self):
+        # A thread blocked in accept() keeps the port bound: wake it with a connection it will drop
+        self._closing = True
+        if self._accept_thread is None or not self._accept_thread.is_alive():
+            return
+        host, port = self.address
+        try:
+            socket.create_connection(("127.0.0.1" if host == "0.0.0.0" else host, port), timeout=1).close()
+        except OSError:
+            pass
+        self._accept_thread.join(5)
+
+    def _all(self, messages):
+        """Send one message per worker, then gather the replies in rank order."""
+        for conn, message in zip(self.connections, messages):
+            conn.send(message)
+        replies = []
+        for rank, conn in enumerate(self.connections):
+            status, value = conn.recv()
+            if status != "ok":
+                raise RuntimeError(f"Worker {rank}: {value}")
+            replies.append(value)
+        return replies
+
+    def _broadcast(self, command, args):
+        return self._all([(command, args)] * len(self.connections))
+
+    def scatter(self, X, y):
+        """Send each worker a contiguous shard of in-memory (already normalized) rows."""
+        bounds = np.linspace(0, len(X), len(self.connections) + 1).astype(int)
+        self.rows = sum(self._all([("arrays", (X[bounds[k]:bounds[k + 1]], y[bounds[k]:bounds[k + 1]]))
+                                   for k in range(len(self.connections))]))
+        return self.rows
+
+    def load_file(self, path, features, target, chunksize=DEFAULT_CHUNKSIZE, test_fraction=0.2, seed=42,
+                  dtype=np.float64, stats=None):
+        """Have the workers load their rows of `path` and standardize them; returns `(X_mean, X_std)`.
+
+        `stats` reuses the normalization of an existing model.
+        """
+        world = len(self.connections)
+        parts = self._all([("file", dict(path=path, features=features, target=target, chunksize=chunksize,
+                                         test_fraction=test_fraction, seed=seed, dtype=dtype, rank=rank,
+                                         world=world))
+                           for rank in range(world)])
+        self.rows = sum(part[0] for part in parts)
+        if stats is None:
+            _, X_mean, X_std = merge_stats(parts)
+        else:
+            X_mean, X_std = stats
+        X_mean, X_std = np.asarray(X_mean, dtype=dtype), np.asarray(X_std, dtype=dtype)
+        self._broadcast("normalize", (X_mean, X_std))
+        return X_mean, X_std
+
+    def train(self, model_type, learning_rate, n_iter, n_features, weights=None, bias=0.0,
+              optimizer="Gradient Descent", regularization="None", alpha=0.0, callback=None, dtype=np.float64):
+        """Full-batch training over all shards; returns `(weights, bias, history)`.
+
+        Same contract as `training.gradient_descent`.
+        """
+        if weights is None:
+            weights = init_weights(n_features, dtype)
+        optimizer = make_optimizer(optimizer, learning_rate)
+        m = self.rows
+        history = []
+
+        for i in range(n_iter):
+            replies = self._broadcast("gradient", (weights, bias, model_type))
+            loss = sum(reply[0] for reply in replies)
+            dw = np.sum([reply[1] for reply in replies], axis=0)
+            db = sum(reply[2] for reply in replies)
+            reg_cost, reg_grad = penalty(weights, regularization, alpha)
+            bias = optimizer.step(weights, bias, dw / m + reg_grad, db / m)
+            history.append(float(loss / m + reg_cost))
+
+            if callback is not None and callback(i, history[-1]):
+                break
+
+        return weights, bias, history
+
+    def evaluate(self, weights, bias, model_type):
+        """Targets and predictions of the test rows held by the workers (file mode)."""
+        replies = self._broadcast("evaluate", (weights, bias, model_type))
+        return np.concatenate([r[0] for r in replies]), np.concatenate([r[1] for r in replies])
+
+    def close(self):
+        """Release the workers and the port; local workers that never connected are terminated."""
+        connected = len(self.connections) == self.n_workers
+        self._stop_accepting()
+        for conn in self.connections:
+            try:
+                conn.send(("close", None))
+                conn.close()
+            except OSError:
+                pass
+        self.connections = []
+        self.listener.close()
+        for process in self.processes:
+            if not connected:
+                process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run an ML Studio distributed training worker.")
+    parser.add_argument("--address", required=True, help="coordinator host:port")
+    parser.add_argument("--data", help="train on this local CSV/Parquet file instead of a share of the coordinator's")
+    args = parser.parse_args(argv)
+
+    authkey = os.environ.get(AUTHKEY_ENV)
+    if not authkey:
+        parser.error(f"set {AUTHKEY_ENV} to the key shown by the coordinator")
+    host, port = args.address.rsplit(":", 1)
+    run_worker((host, int(port)), bytes.fromhex(authkey), args.data)
+
+
+if __name__ == "__main__":
+    main()
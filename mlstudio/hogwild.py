@@ -0,0 +1,104 @@
+"""Asynchronous parallel SGD (Hogwild!) on worker processes.
+
+The training rows and the parameter vector live in shared memory. Each worker
+runs mini-batch SGD over its own shard of rows and writes its updates straight
+into the shared weights without any locking. The rows are standardized, so
+gradients are dense and every batch updates the whole weight vector: updates
+that race with another worker's are occasionally lost, which slows
+convergence slightly.
+
+Workers record the mean loss of the batches they saw during each epoch. The
+parent polls these records to report progress, and can ask the workers to stop.
+"""
+from concurrent.futures import wait
+
+import numpy as np
+
+from mlstudio.parallel import SharedArrays, attach, process_pool
+from mlstudio.training import init_weights, loss_and_gradient, penalty
+
+DEFAULT_BATCH_SIZE = 32
+POLL_SECONDS = 0.05
+
+
+def _worker(spec, worker, rows, model_type, learning_rate, n_epochs, batch_size, regularization, alpha, seed):
+    data = attach(spec, writeable=True)
+    X, y = data["X"], data["y"]
+    params, costs, progress, stop = data["params"], data["costs"], data["progress"], data["stop"]
+    # Views into the shared parameter vector; every write is immediately visible to the other workers
+    weights, bias = params[:-1].reshape(-1, 1), params[-1:]
+    rng = np.random.default_rng(seed + worker)
+    rows = np.array(rows)
+
+    for epoch in range(n_epochs):
+        rng.shuffle(rows)
+        loss, seen = 0.0, 0
+        for start in range(0, len(rows), batch_size):
+            if stop[0]:
+                return
+            batch = rows[start:start + batch_size]
+            batch_loss, dw, db = loss_and_gradient(X[batch], y[batch], weights, bias[0], model_type)
+            dw /= len(batch)
+            dw += penalty(weights, regularization, alpha)[1]
+
+            # Lock-free update
+            weights -= learning_rate * dw
+            bias[0] -= learning_rate * db / len(batch)
+
+            loss += batch_loss
+            seen += len(batch)
+
+        costs[worker, epoch] = loss / max(seen, 1)
+        progress[worker] = epoch + 1
+
+
+def train_hogwild(X, y, model_type, learning_rate, n_epochs, n_workers=2, batch_size=DEFAULT_BATCH_SIZE,
+                  regularization="None", alpha=0.0, weights=None, bias=0.0, seed=42, callback=None):
+    """Train with `n_workers` processes; returns `(weights, bias, history)`.
+
+    `history` has one cost per epoch: the mean batch loss of all workers plus
+    the weight penalty at the end of the epoch. `callback(epoch, cost)` is
+    called in the parent as every worker finishes an epoch, and training stops
+    when it returns True.
+    """
+    n_features = X.shape[1]
+    if weights is None:
+        weights = init_weights(n_features, np.float64)
+    params = np.append(np.ravel(weights).astype(np.float64), bias)
+    shards = np.array_split(np.random.default_rng(seed).permutation(X.shape[0]), n_workers)
+
+    history = []
+    with SharedArrays(
+        X=X, y=y, params=params,
+        costs=np.zeros((n_workers, n_epochs)),
+        progress=np.zeros(n_workers, dtype=np.int64),
+        stop=np.zeros(1, dtype=np.int8)
+    ) as shared:
+        state = shared.arrays(writeable=True)
+        with process_pool(n_workers) as pool:
+            futures = [
+                pool.submit(_worker, shared.spec, worker, shard, model_type, learning_rate,
+                            n_epochs, batch_size, regularization, alpha, seed)
+                for worker, shard in enumerate(shards)
+            ]
+            try:
+                while True:
+                    done, _ = wait(futures, timeout=POLL_SECONDS)
+                    completed = int(state["progress"].min())
+                    for epoch in range(len(history), completed):
+                        reg_cost = penalty(state["params"][:-1], regularization, alpha)[0]
+                        history.append(float(state["costs"][:, epoch].mean() + reg_cost))
+                        if callback is not None and callback(epoch, history[-1]):
+                            state["stop"][0] = 1
+                    if len(done) == len(futures):
+                        break
+            finally:
+                # Also when the callback raises (Stop button, rerun): the pool waits for its workers on exit
+                state["stop"][0] = 1
+            for future in futures:
+                future.result()
+
+        params = state["params"].copy()
+        del state
+
+    return params[:-1].reshape(-1, 1).astype(X.dtype), float(params[-1]), history
@@ -0,0 +1,156 @@
+"""Memory accounting of what each session keeps in `st.session_state`.
+
+Every script run measures the session's stored objects, evicts derived
+artifacts (test arrays, comparison curves, leaderboards) least recently used
+first when the session is over its budget, and reports its total to a
+process-wide registry so the server's overall usage can be displayed.
+"""
+import os
+import sys
+import threading
+import time
+
+MB = 1024 ** 2
+BUDGET_MB = float(os.environ.get("ML_STUDIO_SESSION_MEMORY_MB", 2048))
+
+# Artifacts that can be recomputed (by training again, or on the next page visit), evicted together as groups
+EVICTABLE = [
+    ("X_test",),
+    ("y_test", "y_pred"),
+    ("lr_comparison",),
+    ("sweep_leaderboard",),
+    ("cv_results",),
+    ("view_cache",),
+]
+
+# Sessions that have not reported for this long are dropped from the server view
+SESSION_TTL = 3600
+
+_LAST_USED = "_memory_last_used"
+_SIZES = "_memory_sizes"
+
+_registry = {}
+_registry_lock = threading.Lock()
+_shared = {}  # name -> function returning (objects, bytes) of a server-wide cache
+
+
+def sizeof(obj):
+    """Approximate bytes held by `obj`, following containers."""
+    # Looked up rather than imported: pages that never load pandas/NumPy cannot store their objects
+    pd, np = sys.modules.get("pandas"), sys.modules.get("numpy")
+    if pd is not None and isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True, index=True)
+        return int(usage.sum() if isinstance(obj, pd.DataFrame) else usage)
+    if np is not None and isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(sizeof(key) + sizeof(value) for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(sizeof(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def _signature(obj):
+    # What must be unchanged for a cached size to still hold. Containers are
+    # filled in place (the pages' view caches), so they are always measured again.
+    pd, np = sys.modules.get("pandas"), sys.modules.get("numpy")
+    if isinstance(obj, (dict, list, set)):
+        return None
+    if pd is not None and isinstance(obj, pd.DataFrame):
+        # Columns converted in place (e.g. bool to int) change the dtypes
+        return id(obj), obj.shape, tuple(obj.columns), tuple(map(str, obj.dtypes))
+    if pd is not None and isinstance(obj, pd.Series):
+        return id(obj), obj.shape, str(obj.dtype)
+    if np is not None and isinstance(obj, np.ndarray):
+        return id(obj), obj.shape, str(obj.dtype)
+    return (id(obj),)
+
+
+def session_usage(state):
+    """Bytes per session key, largest first.
+
+    Sizes of DataFrames and arrays are cached while their identity, shape and
+    dtypes are unchanged, so they are not measured again on every rerun.
+    """
+    cache = state.get(_SIZES, {})
+    usage, new_cache = {}, {}
+    for key in list(state.keys()):
+        if key.startswith("_memory"):
+            continue
+        obj = state[key]
+        signature = _signature(obj)
+        cached = cache.get(key)
+        if signature is not None and cached is not None and cached[0] == signature:
+            size = cached[1]
+        else:
+            size = sizeof(obj)
+        new_cache[key] = (signature, size)
+        usage[key] = size
+    state[_SIZES] = new_cache
+    return dict(sorted(usage.items(), key=lambda item: -item[1]))
+
+
+def touch(state, keys):
+    """Mark `keys` as used now, for LRU eviction."""
+    last_used = state.setdefault(_LAST_USED, {})
+    now = time.time()
+    for key in keys:
+        last_used[key] = now
+
+
+def enforce_budget(state, usage, budget_bytes):
+    """Evict derived artifacts, least recently used first, until under budget.
+
+    Returns the evicted keys; `usage` is updated in place.
+    """
+    last_used = state.setdefault(_LAST_USED, {})
+    now = time.time()
+    for key in usage:
+        last_used.setdefault(key, now)
+
+    present = [group for group in EVICTABLE if any(key in usage for key in group)]
+    present.sort(key=lambda group: max(last_used.get(key, now) for key in group))
+
+    evicted = []
+    total = sum(usage.values())
+    for group in present:
+        if total <= budget_bytes:
+            break
+        for key in group:
+            if key in usage:
+                total -= usage.pop(key)
+                del state[key]
+                evicted.append(key)
+    return evicted
+
+
+def report(session_id, usage):
+    with _registry_lock:
+        _registry[session_id] = {"bytes": sum(usage.values()), "keys": len(usage), "updated": time.time()}
+
+
+def register_shared(name, measure):
+    """Count a cache shared by all sessions in the server view; `measure()` returns `(objects, bytes)`."""
+    _shared[name] = measure
+
+
+def server_usage():
+    """Rows describing every session seen recently, largest first, then the shared caches."""
+    now = time.time()
+    with _registry_lock:
+        for session_id in [sid for sid, entry in _registry.items() if now - entry["updated"] > SESSION_TTL]:
+            del _registry[session_id]
+        entries = list(_registry.items())
+
+    return [
+        {
+            "Session": session_id[:8],
+            "Memory (MB)": round(entry["bytes"] / MB, 1),
+            "Objects": entry["keys"],
+            "Last active (s ago)": int(now - entry["updated"])
+        }
+        for session_id, entry in sorted(entries, key=lambda item: -item[1]["bytes"])
+    ] + [
+        {"Session": f"({name})", "Memory (MB)": round(nbytes / MB, 1), "Objects": objects, "Last active (s ago)": None}
+        for name, (objects, nbytes) in ((name, measure()) for name, measure in list(_shared.items()))
+    ]
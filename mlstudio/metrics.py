@@ -0,0 +1,100 @@
+"""Evaluation metrics computed once per training run.
+
+The bundle is stored with the trained model and read by the Model, Results
+and Export pages instead of re-scoring the test set on every page view.
+Regression errors all come from one residual array and classification
+metrics from one `bincount` of (actual, predicted) label pairs.
+"""
+import numpy as np
+
+# Integer labels below this bound are counted directly, without sorting
+_MAX_DIRECT_LABEL = 4096
+
+
+def regression_metrics(y_true, y_pred):
+    y_true = np.asarray(y_true, dtype=float).ravel()
+    residuals = y_true - np.asarray(y_pred, dtype=float).ravel()
+    n = residuals.size
+
+    ss_res = float(residuals @ residuals)
+    mae = float(np.abs(residuals, out=residuals).sum()) / n
+    residuals = np.subtract(y_true, y_true.mean(), out=residuals)
+    ss_tot = float(residuals @ residuals)
+
+    # Same convention as sklearn's r2_score for a constant target
+    if ss_tot == 0:
+        r2 = 1.0 if ss_res == 0 else 0.0
+    else:
+        r2 = 1 - ss_res / ss_tot
+
+    mse = ss_res / n
+    return {
+        "mse": mse,
+        "rmse": float(np.sqrt(mse)),
+        "r2": r2,
+        "mae": mae
+    }
+
+
+def confusion_counts(y_true, y_pred):
+    """Return `(labels, matrix)` with rows as actual and columns as predicted labels."""
+    y_true = np.asarray(y_true).ravel()
+    y_pred = np.asarray(y_pred).ravel()
+    true_codes = y_true.astype(np.int64)
+    pred_codes = y_pred.astype(np.int64)
+
+    direct = (
+        true_codes.size > 0
+        and (true_codes == y_true).all() and (pred_codes == y_pred).all()
+        and min(true_codes.min(), pred_codes.min()) >= 0
+        and max(true_codes.max(), pred_codes.max()) < _MAX_DIRECT_LABEL
+    )
+    if direct:
+        k = int(max(true_codes.max(), pred_codes.max())) + 1
+        labels = np.arange(k)
+    else:
+        labels, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+        true_codes, pred_codes = codes[:y_true.size], codes[y_true.size:]
+        k = labels.size
+
+    counts = np.bincount(true_codes * k + pred_codes, minlength=k * k).reshape(k, k)
+    if direct:
+        present = (counts.sum(axis=0) + counts.sum(axis=1)) > 0
+        labels, counts = labels[present], counts[np.ix_(present, present)]
+    return labels, counts
+
+
+def _ratio(num, den):
+    return num / den if den else 0.0
+
+
+def classification_metrics(y_true, y_pred):
+    """Binary metrics for the positive class 1, macro-averaged for more than two labels."""
+    labels, cm = confusion_counts(y_true, y_pred)
+    n = cm.sum()
+    tp = np.diag(cm).astype(float)
+    predicted = cm.sum(axis=0)
+    actual = cm.sum(axis=1)
+
+    if set(labels.tolist()) <= {0, 1}:
+        pos = np.flatnonzero(labels == 1)
+        tp, predicted, actual = (tp[pos], predicted[pos], actual[pos]) if pos.size else ([0.0], [0], [0])
+
+    precision = [_ratio(t, p) for t, p in zip(tp, predicted)]
+    recall = [_ratio(t, a) for t, a in zip(tp, actual)]
+    f1 = [_ratio(2 * p * r, p + r) for p, r in zip(precision, recall)]
+
+    return {
+        "accuracy": float(_ratio(np.trace(cm), n)),
+        "precision": float(np.mean(precision)),
+        "recall": float(np.mean(recall)),
+        "f1_score": float(np.mean(f1)),
+        "confusion_matrix": cm.tolist()
+    }
+
+
+def compute_metrics(y_true, y_pred, model_type):
+    """Return a JSON-serializable dict of metrics for `model_type`."""
+    if model_type == "Regression":
+        return regression_metrics(y_true, y_pred)
+    return classification_metrics(y_true, y_pred)
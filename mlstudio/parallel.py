@@ -0,0 +1,81 @@
+"""Shared-memory NumPy arrays for worker process pools.
+
+The parent copies each array once into a shared memory block; workers attach
+by name and read zero-copy views instead of receiving pickled copies.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+from mlstudio.threads import limit_worker_threads, worker_threads
+
+# Blocks attached in this (worker) process, kept open for the pool's lifetime
+_attached = {}
+
+
+def process_context():
+    # Streamlit runs scripts on threads of a live server, which must not be forked
+    return get_context("spawn")
+
+
+def process_pool(max_workers=None):
+    """Spawned worker pool whose processes share the current job's thread budget."""
+    max_workers = max_workers or os.cpu_count() or 1
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=process_context(),
+                               initializer=limit_worker_threads, initargs=(worker_threads(max_workers),))
+
+
+class SharedArrays:
+    """Context manager publishing `arrays` (name -> ndarray) in shared memory.
+
+    `spec` is a small picklable description that workers pass to `attach`.
+    """
+
+    def __init__(self, **arrays):
+        self.blocks = []
+        self.spec = {}
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.blocks.append(block)
+                np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+                self.spec[name] = (block.name, array.shape, array.dtype.str)
+        except BaseException:
+            self.close()
+            raise
+
+    def arrays(self, writeable=False):
+        """Views of the published arrays for the parent process; drop them before closing."""
+        arrays = {}
+        for block, (name, (_, shape, dtype)) in zip(self.blocks, self.spec.items()):
+            array = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+            array.flags.writeable = writeable
+            arrays[name] = array
+        return arrays
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+
+def attach(spec, writeable=False):
+    """Return name -> ndarray views of the arrays described by `spec`."""
+    arrays = {}
+    for name, (block_name, shape, dtype) in spec.items():
+        if block_name not in _attached:
+            _attached[block_name] = shared_memory.SharedMemory(name=block_name)
+        array = np.ndarray(shape, np.dtype(dtype), buffer=_attached[block_name].buf)
+        array.flags.writeable = writeable
+        arrays[name] = array
+    return arrays
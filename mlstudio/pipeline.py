@@ -0,0 +1,419 @@
+"""Headless load -> preprocess -> train -> evaluate -> export pipeline.
+
+Runs the steps of the Data, Preprocessing, Model (single run) and Export
+pages from a config, without Streamlit, and writes the same ZIP archive as
+the Export page. Several configs can run at once on worker processes:
+
+    python -m mlstudio.pipeline retrain.json [more.json ...] --output-dir exports --jobs 4
+
+A config is a JSON object with the keys of `DEFAULTS`; `data` and `target`
+are required. For example:
+
+    {"data": "houses.csv", "target": "price",
+     "impute": {"age": "median", "city": "mode", "rooms": {"value": 3}},
+     "encode": ["city"], "scale": "standard",
+     "model_type": "Regression", "learning_rate": 0.05, "n_iter": 2000}
+"""
+import argparse
+import json
+import os
+import pickle
+from concurrent.futures import as_completed
+
+import numpy as np
+import pandas as pd
+
+from mlstudio import archive
+from mlstudio.metrics import compute_metrics
+from mlstudio.parallel import process_pool
+from mlstudio.streaming import read_table
+from mlstudio.timing import StageTimer
+from mlstudio.training import gradient_descent, make_optimizer, normalize_inplace, predict
+
+IMPUTATIONS = ["drop", "mean", "median", "mode", "value"]
+SCALERS = ["standard", "minmax"]
+EXPORT_OPTIONS = ["raw_data", "cleaned_data", "model", "results", "report"]
+
+DEFAULTS = {
+    "data": None,                 # CSV or Parquet file
+    "target": None,
+    "features": None,             # default: every other numeric column after preprocessing
+    "impute": {},                 # column -> "drop", "mean", "median", "mode" or {"value": fill value}
+    "encode": [],                 # columns to one-hot encode (first level dropped)
+    "scale": None,                # "standard" or "minmax"
+    "scale_columns": None,        # default: the features
+    "model_type": "Regression",
+    "learning_rate": 0.01,
+    "n_iter": 1000,
+    "test_size": 20,              # percent of the rows
+    "optimizer": "Gradient Descent",
+    "regularization": "None",
+    "alpha": 0.0,
+    "precision": "float64",
+    "seed": 42,                   # weight initialization; the split always uses 42, as on the Model page
+    "export": EXPORT_OPTIONS,
+    "data_format": "csv",         # "csv" or "parquet" for the data files of the archive
+    "parquet_codec": "zstd",
+    "compression": "Deflate",
+    "level": archive.DEFAULT_LEVEL,
+    "output": None,               # archive path; default: <output dir>/<config name>.zip
+}
+
+
+# === Preprocessing ===
+
+def fill_missing(df, column, strategy, value=None):
+    """Apply one imputation `strategy` to `column` of `df` in place; returns False when it does not apply.
+
+    Mean and median only apply to numeric columns. A text fill `value` (as
+    typed on the Preprocessing page) is converted for a numeric column, and
+    raises ValueError when it is not a number.
+    """
+    if strategy not in IMPUTATIONS:
+        raise ValueError(f"Unknown imputation {strategy!r} for column {column!r}")
+    if strategy == "drop":
+        df.drop(columns=column, inplace=True)
+    elif strategy in ("mean", "median"):
+        if not pd.api.types.is_numeric_dtype(df[column]):
+            return False
+        df[column] = df[column].fillna(df[column].mean() if strategy == "mean" else df[column].median())
+    elif strategy == "mode":
+        mode = df[column].mode()
+        df[column] = df[column].fillna(mode.iloc[0] if not mode.empty else df[column].iloc[0])
+    else:
+        if isinstance(value, str) and pd.api.types.is_numeric_dtype(df[column]):
+            try:
+                value = float(value)
+            except ValueError:
+                # Filling as text would turn the column into text and drop it from the features
+                raise ValueError(f"Column {column!r} is numeric: fill value {value!r} is not a number") from None
+        df[column] = df[column].fillna(value)
+    return True
+
+
+def one_hot_encode(df, columns):
+    """One-hot encode `columns` (first level dropped), with 0/1 integer indicators."""
+    df = pd.get_dummies(df, columns=columns, drop_first=True)
+    for col in df.columns:
+        if df[col].dtype == 'bool':
+            df[col] = df[col].astype(int)
+    return df
+
+
+def scale(df, columns, method):
+    """Standardize ("standard") or min-max scale ("minmax") `columns` of `df` in place."""
+    from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+    if method not in SCALERS:
+        raise ValueError(f"Unknown scaling {method!r}")
+    scaler = StandardScaler() if method == "standard" else MinMaxScaler()
+    df[columns] = scaler.fit_transform(df[columns])
+
+
+def preprocess(df, impute=None, encode=None):
+    """Imputation then encoding, as on the Preprocessing page, on a copy of `df`.
+
+    `impute` maps columns to a strategy of `IMPUTATIONS`, or to `{"value": fill value}`.
+    """
+    df = df.copy()
+    for column, strategy in (impute or {}).items():
+        if isinstance(strategy, dict):
+            fill_missing(df, column, "value", strategy["value"])
+        else:
+            fill_missing(df, column, strategy)
+    if encode:
+        df = one_hot_encode(df, encode)
+    return df
+
+
+# === Training ===
+
+def train(df, features, target, model_type, learning_rate, n_iter, test_size=20, optimizer="Gradient Descent",
+          regularization="None", alpha=0.0, dtype=np.float64, timer=None):
+    """A single run as on the Model page.
+
+    Returns the session objects the page stores: `trained_model`,
+    `model_config`, `history`, `X_test`, `y_test` and `y_pred`.
+    """
+    timer = timer or StageTimer()
+    with timer.stage("Model / data preparation"):
+        X = df[features].to_numpy(dtype=dtype)
+        y = df[target].to_numpy(dtype=dtype).reshape(-1, 1)
+
+    with timer.stage("Model / train-test split"):
+        from sklearn.model_selection import train_test_split
+        train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=test_size/100, random_state=42)
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
+    del X, y
+
+    with timer.stage("Model / normalization"):
+        X_mean, X_std = normalize_inplace(X_train, X_test)
+
+    optimizer_obj = make_optimizer(optimizer, learning_rate)
+    weights, bias, history = timer.call(
+        "Model / gradient loop", gradient_descent,
+        X_train, y_train, model_type, learning_rate, n_iter,
+        optimizer=optimizer_obj,
+        regularization=regularization,
+        alpha=alpha
+    )
+
+    with timer.stage("Model / evaluation"):
+        y_pred = predict(X_test, weights, bias, model_type)
+    with timer.stage("Model / metrics"):
+        metrics = compute_metrics(y_test, y_pred, model_type)
+
+    return {
+        "trained_model": {
+            "weights": weights,
+            "bias": bias,
+            "X_mean": X_mean,
+            "X_std": X_std,
+            "metrics": metrics,
+            "features": features,
+            "target": target,
+            "type": model_type,
+            "optimizer": optimizer,
+            "optimizer_state": optimizer_obj.state_dict()
+        },
+        "model_config": {
+            "type": model_type,
+            "features": features,
+            "target": target,
+            "learning_rate": learning_rate,
+            "n_iter": n_iter,
+            "optimizer": optimizer,
+            "regularization": regularization,
+            "alpha": alpha,
+            "test_size": test_size,
+            "data_source": "Preprocessed dataset",
+            "precision": np.dtype(dtype).name,
+            "warm_start": "Random initialization"
+        },
+        "history": history,
+        "X_test": X_test,
+        "y_test": y_test,
+        "y_pred": y_pred
+    }
+
+
+# === Export ===
+
+def report_text(df=None, df_cleaned=None, trained_model=None, model_config=None, cv_results=None,
+                include_results=True, timer=None):
+    """The analysis report of the Export archive."""
+    report = "=== ML VISUAL STUDIO ANALYSIS REPORT ===\n\n"
+
+    if df is not None:
+        report += "RAW DATA:\n"
+        report += f"- Rows: {df.shape[0]:,}\n"
+        report += f"- Columns: {df.shape[1]}\n"
+        report += f"- Missing values: {df.isnull().sum().sum()}\n\n"
+
+    if df_cleaned is not None:
+        report += "PREPROCESSED DATA:\n"
+        report += f"- Rows: {df_cleaned.shape[0]:,}\n"
+        report += f"- Columns: {df_cleaned.shape[1]}\n"
+        report += f"- Missing values: {df_cleaned.isnull().sum().sum()}\n\n"
+
+    if trained_model is not None:
+        config = model_config
+        report += "MODEL:\n"
+        report += f"- Type: {config['type']}\n"
+        report += f"- Target: {config['target']}\n"
+        report += f"- Features: {', '.join(config['features'])}\n"
+        report += f"- Learning rate: {config.get('learning_rate', 'N/A')}\n"
+        report += f"- Iterations: {config.get('n_iter', 'N/A')}\n"
+        report += f"- Optimizer: {config.get('optimizer', 'N/A')}\n"
+        report += f"- Regularization: {config.get('regularization', 'N/A')} (alpha={config.get('alpha', 0.0)})\n\n"
+
+        if include_results:
+            metrics = trained_model["metrics"]
+            report += "PERFORMANCE:\n"
+            if config["type"] == "Regression":
+                report += f"- MSE: {metrics['mse']:.6f}\n"
+                report += f"- RMSE: {metrics['rmse']:.6f}\n"
+                report += f"- R²: {metrics['r2']:.6f}\n"
+            else:
+                report += f"- Accuracy: {metrics['accuracy']:.4f}\n"
+                report += f"- Precision: {metrics['precision']:.4f}\n"
+                report += f"- Recall: {metrics['recall']:.4f}\n"
+                report += f"- F1-Score: {metrics['f1_score']:.4f}\n"
+
+            if cv_results is not None:
+                report += f"\nCROSS-VALIDATION ({cv_results['n_folds']} folds):\n"
+                for row in cv_results["summary"]:
+                    report += f"- {row['Metric']}: {row['Mean']:.6f} ± {row['Std']:.6f}\n"
+
+    if timer is not None:
+        if timer.stages:
+            report += "\nPERFORMANCE TIMINGS (last run of each stage):\n"
+            for row in timer.rows():
+                report += f"- {row['Stage']}: {row['Last (s)']:.4f}s ({row['Calls']} calls, {row['Total (s)']:.4f}s total)\n"
+        for stage, stats_text in timer.profiles.items():
+            report += f"\nPROFILE ({stage}):\n{stats_text}"
+
+    report += f"\nReport generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    report += "Generated by ML Visual Studio\n"
+    return report
+
+
+def export_members(options, df=None, df_cleaned=None, trained_model=None, model_config=None, history=None,
+                   cv_results=None, parquet_codec=None, timer=None):
+    """Members of the Export archive for the selected `options` (see `EXPORT_OPTIONS`).
+
+    Data files are Parquet with `parquet_codec` when it is given, CSV otherwise.
+    """
+    members = []
+    data_ext = "parquet" if parquet_codec else "csv"
+
+    def data_member(name, data):
+        if parquet_codec:
+            members.append((f"{name}.{data_ext}", lambda: archive.parquet_bytes(data, parquet_codec), True))
+        else:
+            members.append((f"{name}.{data_ext}", lambda: archive.csv_bytes(data), False))
+
+    if "raw_data" in options and df is not None:
+        data_member("raw_data", df)
+
+    if "cleaned_data" in options and df_cleaned is not None:
+        data_member("preprocessed_data", df_cleaned)
+
+    if "model" in options and trained_model is not None:
+        members.append(("trained_model.pkl", pickle.dumps(trained_model)))
+
+    if "results" in options and trained_model is not None:
+        results = {
+            "model_config": model_config,
+            "training_history": history,
+            "metrics": trained_model["metrics"]
+        }
+        if cv_results is not None:
+            results["cross_validation"] = cv_results
+        members.append(("results_metrics.json", json.dumps(results, indent=2, ensure_ascii=False)))
+
+    if "report" in options:
+        members.append(("analysis_report.txt", report_text(df, df_cleaned, trained_model, model_config, cv_results,
+                                                           "results" in options, timer)))
+    return members
+
+
+# === Runner ===
+
+def load_config(path):
+    """Config from a JSON file; relative `data` and `output` paths are taken from the file's directory."""
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    unknown = set(config) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"{path}: unknown config keys {', '.join(sorted(unknown))}")
+    for key in ("data", "output"):
+        if config.get(key):
+            config[key] = os.path.join(os.path.dirname(os.path.abspath(path)), config[key])
+    return config
+
+
+def run(config, output=None, max_workers=1):
+    """Run the whole pipeline for `config`; returns a summary with the metrics and stage timings.
+
+    The archive is written to `output` (or the config's `output`) when one is given.
+    """
+    config = {**DEFAULTS, **config}
+    for key in ("data", "target"):
+        if not config[key]:
+            raise ValueError(f"Config is missing {key!r}")
+    timer = StageTimer()
+    np.random.seed(config["seed"])
+
+    with timer.stage("Data / file parsing"):
+        df = read_table(config["data"])
+
+    with timer.stage("Preprocessing"):
+        features = config["features"]
+        df_cleaned = preprocess(df, config["impute"], config["encode"])
+        if features is None:
+            features = [col for col in df_cleaned.select_dtypes(include=["number", "bool"]).columns
+                        if col != config["target"]]
+        if config["scale"]:
+            scale(df_cleaned, config["scale_columns"] or features, config["scale"])
+
+    model = train(
+        df_cleaned, features, config["target"], config["model_type"], config["learning_rate"], config["n_iter"],
+        test_size=config["test_size"],
+        optimizer=config["optimizer"],
+        regularization=config["regularization"],
+        alpha=config["alpha"],
+        dtype=np.float32 if config["precision"] == "float32" else np.float64,
+        timer=timer
+    )
+
+    output = output or config["output"]
+    if output:
+        members = export_members(
+            config["export"], df, df_cleaned, model["trained_model"], model["model_config"], model["history"],
+            parquet_codec=config["parquet_codec"] if config["data_format"] == "parquet" else None,
+            timer=timer
+        )
+        with timer.stage("Export / archive"):
+            data = archive.build_archive(members, codec=config["compression"], level=config["level"],
+                                         max_workers=max_workers)
+        with open(output, "wb") as f:
+            f.write(data)
+
+    return {
+        "output": output,
+        "metrics": {k: v for k, v in model["trained_model"]["metrics"].items() if k != "confusion_matrix"},
+        "final_cost": model["history"][-1],
+        "timings": timer.rows()
+    }
+
+
+def _run_file(path, output_dir):
+    config = load_config(path)
+    output = None
+    if output_dir:
+        output = os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ".zip")
+    return run(config, output=output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the ML Visual Studio pipeline without the web UI.")
+    parser.add_argument("configs", nargs="+", help="JSON config files")
+    parser.add_argument("--output-dir", help="write <config name>.zip archives here (overrides `output`)")
+    parser.add_argument("--jobs", type=int, default=1, help="configs run in parallel on this many processes")
+    args = parser.parse_args(argv)
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    failed = 0
+
+    def show(path, summary=None, error=None):
+        if error is not None:
+            print(f"{path}: FAILED {error}", flush=True)
+            return
+        metrics = ", ".join(f"{k}={v:.4f}" for k, v in summary["metrics"].items())
+        print(f"{path}: {metrics}" + (f" -> {summary['output']}" if summary["output"] else ""), flush=True)
+
+    if args.jobs > 1 and len(args.configs) > 1:
+        with process_pool(min(args.jobs, len(args.configs))) as pool:
+            futures = {pool.submit(_run_file, path, args.output_dir): path for path in args.configs}
+            for future in as_completed(futures):
+                try:
+                    show(futures[future], future.result())
+                except Exception as e:
+                    failed += 1
+                    show(futures[future], error=f"{type(e).__name__}: {e}")
+    else:
+        for path in args.configs:
+            try:
+                show(path, _run_file(path, args.output_dir))
+            except Exception as e:
+                failed += 1
+                show(path, error=f"{type(e).__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
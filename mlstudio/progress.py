@@ -0,0 +1,100 @@
+"""Time-throttled progress reporting for training loops.
+
+Training callbacks fire once per iteration, which for small models is far more
+often than the browser can usefully redraw. The reporter only forwards an
+update when enough wall-clock time has passed, so the cost of the UI stays
+bounded whatever the iteration speed. Cost points for a live chart are
+downsampled to at most MAX_POINTS and sent in batches with those updates.
+"""
+import math
+import time
+
+import numpy as np
+
+DEFAULT_UPDATES_PER_SECOND = 4
+MAX_POINTS = 1000
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+class ProgressReporter:
+    """Callback `(i, cost)` that calls `on_update(fraction, message)` at most
+    `updates_per_second` times per second, plus once for the last iteration.
+
+    `cost` may be an array (one entry per model trained together), in which
+    case the best finite value is shown.
+
+    `on_points(iterations, costs)` receives the new chart points with each
+    update. With `divergence_factor`, the call returns True (asking the
+    training loop to stop) once the cost is no longer finite or exceeds that
+    multiple of the first cost (when it is positive); for arrays, once every model has diverged.
+    """
+
+    def __init__(self, total, on_update, updates_per_second=DEFAULT_UPDATES_PER_SECOND, label="Iteration",
+                 on_points=None, divergence_factor=None):
+        self.total = max(total, 1)
+        self.on_update = on_update
+        self.min_interval = 1.0 / updates_per_second
+        self.label = label
+        self.on_points = on_points
+        self.stride = max(1, self.total // MAX_POINTS)
+        self.iterations, self.costs = [], []
+        self.divergence_factor = divergence_factor
+        self.limit = None
+        self.stopped_at = None
+        self.start = self.last_update = time.monotonic()
+
+    def __call__(self, i, cost):
+        done = i + 1
+        stop = self.divergence_factor is not None and self._diverged(cost)
+        if stop:
+            self.stopped_at = done
+        if self.on_points is not None and (done % self.stride == 0 or done == self.total or stop):
+            self.iterations.append(done)
+            self.costs.append(cost)
+
+        now = time.monotonic()
+        if now - self.last_update < self.min_interval and done < self.total and not stop:
+            return False
+        self.last_update = now
+
+        if self.iterations:
+            self.on_points(self.iterations, self.costs)
+            self.iterations, self.costs = [], []
+
+        elapsed = now - self.start
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - done) / rate if rate > 0 else 0.0
+        self.on_update(
+            done / self.total,
+            f"{self.label} {done:,}/{self.total:,} · cost {self._cost(cost)} · "
+            f"{rate:,.1f} it/s · ETA {format_duration(eta)}"
+        )
+        return stop
+
+    def _diverged(self, cost):
+        if self.limit is None:
+            # A zero, negative or non-finite first cost gives no scale: then only non-finite costs count
+            first = np.asarray(cost, dtype=float)
+            self.limit = np.where(np.isfinite(first) & (first > 0), self.divergence_factor * first, np.inf)
+            if isinstance(cost, float):
+                self.limit = float(self.limit)
+        if isinstance(cost, float):
+            return not math.isfinite(cost) or cost > self.limit
+        return bool(np.all(~np.isfinite(cost) | (cost > self.limit)))
+
+    @staticmethod
+    def _cost(cost):
+        if np.ndim(cost):
+            finite = np.asarray(cost)[np.isfinite(cost)]
+            return f"{finite.min():.6f} (best)" if finite.size else "diverged"
+        return f"{cost:.6f}" if np.isfinite(cost) else "diverged"
@@ -0,0 +1,138 @@
+"""Server-wide admission control for heavy work (parsing, statistics, training, export).
+
+At most `MAX_RUNNING` jobs run at once across all sessions, and at most
+`MAX_BATCH` of them are batch jobs (trainings), so a slot is always left for
+interactive work. The others wait in a queue and are admitted by priority
+(interactive before batch), then fairly between sessions (the session admitted
+least recently goes first), then in arrival order.
+
+Jobs still run on the thread of the session that submitted them, since only
+that thread can update its page; the scheduler decides when they may start.
+Admitted jobs share the thread budget of `mlstudio.threads`. Jobs must not be
+nested: a job waiting for a slot held by its own session would wait forever.
+"""
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from mlstudio import threads
+
+INTERACTIVE, BATCH = 0, 1
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BATCH: "batch"}
+
+MAX_RUNNING = int(os.environ.get("ML_STUDIO_MAX_JOBS", 0)) or max(2, os.cpu_count() or 1)
+MAX_BATCH = int(os.environ.get("ML_STUDIO_MAX_BATCH_JOBS", 0)) or max(1, MAX_RUNNING - 1)
+
+# How often a waiting job reports its queue position
+POLL_SECONDS = 0.5
+
+
+class _Ticket:
+    def __init__(self, user, name, priority, seq):
+        self.user = user
+        self.name = name
+        self.priority = priority
+        self.seq = seq
+        self.submitted = time.time()
+        self.admitted = None
+
+
+class Scheduler:
+    """Fair queue in front of a bounded number of running jobs."""
+
+    def __init__(self, max_running=MAX_RUNNING, max_batch=MAX_BATCH):
+        self.max_running = max_running
+        self.max_batch = min(max_batch, max_running)
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._running = []
+        self._last_admitted = {}  # user -> admission number of their latest job
+        self._seq = itertools.count()
+        self._admissions = itertools.count()
+
+    def _order(self, ticket):
+        return ticket.priority, self._last_admitted.get(ticket.user, -1), ticket.seq
+
+    def _queue(self):
+        return sorted(self._waiting, key=self._order)
+
+    def _admit(self):
+        # Called with the lock held whenever a job arrives or finishes
+        for ticket in self._queue():
+            if len(self._running) >= self.max_running:
+                break
+            if ticket.priority == BATCH and sum(t.priority == BATCH for t in self._running) >= self.max_batch:
+                continue
+            self._waiting.remove(ticket)
+            self._running.append(ticket)
+            self._last_admitted[ticket.user] = next(self._admissions)
+            ticket.admitted = time.time()
+        self._cond.notify_all()
+
+    def _leave(self, ticket):
+        with self._cond:
+            if ticket in self._running:
+                self._running.remove(ticket)
+            elif ticket in self._waiting:
+                self._waiting.remove(ticket)
+            self._admit()
+
+    @contextmanager
+    def job(self, user, name, priority=INTERACTIVE, on_wait=None):
+        """Wait for a slot, then run the body as a job; yields its thread budget.
+
+        While queued, `on_wait(position, waiting, running)` is called every
+        `POLL_SECONDS` with the 1-based queue position.
+        """
+        ticket = _Ticket(user, name, priority, next(self._seq))
+        with self._cond:
+            self._waiting.append(ticket)
+            self._admit()
+        try:
+            while True:
+                with self._cond:
+                    if ticket.admitted is not None:
+                        break
+                    position = self._queue().index(ticket) + 1
+                    waiting, running = len(self._waiting), len(self._running)
+                # UI updates happen outside the lock; they raise when the session's script is stopped
+                if on_wait is not None:
+                    on_wait(position, waiting, running)
+                with self._cond:
+                    if ticket.admitted is None:
+                        self._cond.wait(POLL_SECONDS)
+            with threads.job() as thread_budget:
+                yield thread_budget
+        finally:
+            self._leave(ticket)
+
+    def jobs(self):
+        """Rows describing the running and waiting jobs."""
+        now = time.time()
+        with self._cond:
+            running, waiting = list(self._running), self._queue()
+        return [
+            {
+                "Job": ticket.name,
+                "Session": ticket.user[:8],
+                "Priority": PRIORITY_NAMES[ticket.priority],
+                "State": "running" if ticket.admitted is not None else f"queued #{position}",
+                "Waited (s)": round((ticket.admitted or now) - ticket.submitted, 2),
+                "Running (s)": round(now - ticket.admitted, 2) if ticket.admitted is not None else None
+            }
+            for position, ticket in enumerate(running + waiting, start=1 - len(running))
+        ]
+
+
+_scheduler = Scheduler()
+
+
+def job(user, name, priority=INTERACTIVE, on_wait=None):
+    """`Scheduler.job` on the server-wide scheduler."""
+    return _scheduler.job(user, name, priority, on_wait)
+
+
+def jobs():
+    return _scheduler.jobs()
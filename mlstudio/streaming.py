@@ -0,0 +1,183 @@
+"""Out-of-core training over CSV or Parquet files read in row chunks.
+
+A first pass computes the normalization statistics of the training rows with
+Welford/Chan merging, then every epoch streams the file again and accumulates
+the gradient chunk by chunk. Only one chunk of features is in memory at a time.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from mlstudio.training import init_weights, loss_and_gradient, make_optimizer, penalty, predict
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# Knuth multiplicative hash, used to assign rows to the test set reproducibly
+_HASH_MULTIPLIER = 2654435761
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+
+
+def read_columns(path):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).schema_arrow.names
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+
+def read_table(path):
+    """The whole file as a DataFrame."""
+    if _is_parquet(path):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def iter_chunks(path, columns, chunksize=DEFAULT_CHUNKSIZE):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def _test_mask(start, n_rows, test_fraction, seed):
+    index = np.arange(start, start + n_rows, dtype=np.uint64) + np.uint64(seed)
+    hashed = (index * np.uint64(_HASH_MULTIPLIER)) % np.uint64(2 ** 32)
+    return hashed < np.uint64(test_fraction * 2 ** 32)
+
+
+def iter_arrays(path, features, target, chunksize=DEFAULT_CHUNKSIZE, test_fraction=0.2, seed=42, dtype=float):
+    """Yield `(X, y, is_test)` per chunk; rows with missing values are skipped."""
+    start = 0
+    for chunk in iter_chunks(path, features + [target], chunksize):
+        is_test = _test_mask(start, len(chunk), test_fraction, seed)
+        start += len(chunk)
+
+        complete = chunk.notna().all(axis=1).to_numpy()
+        X = chunk[features].to_numpy(dtype=dtype)[complete]
+        y = chunk[target].to_numpy(dtype=dtype).reshape(-1, 1)[complete]
+        yield X, y, is_test[complete]
+
+
+def streaming_stats(chunks):
+    """Mean and (population) standard deviation of the training rows of `chunks`."""
+    n, mean, m2 = 0, None, None
+    for X, _, is_test in chunks:
+        X = X[~is_test].astype(np.float64, copy=False)
+        n_b = X.shape[0]
+        if n_b == 0:
+            continue
+        mean_b = X.mean(axis=0)
+        m2_b = ((X - mean_b) ** 2).sum(axis=0)
+
+        if mean is None:
+            n, mean, m2 = n_b, mean_b, m2_b
+            continue
+        delta = mean_b - mean
+        total = n + n_b
+        mean = mean + delta * n_b / total
+        m2 = m2 + m2_b + delta ** 2 * n * n_b / total
+        n = total
+
+    if n == 0:
+        raise ValueError("No complete training rows found in the file")
+    return n, mean, np.sqrt(m2 / n)
+
+
+def train_streaming(path, features, target, model_type, learning_rate, n_iter,
+                    chunksize=DEFAULT_CHUNKSIZE, test_fraction=0.2, seed=42,
+                    step_per_chunk=False, dtype=np.float64, optimizer="Gradient Descent",
+                    regularization="None", alpha=0.0, weights=None, bias=0.0, stats=None,
+                    callback=None, checkpointer=None):
+    """Train over `path` without loading it whole.
+
+    Each of the `n_iter` epochs is one full-batch step over all training rows,
+    or one step per chunk when `step_per_chunk` is set (mini-batch descent).
+    Passing `weights`, `bias` and `stats=(X_mean, X_std)` of an existing model
+    continues from it and skips the statistics pass.
+    `callback(epoch, cost)` is called after every epoch, and so is
+    `checkpointer.maybe_save(...)` (see mlstudio.checkpoint) if given, with a
+    final save when the run is interrupted by an exception;
+    training stops early when the callback returns True.
+    """
+    def chunks():
+        return iter_arrays(path, features, target, chunksize, test_fraction, seed, dtype)
+
+    if stats is None:
+        _, X_mean, X_std = streaming_stats(chunks())
+    else:
+        X_mean, X_std = stats
+    X_mean, X_std = np.asarray(X_mean, dtype=dtype), np.asarray(X_std, dtype=dtype)
+    if checkpointer is not None:
+        checkpointer.stats = (X_mean, X_std)
+    if weights is None:
+        weights = init_weights(len(features), dtype)
+    m = None
+    optimizer = make_optimizer(optimizer, learning_rate)
+    history = []
+    n_test = 0
+
+    try:
+        for epoch in range(n_iter):
+            loss, dw, db, seen = 0.0, np.zeros_like(weights), 0.0, 0
+            for X, y, is_test in chunks():
+                n_test += int(is_test.sum()) if epoch == 0 else 0
+                X, y = X[~is_test], y[~is_test]
+                if X.shape[0] == 0:
+                    continue
+                seen += X.shape[0]
+                X -= X_mean
+                X /= X_std
+                chunk_loss, chunk_dw, chunk_db = loss_and_gradient(X, y, weights, bias, model_type)
+                loss += chunk_loss
+
+                if step_per_chunk:
+                    reg_grad = penalty(weights, regularization, alpha)[1]
+                    bias = optimizer.step(weights, bias, chunk_dw / X.shape[0] + reg_grad, chunk_db / X.shape[0])
+                else:
+                    dw += chunk_dw
+                    db += chunk_db
+
+            if seen == 0:
+                raise ValueError("No complete training rows found in the file")
+            if n_test == 0:
+                # Caught after one epoch rather than as a division by zero in the test metrics
+                raise ValueError(f"No rows fall in the test split (test_fraction={test_fraction}); "
+                                 "use a larger test fraction or more rows")
+            m = seen
+            reg_cost, reg_grad = penalty(weights, regularization, alpha)
+            if not step_per_chunk:
+                bias = optimizer.step(weights, bias, dw / m + reg_grad, db / m)
+            history.append(float(loss / m + reg_cost))
+
+            if checkpointer is not None:
+                checkpointer.maybe_save(epoch + 1, weights, bias, optimizer, history)
+            if callback is not None and callback(epoch, history[-1]):
+                break
+    except BaseException:
+        # Stopped (e.g. by the callback raising) or failed: checkpoint the progress so far
+        if checkpointer is not None and history:
+            checkpointer.save(len(history), weights, bias, optimizer, history)
+        raise
+
+    # Evaluation pass: only the target and predictions of test rows are kept
+    y_test, y_pred = [], []
+    for X, y, is_test in chunks():
+        X = (X[is_test] - X_mean) / X_std
+        y_test.append(y[is_test])
+        y_pred.append(predict(X, weights, bias, model_type))
+
+    return {
+        "weights": weights,
+        "bias": bias,
+        "X_mean": X_mean,
+        "X_std": X_std,
+        "history": history,
+        "y_test": np.concatenate(y_test),
+        "y_pred": np.concatenate(y_pred),
+        "n_train": m
+    }
@@ -0,0 +1,122 @@
+"""Hyperparameter sweep over learning rate, iterations, optimizer and regularization.
+
+Candidates are trained in parallel on a process pool. The training and
+validation arrays are published once in shared memory and every worker
+reads them without copying.
+"""
+import itertools
+import time
+from concurrent.futures import as_completed
+
+import numpy as np
+
+from mlstudio.metrics import compute_metrics
+from mlstudio.parallel import SharedArrays, attach, process_pool
+from mlstudio.training import gradient_descent, predict
+
+# Metric used to rank candidates, and whether higher is better
+SCORE_METRICS = {
+    "Regression": ("mse", False),
+    "Classification": ("accuracy", True),
+}
+
+
+def grid_candidates(learning_rates, n_iters, optimizers, regularizations, alphas):
+    candidates = []
+    for lr, n_iter, optimizer, regularization in itertools.product(learning_rates, n_iters, optimizers, regularizations):
+        for alpha in (alphas if regularization != "None" else [0.0]):
+            candidates.append({
+                "learning_rate": lr,
+                "n_iter": n_iter,
+                "optimizer": optimizer,
+                "regularization": regularization,
+                "alpha": alpha
+            })
+    return candidates
+
+
+def random_candidates(n_candidates, learning_rates, n_iters, optimizers, regularizations, alphas, seed=42):
+    """Sample learning rate and alpha log-uniformly and iterations uniformly within the given bounds."""
+    rng = np.random.default_rng(seed)
+    lr_low, lr_high = np.log10(min(learning_rates)), np.log10(max(learning_rates))
+    alpha_low, alpha_high = np.log10(min(alphas)), np.log10(max(alphas))
+
+    candidates = []
+    for _ in range(n_candidates):
+        regularization = str(rng.choice(regularizations))
+        candidates.append({
+            "learning_rate": float(10 ** rng.uniform(lr_low, lr_high)),
+            "n_iter": int(rng.integers(min(n_iters), max(n_iters) + 1)),
+            "optimizer": str(rng.choice(optimizers)),
+            "regularization": regularization,
+            "alpha": float(10 ** rng.uniform(alpha_low, alpha_high)) if regularization != "None" else 0.0
+        })
+    return candidates
+
+
+def _train_candidate(spec, model_type, candidate, seed):
+    data = attach(spec)
+    np.random.seed(seed)
+    start = time.perf_counter()
+
+    weights, bias, history = gradient_descent(
+        data["X_train"], data["y_train"], model_type,
+        candidate["learning_rate"], candidate["n_iter"],
+        optimizer=candidate["optimizer"],
+        regularization=candidate["regularization"],
+        alpha=candidate["alpha"]
+    )
+    y_val_pred = predict(data["X_val"], weights, bias, model_type)
+
+    return {
+        "candidate": candidate,
+        "metrics": compute_metrics(data["y_val"], y_val_pred, model_type),
+        "weights": weights,
+        "bias": bias,
+        "history": history,
+        "seconds": time.perf_counter() - start
+    }
+
+
+def rank(results, model_type):
+    metric, higher_is_better = SCORE_METRICS[model_type]
+
+    def score(result):
+        value = result["metrics"][metric]
+        # Diverged runs (NaN metrics) go last
+        if not np.isfinite(value):
+            return np.inf
+        return -value if higher_is_better else value
+
+    return sorted(results, key=score)
+
+
+def run_sweep(X_train, y_train, X_val, y_val, model_type, candidates, max_workers=None, seed=42, on_result=None):
+    """Train all `candidates` and return their results, best first.
+
+    `on_result(done, total, result)` is called in the parent as candidates finish.
+    """
+    results = []
+    with SharedArrays(X_train=X_train, y_train=y_train, X_val=X_val, y_val=y_val) as shared:
+        with process_pool(max_workers) as pool:
+            futures = [pool.submit(_train_candidate, shared.spec, model_type, candidate, seed)
+                       for candidate in candidates]
+            for future in as_completed(futures):
+                results.append(future.result())
+                if on_result is not None:
+                    on_result(len(results), len(candidates), results[-1])
+
+    return rank(results, model_type)
+
+
+def leaderboard(results, model_type):
+    """Rows of candidate parameters and validation metrics, in rank order."""
+    rows = []
+    for position, result in enumerate(results, start=1):
+        row = {"Rank": position}
+        row.update(result["candidate"])
+        row.update({name: value for name, value in result["metrics"].items() if name != "confusion_matrix"})
+        row["final_cost"] = result["history"][-1]
+        row["seconds"] = round(result["seconds"], 2)
+        rows.append(row)
+    return rows
@@ -0,0 +1,107 @@
+"""Process-wide budget of BLAS/OpenMP threads shared by concurrent jobs.
+
+All sessions of a Streamlit server run in one process, and every NumPy/SciPy
+call would otherwise start as many BLAS threads as there are cores. With
+several users training at once the threads oversubscribe the CPU and total
+throughput drops below that of a single user.
+
+Heavy work runs inside `job()`, which registers it and limits the native
+thread pools (through threadpoolctl) to `THREAD_BUDGET // active jobs`.
+Worker processes started by a job, and the gradient threads of a sharded
+run (`shard_threads()`), get their share of the same budget.
+"""
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+THREAD_BUDGET = int(os.environ.get("ML_STUDIO_THREAD_BUDGET", 0)) or (os.cpu_count() or 1)
+
+# Environment variables read by the native thread pools of a new process
+THREAD_ENV_VARS = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMBA_NUM_THREADS"]
+
+_lock = threading.Lock()
+_active = 0
+_original_limits = None  # limiter holding the limits in force before the first job
+
+
+def governed():
+    """Whether native thread pools can be limited (threadpoolctl is installed)."""
+    return threadpool_limits is not None
+
+
+def active_jobs():
+    return _active
+
+
+def threads_per_job():
+    return max(1, THREAD_BUDGET // max(1, _active))
+
+
+def _apply():
+    # Called with the lock held whenever the number of active jobs changes
+    global _original_limits
+    if threadpool_limits is None:
+        return
+    if _active == 0:
+        if _original_limits is not None:
+            _original_limits.restore_original_limits()
+            _original_limits = None
+    elif _original_limits is None:
+        _original_limits = threadpool_limits(limits=threads_per_job())
+    else:
+        threadpool_limits(limits=threads_per_job())
+
+
+@contextmanager
+def job():
+    """Register a running job for its duration; yields its thread budget."""
+    global _active
+    with _lock:
+        _active += 1
+        _apply()
+        budget = threads_per_job()
+    try:
+        yield budget
+    finally:
+        with _lock:
+            _active -= 1
+            _apply()
+
+
+@contextmanager
+def shard_threads(n_shards):
+    """Split the current job's BLAS/OpenMP threads between `n_shards` threads computing in parallel."""
+    if threadpool_limits is None or n_shards <= 1:
+        yield
+        return
+    with _lock:
+        limiter = threadpool_limits(limits=max(1, threads_per_job() // n_shards))
+    try:
+        yield
+    finally:
+        with _lock:
+            if _active:
+                _apply()  # back to the per-job share, which may have changed meanwhile
+            else:
+                limiter.restore_original_limits()
+
+
+def worker_threads(n_workers):
+    """BLAS threads for each of `n_workers` processes sharing the current job's budget."""
+    return max(1, threads_per_job() // max(1, n_workers))
+
+
+def limit_worker_threads(n_threads):
+    """Process pool initializer limiting the native thread pools of a worker."""
+    if threadpool_limits is not None:
+        threadpool_limits(limits=n_threads)
+
+
+def thread_env(n_threads):
+    """Environment variables limiting the native thread pools of a subprocess."""
+    return {name: str(n_threads) for name in THREAD_ENV_VARS}
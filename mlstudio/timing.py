@@ -0,0 +1,63 @@
+"""Per-stage wall-clock timings, with optional cProfile sampling, for the Performance panel."""
+import cProfile
+import io
+import pstats
+import time
+from contextlib import contextmanager
+
+PROFILE_TOP = 25
+
+
+def profile_call(fn, *args, top=PROFILE_TOP, **kwargs):
+    """Run `fn` under cProfile; returns `(result, stats_text)` with the `top` entries by cumulative time."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args, **kwargs)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).strip_dirs().sort_stats("cumulative").print_stats(top)
+    return result, out.getvalue()
+
+
+class StageTimer:
+    """Durations of named stages ("Page / stage") over a session.
+
+    Each stage keeps its last duration, number of calls and total time.
+    Profiles captured with `call(..., profile=True)` are kept per stage.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.profiles = {}
+
+    def record(self, name, seconds):
+        entry = self.stages.setdefault(name, {"last": 0.0, "calls": 0, "total": 0.0})
+        entry["last"] = seconds
+        entry["calls"] += 1
+        entry["total"] += seconds
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def call(self, name, fn, *args, profile=False, **kwargs):
+        """Time `fn(*args, **kwargs)` as stage `name`, under cProfile if `profile`."""
+        with self.stage(name):
+            if not profile:
+                return fn(*args, **kwargs)
+            result, self.profiles[name] = profile_call(fn, *args, **kwargs)
+            return result
+
+    def rows(self):
+        return [
+            {
+                "Stage": name,
+                "Last (s)": round(entry["last"], 4),
+                "Calls": entry["calls"],
+                "Mean (s)": round(entry["total"] / entry["calls"], 4),
+                "Total (s)": round(entry["total"], 4)
+            }
+            for name, entry in sorted(self.stages.items(), key=lambda item: -item[1]["last"])
+        ]
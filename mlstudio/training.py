@@ -0,0 +1,358 @@
+"""Gradient descent for the linear and logistic models trained on the Model page."""
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+
+from mlstudio import threads
+
+# Row blocks are sized so the forward pass and the gradient of a block both
+# read it while it is still in cache
+DEFAULT_BLOCK_BYTES = 1 << 20
+
+
+def sigmoid(z):
+    return 1 / (1 + np.exp(-z))
+
+
+def init_weights(n_features, dtype=np.float64):
+    # Random initialization
+    return np.random.normal(0, 0.01, (n_features, 1)).astype(dtype, copy=False)
+
+
+def normalize_inplace(X_train, X_test=None, stats=None):
+    """Standardize with the training statistics, overwriting the inputs; returns `(X_mean, X_std)`.
+
+    Statistics are accumulated in float64 even for float32 data. Pass
+    `stats=(X_mean, X_std)` to reuse those of an existing model instead.
+    """
+    if stats is not None:
+        X_mean, X_std = (np.asarray(stat, dtype=X_train.dtype) for stat in stats)
+    else:
+        X_mean = X_train.mean(axis=0, dtype=np.float64).astype(X_train.dtype)
+        X_std = X_train.std(axis=0, dtype=np.float64).astype(X_train.dtype)
+    for X in (X_train, X_test):
+        if X is not None:
+            X -= X_mean
+            X /= X_std
+    return X_mean, X_std
+
+
+def loss_and_gradient(X, y, weights, bias, model_type):
+    """Return the summed loss and gradients `(loss, dw, db)` over the rows of `X`.
+
+    Sums rather than means let callers combine several row blocks (chunks,
+    shards) before dividing by the total number of rows.
+    """
+    linear_model = np.dot(X, weights) + bias
+
+    if model_type == "Regression":
+        errors = linear_model - y
+        loss = 0.5 * np.sum(errors ** 2)
+    else:
+        y_pred = sigmoid(linear_model)
+        errors = y_pred - y
+        loss = - np.sum(y * np.log(y_pred + 1e-8) + (1 - y) * np.log(1 - y_pred + 1e-8))
+
+    return loss, np.dot(X.T, errors), np.sum(errors)
+
+
+def default_threads():
+    return os.cpu_count() or 1
+
+
+class ShardedGradient:
+    """Full-batch `(loss, dw, db)` computed block by block on a thread pool.
+
+    The rows of `X` are split into cache-sized blocks, and contiguous runs of
+    blocks are assigned to `n_threads` shards. Each thread sweeps its blocks
+    (forward pass, residuals, cost and gradient while the block is in cache)
+    and accumulates partial sums, which are then reduced. NumPy releases the
+    GIL inside the products, so the shards run in parallel, each with its share
+    of the job's BLAS threads (see mlstudio.threads). `backend` picks
+    the per-block kernel (see mlstudio.kernels).
+    """
+
+    def __init__(self, X, y, model_type, n_threads=1, block_bytes=DEFAULT_BLOCK_BYTES, backend="NumPy"):
+        from mlstudio.kernels import get_kernel
+        self.model_type = model_type
+        self.kernel = get_kernel(backend)
+        m = X.shape[0]
+        if self.kernel is not loss_and_gradient:
+            # Fused kernels already read each row once, blocks are only needed to shard
+            block_bytes = max(block_bytes, -(-X.nbytes // max(1, n_threads)))
+        block_rows = max(1, block_bytes // max(1, X.shape[1] * X.itemsize))
+        blocks = [(X[start:start + block_rows], y[start:start + block_rows]) for start in range(0, m, block_rows)]
+
+        n_shards = max(1, min(n_threads, len(blocks)))
+        bounds = np.linspace(0, len(blocks), n_shards + 1).astype(int)
+        self.shards = [blocks[bounds[k]:bounds[k + 1]] for k in range(n_shards)]
+        self.pool = ThreadPoolExecutor(max_workers=n_shards) if n_shards > 1 else None
+        # Each shard thread gets its part of the job's BLAS threads while the pool exists
+        self._limits = ExitStack()
+        self._limits.enter_context(threads.shard_threads(n_shards))
+
+    def _shard(self, blocks, weights, bias):
+        if len(blocks) == 1:
+            return self.kernel(*blocks[0], weights, bias, self.model_type)
+        loss, dw, db = 0.0, np.zeros_like(weights), 0.0
+        for X, y in blocks:
+            block_loss, block_dw, block_db = self.kernel(X, y, weights, bias, self.model_type)
+            loss += block_loss
+            dw += block_dw
+            db += block_db
+        return loss, dw, db
+
+    def __call__(self, weights, bias):
+        if self.pool is None:
+            return self._shard(self.shards[0], weights, bias)
+
+        partials = list(self.pool.map(lambda blocks: self._shard(blocks, weights, bias), self.shards))
+        loss, dw, db = partials[0]
+        for part_loss, part_dw, part_db in partials[1:]:
+            loss += part_loss
+            dw += part_dw
+            db += part_db
+        return loss, dw, db
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+        self._limits.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GradientDescent:
+    """Plain gradient step. Optimizers update `weights` in place and return the new bias."""
+
+    def __init__(self, learning_rate):
+        self.learning_rate = learning_rate
+
+    def step(self, weights, bias, dw, db):
+        weights -= self.learning_rate * dw
+        return bias - self.learning_rate * db
+
+    def state_dict(self):
+        return {}
+
+    def load_state_dict(self, state):
+        pass
+
+
+class Momentum(GradientDescent):
+    def __init__(self, learning_rate, beta=0.9):
+        super().__init__(learning_rate)
+        self.beta = beta
+        self.velocity_w = None
+        self.velocity_b = 0.0
+
+    def step(self, weights, bias, dw, db):
+        if self.velocity_w is None:
+            self.velocity_w = np.zeros_like(weights)
+        self.velocity_w *= self.beta
+        self.velocity_w += dw
+        self.velocity_b = self.beta * self.velocity_b + db
+        weights -= self.learning_rate * self.velocity_w
+        return bias - self.learning_rate * self.velocity_b
+
+    def state_dict(self):
+        return {"velocity_w": self.velocity_w, "velocity_b": self.velocity_b}
+
+    def load_state_dict(self, state):
+        self.velocity_w = None if state["velocity_w"] is None else np.array(state["velocity_w"])
+        self.velocity_b = state["velocity_b"]
+
+
+class Adam(GradientDescent):
+    def __init__(self, learning_rate, beta1=0.9, beta2=0.999, eps=1e-8):
+        super().__init__(learning_rate)
+        self.beta1, self.beta2, self.eps = beta1, beta2, eps
+        self.t = 0
+        self.m_w = self.v_w = None
+        self.m_b = self.v_b = 0.0
+
+    def step(self, weights, bias, dw, db):
+        if self.m_w is None:
+            self.m_w, self.v_w = np.zeros_like(weights), np.zeros_like(weights)
+        self.t += 1
+        self.m_w = self.beta1 * self.m_w + (1 - self.beta1) * dw
+        self.v_w = self.beta2 * self.v_w + (1 - self.beta2) * dw ** 2
+        self.m_b = self.beta1 * self.m_b + (1 - self.beta1) * db
+        self.v_b = self.beta2 * self.v_b + (1 - self.beta2) * db ** 2
+
+        correction1 = 1 - self.beta1 ** self.t
+        correction2 = 1 - self.beta2 ** self.t
+        weights -= self.learning_rate * (self.m_w / correction1) / (np.sqrt(self.v_w / correction2) + self.eps)
+        return bias - self.learning_rate * (self.m_b / correction1) / (np.sqrt(self.v_b / correction2) + self.eps)
+
+    def state_dict(self):
+        return {"t": self.t, "m_w": self.m_w, "v_w": self.v_w, "m_b": self.m_b, "v_b": self.v_b}
+
+    def load_state_dict(self, state):
+        self.t = state["t"]
+        self.m_w = None if state["m_w"] is None else np.array(state["m_w"])
+        self.v_w = None if state["v_w"] is None else np.array(state["v_w"])
+        self.m_b, self.v_b = state["m_b"], state["v_b"]
+
+
+OPTIMIZERS = {
+    "Gradient Descent": GradientDescent,
+    "Momentum": Momentum,
+    "Adam": Adam,
+}
+
+REGULARIZATIONS = ["None", "L2 (Ridge)", "L1 (Lasso)"]
+
+
+def make_optimizer(optimizer, learning_rate, state=None):
+    if isinstance(optimizer, GradientDescent):
+        return optimizer
+    optimizer = OPTIMIZERS[optimizer](learning_rate)
+    if state:
+        optimizer.load_state_dict(state)
+    return optimizer
+
+
+def warm_start_params(model, dtype=np.float64):
+    """Copies of a trained model's `(weights, bias, (X_mean, X_std))` to continue training from."""
+    weights = np.array(model["weights"], dtype=dtype).reshape(-1, 1)
+    return weights, model["bias"], (model["X_mean"], model["X_std"])
+
+
+# Globals an exported model may reference: NumPy arrays, scalars and dtypes (NumPy 1.x and 2.x module names)
+_MODEL_GLOBALS = {
+    ("numpy", "ndarray"), ("numpy", "dtype"),
+    ("numpy.core.multiarray", "_reconstruct"), ("numpy._core.multiarray", "_reconstruct"),
+    ("numpy.core.multiarray", "scalar"), ("numpy._core.multiarray", "scalar"),
+    ("numpy.core.numeric", "_frombuffer"), ("numpy._core.numeric", "_frombuffer"),
+    ("_codecs", "encode"),
+}
+
+
+class _ModelUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if (module, name) in _MODEL_GLOBALS or (module == "numpy.dtypes" and name.endswith("DType")):
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a model file")
+
+
+def load_model(file):
+    """Read an exported `trained_model.pkl` without running code from it.
+
+    Only containers, numbers, strings and NumPy arrays/scalars are accepted,
+    so an uploaded file cannot import and call arbitrary functions.
+    """
+    model = _ModelUnpickler(file).load()
+    if not isinstance(model, dict):
+        raise ValueError("not an exported model")
+    return model
+
+
+def penalty(weights, regularization, alpha):
+    """Return the `(cost, gradient)` contribution of the weight penalty."""
+    if regularization == "L2 (Ridge)" and alpha:
+        return 0.5 * alpha * float(np.sum(weights ** 2)), alpha * weights
+    if regularization == "L1 (Lasso)" and alpha:
+        return alpha * float(np.sum(np.abs(weights))), alpha * np.sign(weights)
+    return 0.0, 0
+
+
+def gradient_descent(X, y, model_type, learning_rate, n_iter, weights=None, bias=0.0,
+                     optimizer="Gradient Descent", regularization="None", alpha=0.0, callback=None,
+                     checkpointer=None, n_threads=1, backend="NumPy"):
+    """Full-batch training; returns `(weights, bias, history)`.
+
+    `optimizer` is a name from OPTIMIZERS or an optimizer instance (to carry
+    its state across calls). `callback(i, cost)` is called after every iteration
+    and `checkpointer.maybe_save(...)` (see mlstudio.checkpoint) if given,
+    with a final save when the run is interrupted by an exception;
+    training stops early when the callback returns True. The gradient is
+    computed on `n_threads` row shards with the kernels of `backend` (see
+    ShardedGradient).
+    """
+    if weights is None:
+        weights = init_weights(X.shape[1], X.dtype)
+    optimizer = make_optimizer(optimizer, learning_rate)
+    m = X.shape[0]
+    history = []
+
+    with ShardedGradient(X, y, model_type, n_threads, backend=backend) as gradient:
+        try:
+            for i in range(n_iter):
+                loss, dw, db = gradient(weights, bias)
+                reg_cost, reg_grad = penalty(weights, regularization, alpha)
+                bias = optimizer.step(weights, bias, dw / m + reg_grad, db / m)
+                history.append(float(loss / m + reg_cost))
+
+                if checkpointer is not None:
+                    checkpointer.maybe_save(i + 1, weights, bias, optimizer, history)
+                if callback is not None and callback(i, history[-1]):
+                    break
+        except BaseException:
+            # Stopped (e.g. by the callback raising) or failed: checkpoint the progress so far
+            if checkpointer is not None and history:
+                checkpointer.save(len(history), weights, bias, optimizer, history)
+            raise
+
+    return weights, bias, history
+
+
+def gradient_descent_multi(X, y, model_type, learning_rates, n_iter,
+                           optimizer="Gradient Descent", regularization="None", alpha=0.0, callback=None):
+    """Train one model per learning rate simultaneously.
+
+    The k weight vectors are stacked into an `(n_features, k)` matrix so each
+    iteration is a single matrix product over `X` instead of k. Returns
+    `(weights, biases, histories)` with one column / entry / curve per rate.
+    `callback(i, costs)` may return True to stop early.
+    """
+    k = len(learning_rates)
+    weights = np.random.normal(0, 0.01, (X.shape[1], k)).astype(X.dtype, copy=False)
+    bias = np.zeros(k, dtype=X.dtype)
+    optimizer = make_optimizer(optimizer, np.asarray(learning_rates, dtype=X.dtype))
+    m = X.shape[0]
+    history = []
+
+    for i in range(n_iter):
+        linear_model = np.dot(X, weights) + bias
+
+        if model_type == "Regression":
+            errors = linear_model - y
+            loss = 0.5 * np.sum(errors ** 2, axis=0)
+        else:
+            y_pred = sigmoid(linear_model)
+            errors = y_pred - y
+            loss = - np.sum(y * np.log(y_pred + 1e-8) + (1 - y) * np.log(1 - y_pred + 1e-8), axis=0)
+
+        dw = np.dot(X.T, errors) / m
+        if regularization == "L2 (Ridge)" and alpha:
+            loss = loss / m + 0.5 * alpha * np.sum(weights ** 2, axis=0)
+            dw += alpha * weights
+        elif regularization == "L1 (Lasso)" and alpha:
+            loss = loss / m + alpha * np.sum(np.abs(weights), axis=0)
+            dw += alpha * np.sign(weights)
+        else:
+            loss = loss / m
+
+        bias = optimizer.step(weights, bias, dw, np.sum(errors, axis=0) / m)
+        history.append(loss)
+
+        if callback is not None and callback(i, loss):
+            break
+
+    histories = np.array(history).T.tolist() if history else [[] for _ in range(k)]
+    return weights, bias, histories
+
+
+def predict(X, weights, bias, model_type):
+    linear_model = np.dot(X, weights) + bias
+    if model_type == "Regression":
+        return linear_model
+    return (sigmoid(linear_model) >= 0.5).astype(int)
@@ -0,0 +1,44 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from mlstudio import archive
+
+MEMBERS = {
+    "raw_data.csv": "a,b\n1,2\n" * 1000,
+    "model.pkl": bytes(range(256)) * 64,
+    "empty.txt": "",
+}
+
+
+def _roundtrip(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zip_file:
+        assert zip_file.testzip() is None
+        return {name: zip_file.read(name) for name in zip_file.namelist()}
+
+
+@pytest.mark.parametrize("codec", list(archive.ARCHIVE_CODECS))
+@pytest.mark.parametrize("max_workers", [1, 4])
+@pytest.mark.parametrize("fast_append", [True, False])
+def test_build_archive_roundtrip(monkeypatch, codec, max_workers, fast_append):
+    if not fast_append:
+        monkeypatch.setattr(archive, "_can_append_compressed", lambda zip_file: False)
+    else:
+        assert archive._can_append_compressed(zipfile.ZipFile(io.BytesIO(), "w"))
+
+    members = [(name, (lambda payload=payload: payload)) for name, payload in MEMBERS.items()]
+    members.append(("stored.bin", b"\x00" * 5000, True))
+    contents = _roundtrip(archive.build_archive(members, codec=codec, max_workers=max_workers))
+
+    assert list(contents) == list(MEMBERS) + ["stored.bin"]
+    for name, payload in MEMBERS.items():
+        assert contents[name] == (payload.encode("utf-8") if isinstance(payload, str) else payload)
+    assert contents["stored.bin"] == b"\x00" * 5000
+
+
+def test_csv_member_roundtrip():
+    df = pd.DataFrame({"a": [1.5, 2.5], "b": ["x", "y"]})
+    contents = _roundtrip(archive.build_archive([("data.csv", lambda: archive.csv_bytes(df))]))
+    pd.testing.assert_frame_equal(pd.read_csv(io.BytesIO(contents["data.csv"])), df)
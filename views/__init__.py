@@ -0,0 +1,21 @@
+"""The pages of the app, one module each.
+
+A page module is imported the first time its page is selected, so the
+libraries it needs (pandas, Plotly, scikit-learn, ...) are only loaded then,
+and each rerun executes only the selected page's `render()`.
+"""
+import importlib
+
+PAGES = {
+    "Welcome": "welcome",
+    "Data": "data",
+    "Dashboard": "dashboard",
+    "Preprocessing": "preprocessing",
+    "Model": "model",
+    "Results": "results",
+    "Export": "export",
+}
+
+
+def render(page):
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render()
@@ -0,0 +1,57 @@
+"""Per-session helpers shared by the pages."""
+import weakref
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from mlstudio import memory, scheduler
+from mlstudio.timing import StageTimer
+
+MEMORY_BUDGET = memory.BUDGET_MB * memory.MB
+
+
+def session_id():
+    run_ctx = get_script_run_ctx()
+    return run_ctx.session_id if run_ctx else "local"
+
+
+def user_id():
+    # The signed-in user when authentication is configured, otherwise this browser session
+    if st.user.get("is_logged_in") and st.user.get("email"):
+        return st.user["email"]
+    return session_id()
+
+
+def session_timer():
+    # Stage timings of this session, shown in the Performance panel
+    return st.session_state.setdefault("timer", StageTimer())
+
+
+# Heavy work waits for a slot of the server-wide scheduler, with its queue position shown meanwhile
+@contextmanager
+def scheduled(name, priority=scheduler.INTERACTIVE, status=None):
+    placeholder = status or st.empty()
+
+    def on_wait(position, waiting, running):
+        placeholder.info(f"⏳ {name} is queued: position {position} of {waiting} ({running} jobs running)")
+
+    with scheduler.job(session_id(), name, priority, on_wait) as thread_budget:
+        placeholder.empty()
+        yield thread_budget
+
+
+def session_cache(name, source, key, compute):
+    """`compute()`, reused while `source` is the same object and `key` is unchanged.
+
+    Results are kept per session under `view_cache`, so a page or tab visited
+    before renders without recomputing. `source` (the DataFrame or arrays the
+    result is derived from) is held by a weak reference.
+    """
+    cache = st.session_state.setdefault("view_cache", {})
+    entry = cache.get(name)
+    if entry is not None and entry[0]() is source and entry[1] == key:
+        return entry[2]
+    value = compute()
+    cache[name] = (weakref.ref(source), key, value)
+    return value
@@ -0,0 +1,197 @@
+"""Dashboard page."""
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from views import theme
+from views.common import scheduled, session_cache, session_timer
+from views.figures import cached_figure, histogram
+
+
+def render():
+    timer = session_timer()
+    plotly_template = theme.plotly_template()
+    
+    st.markdown('<div class="section-header"><h3>📊 Analytical Dashboard</h3></div>', unsafe_allow_html=True)
+
+    if "df" not in st.session_state:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 3rem;">
+            <h3 style="color: #f59e0b;">⚠️ Missing data</h3>
+            <p style="color: #6b7280;">Please upload a dataset first in the 'Data' tab</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        df = st.session_state["df"]
+
+        # Separate column types
+        numeric_cols = df.select_dtypes(include=["int", "float"]).columns.tolist()
+        categorical_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
+
+        # Descriptive stats with modern style
+        st.markdown("### 📈 Descriptive Statistics")
+
+        if numeric_cols:
+            col1, col2 = st.columns([3, 1])
+
+            with col1:
+                def describe():
+                    with scheduled("Descriptive statistics"), timer.stage("Dashboard / descriptive statistics"):
+                        return df[numeric_cols].describe().round(2)
+
+                stats_df = session_cache("dashboard/describe", df, numeric_cols, describe)
+                st.dataframe(stats_df.style.background_gradient(cmap="viridis", axis=1), use_container_width=True)
+
+            with col2:
+                if len(numeric_cols) >= 3:
+                    def radar_figure():
+                        means_normalized = (df[numeric_cols].mean() - df[numeric_cols].mean().min()) / (df[numeric_cols].mean().max() - df[numeric_cols].mean().min())
+
+                        fig_radar = go.Figure()
+                        fig_radar.add_trace(go.Scatterpolar(
+                            r=means_normalized.values,
+                            theta=means_normalized.index,
+                            fill='toself',
+                            name='Normalized Means',
+                            line_color='#6366f1'
+                        ))
+                        fig_radar.update_layout(
+                            polar=dict(
+                                radialaxis=dict(visible=True, range=[0, 1])
+                            ),
+                            showlegend=False,
+                            title="Variable Profile",
+                            height=300,
+                            template=plotly_template
+                        )
+                        return fig_radar
+
+                    fig_radar = cached_figure("dashboard/radar", df, tuple(numeric_cols), radar_figure)
+                    st.plotly_chart(fig_radar, use_container_width=True)
+
+        st.markdown("---")
+
+        # Interactive visualizations
+        st.markdown("### 🎨 Interactive Visualizations")
+
+        # Only the selected tab runs; the others are skipped until opened
+        tab1, tab2, tab3 = st.tabs(["📊 Distributions", "🔗 Correlations", "📈 Trends"],
+                                   key="dashboard_tab", on_change="rerun")
+
+        def distribution_figure(col, chart_type):
+            if chart_type == "Histogram":
+                fig = histogram(
+                    df[col], x_title=col,
+                    title=f"Distribution of {col}",
+                    color="#6366f1",
+                    template=plotly_template
+                )
+            elif chart_type == "Box Plot":
+                fig = px.box(
+                    df, y=col,
+                    title=f"Box Plot of {col}",
+                    color_discrete_sequence=["#8b5cf6"],
+                    template=plotly_template
+                )
+            else:  # Violin Plot
+                fig = px.violin(
+                    df, y=col,
+                    title=f"Violin Plot of {col}",
+                    color_discrete_sequence=["#06b6d4"],
+                    template=plotly_template
+                )
+
+            fig.update_layout(height=400)
+            return fig
+
+        with tab1:
+            if tab1.open and numeric_cols:
+                col1, col2 = st.columns([1, 3])
+
+                with col1:
+                    selected_cols = st.multiselect(
+                        "Select variables:",
+                        numeric_cols,
+                        default=numeric_cols[:3] if len(numeric_cols) >= 3 else numeric_cols
+                    )
+
+                    chart_type = st.radio(
+                        "Chart type:",
+                        ["Histogram", "Box Plot", "Violin Plot"]
+                    )
+
+                with col2:
+                    if selected_cols:
+                        for col in selected_cols:
+                            fig = cached_figure("dashboard/distribution", df, (col, chart_type),
+                                                lambda: distribution_figure(col, chart_type))
+                            st.plotly_chart(fig, use_container_width=True)
+
+        with tab2:
+            if tab2.open and len(numeric_cols) >= 2:
+                def correlation():
+                    with scheduled("Correlation matrix"), timer.stage("Dashboard / correlation matrix"):
+                        return df[numeric_cols].corr()
+
+                def correlation_figure():
+                    fig_corr = px.imshow(
+                        corr_matrix,
+                        text_auto=True,
+                        aspect="auto",
+                        color_continuous_scale="RdBu_r",
+                        title="Correlation Matrix",
+                        template=plotly_template
+                    )
+                    fig_corr.update_layout(height=500)
+                    return fig_corr
+
+                corr_matrix = session_cache("dashboard/correlation", df, numeric_cols, correlation)
+                fig_corr = cached_figure("dashboard/correlation", df, tuple(numeric_cols), correlation_figure)
+                st.plotly_chart(fig_corr, use_container_width=True)
+
+                strong_corr = corr_matrix.abs() > 0.5
+                if strong_corr.any().any():
+                    st.markdown("**🔥 Strong correlations detected (|r| > 0.5):**")
+                    for i in range(len(corr_matrix.columns)):
+                        for j in range(i+1, len(corr_matrix.columns)):
+                            corr_val = corr_matrix.iloc[i, j]
+                            if abs(corr_val) > 0.5:
+                                col1, col2, col3 = st.columns([2, 1, 2])
+                                with col1:
+                                    st.write(f"**{corr_matrix.columns[i]}**")
+                                with col2:
+                                    st.metric("", f"{corr_val:.3f}")
+                                with col3:
+                                    st.write(f"**{corr_matrix.columns[j]}**")
+
+        with tab3:
+            if tab3.open and categorical_cols:
+                selected_cat = st.selectbox("Categorical variable:", categorical_cols)
+
+                if selected_cat:
+                    def category_figure():
+                        cat_counts = df[selected_cat].value_counts().reset_index()
+                        cat_counts.columns = [selected_cat, "Frequency"]
+
+                        fig_cat = px.bar(
+                            cat_counts.head(10),
+                            x=selected_cat,
+                            y="Frequency",
+                            title=f"Top 10 - Distribution of {selected_cat}",
+                            color="Frequency",
+                            color_continuous_scale="viridis",
+                            template=plotly_template
+                        )
+                        fig_cat.update_layout(height=400)
+                        return fig_cat
+
+                    fig_cat = cached_figure("dashboard/categories", df, selected_cat, category_figure)
+                    st.plotly_chart(fig_cat, use_container_width=True)
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Unique values", df[selected_cat].nunique())
+                    with col2:
+                        st.metric("Mode", df[selected_cat].mode().iloc[0] if not df[selected_cat].mode().empty else "N/A")
+                    with col3:
+                        st.metric("Missing values", df[selected_cat].isnull().sum())
@@ -0,0 +1,149 @@
+"""Data page."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from mlstudio import memory
+from views import theme
+from views.common import MEMORY_BUDGET, scheduled, session_timer
+
+
+def render():
+    timer = session_timer()
+    plotly_template = theme.plotly_template()
+    
+    st.markdown('<div class="section-header"><h3>📁 Dataset Import </h3></div>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="modern-card">
+            <h4 style="color: #374151; margin-bottom: 1rem;">📤 Load Dataset</h4>
+            <p style="color: #6b7280; margin-bottom: 1rem;">
+                Upload your CSV file to start the analysis. 
+                Supported formats: CSV • Max size: 50MB • Encoding: UTF-8
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        uploaded_file = st.file_uploader(
+            label="Select your CSV file",
+            type=["csv"],
+            help="Drag & drop your file here, or click to browse",
+        )
+
+    with col2:
+        st.markdown("""
+        <div class="modern-card">
+            <h4 style="color: #374151; margin-bottom: 1rem;">💡 Tips</h4>
+            <ul style="color: #6b7280; font-size: 0.875rem;">
+                <li>Ensure the first row contains headers</li>
+                <li>Avoid special characters in column names</li>
+                <li>Check your file encoding</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    if uploaded_file:
+        try:
+            with scheduled("CSV parsing"), timer.stage("Data / CSV parsing"):
+                df = pd.read_csv(uploaded_file)
+            dataset_bytes = memory.sizeof(df)
+            if dataset_bytes > MEMORY_BUDGET:
+                st.error(f"❌ This dataset takes {dataset_bytes / memory.MB:,.0f} MB in memory, "
+                         f"over the session budget of {memory.BUDGET_MB:,.0f} MB")
+                st.stop()
+            st.session_state["df"] = df
+
+            st.success("✅ File successfully imported!", icon="🎉")
+
+            # Modern dataset preview
+            st.markdown('<div class="section-header"><h3>🔍 Dataset Preview</h3></div>', unsafe_allow_html=True)
+
+            # Metrics in modern cards
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{df.shape[0]:,}</div>
+                    <div class="metric-label">📦 Rows</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{df.shape[1]}</div>
+                    <div class="metric-label">🧱 Columns</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            with col3:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{df.isnull().sum().sum()}</div>
+                    <div class="metric-label">🔍 Missing values</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            with col4:
+                memory_usage = df.memory_usage(deep=True).sum() / 1024**2
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{memory_usage:.1f} MB</div>
+                    <div class="metric-label">💾 Memory usage</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+
+            # Data table with modern style
+            st.markdown("**📋 Sample of the data**")
+            st.dataframe(df.head(10), use_container_width=True, height=300)
+
+            # Data type information
+            st.markdown('<div class="section-header"><h3>🧬 Data Type Analysis</h3></div>', unsafe_allow_html=True)
+
+            col1, col2 = st.columns([2, 1])
+
+            with col1:
+                dtypes_df = pd.DataFrame({
+                    "Column": df.columns,
+                    "Type": df.dtypes.astype(str),
+                    "Unique Values": [df[col].nunique() for col in df.columns],
+                    "% Missing Values": [f"{(df[col].isnull().sum() / len(df) * 100):.1f}%" for col in df.columns]
+                })
+                st.dataframe(dtypes_df, use_container_width=True, height=300)
+
+            with col2:
+                # Donut chart of data types
+                numeric_cols = len(df.select_dtypes(include=["int", "float"]).columns)
+                categorical_cols = len(df.select_dtypes(include=["object", "category"]).columns)
+                other_cols = df.shape[1] - numeric_cols - categorical_cols
+
+                fig_types = px.pie(
+                    values=[numeric_cols, categorical_cols, other_cols],
+                    names = ["Numerical", "Categorical", "Others"],
+                    hole=0.6,
+                    color_discrete_sequence=["#6366f1", "#8b5cf6", "#06b6d4"],
+                    template=plotly_template
+                )
+                fig_types.update_traces(textinfo='percent+label', textfont_size=12)
+                fig_types.update_layout(
+                    title="Distribution of Data Types",
+                    showlegend=True,
+                    height=300,
+                    font=dict(family="Inter", size=12)
+                )
+                st.plotly_chart(fig_types, use_container_width=True)
+        except Exception as e:
+            st.error(f"❌ Error loading file: {str(e)}")
+    else:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 3rem;">
+            <h3 style="color: #9ca3af;">📁 No file selected</h3>
+            <p style="color: #6b7280;">Please upload a CSV file to start the analysis</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,193 @@
+"""Export page."""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from mlstudio import archive, pipeline
+from views.common import scheduled, session_timer
+
+
+def render():
+    timer = session_timer()
+    
+    st.markdown('<div class="section-header"><h3>📦 Results Export</h3></div>', unsafe_allow_html=True)
+    
+    # Check available data
+    has_data = "df" in st.session_state
+    has_cleaned_data = "df_cleaned" in st.session_state
+    has_model = "trained_model" in st.session_state
+    
+    # Data status
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        status = "✅" if has_data else "❌"
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-value">{status}</div>
+            <div class="metric-label">Raw data</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        status = "✅" if has_cleaned_data else "❌"
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-value">{status}</div>
+            <div class="metric-label">Preprocessed data</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        status = "✅" if has_model else "❌"
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-value">{status}</div>
+            <div class="metric-label">Trained model</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    if not any([has_data, has_cleaned_data, has_model]):
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 3rem;">
+            <h3 style="color: #f59e0b;">⚠️ No data to export</h3>
+            <p style="color: #6b7280;">Please first import and process data</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        # Export options
+        st.markdown("### 📋 Export Options")
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            export_options = []
+            # Chosen under Compression Settings below; read from the previous run to label the data files
+            data_label = st.session_state.get("export_data_format", "CSV")
+            
+            if has_data:
+                export_raw = st.checkbox(f"📊 Raw data ({data_label})", value=True, key="export_raw_data")
+                if export_raw:
+                    export_options.append("raw_data")
+            
+            if has_cleaned_data:
+                export_cleaned = st.checkbox(f"🧹 Preprocessed data ({data_label})", value=True, key="export_cleaned_data")
+                if export_cleaned:
+                    export_options.append("cleaned_data")
+            
+            if has_model:
+                export_model = st.checkbox("🧠 Trained model (PKL)", value=True)
+                if export_model:
+                    export_options.append("model")
+                
+                export_results = st.checkbox("📈 Results and metrics (JSON)", value=True)
+                if export_results:
+                    export_options.append("results")
+            
+            include_report = st.checkbox("📄 Analysis report (TXT)", value=True)
+            if include_report:
+                export_options.append("report")
+            
+            # Compression settings
+            with st.expander("🗜️ Compression Settings"):
+                data_formats = ["CSV"] + (["Parquet"] if archive.parquet_available() else [])
+                data_format = st.radio("Data file format:", data_formats, horizontal=True, key="export_data_format")
+                
+                if data_format == "Parquet":
+                    parquet_codec = st.selectbox(
+                        "Parquet codec:",
+                        archive.PARQUET_CODECS,
+                        help="Parquet files are compressed internally and stored without ZIP compression"
+                    )
+                else:
+                    parquet_codec = None
+                
+                archive_codec = st.radio("ZIP compression:", list(archive.ARCHIVE_CODECS), horizontal=True)
+                compression_level = st.slider(
+                    "Compression level:",
+                    1, 9, archive.DEFAULT_LEVEL,
+                    disabled=archive_codec == "Store",
+                    help="1 is fastest, 9 produces the smallest archive"
+                )
+                compression_workers = st.slider(
+                    "Compression threads:",
+                    1, max(2, os.cpu_count() or 1), archive.default_workers(),
+                    help="Archive members are serialized and compressed in parallel"
+                )
+        
+        with col2:
+            st.markdown("""
+            <div class="modern-card">
+                <h4 style="color: #374151; margin-bottom: 1rem;">📦 Archive Format</h4>
+                <p style="color: #6b7280; font-size: 0.875rem;">
+                    Export generates a ZIP file containing all selected elements.
+                </p>
+                <ul style="color: #6b7280; font-size: 0.875rem;">
+                    <li>CSV / Parquet: Tabular data</li>
+                    <li>PKL: Python model</li>
+                    <li>JSON: Structured metrics</li>
+                    <li>TXT: Readable report</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Export button
+        if st.button("🚀 Generate Archive", type="primary", use_container_width=True):
+            if not export_options:
+                st.warning("⚠️ Please select at least one element to export")
+            else:
+                try:
+                    data_ext = "parquet" if parquet_codec else "csv"
+                    members = pipeline.export_members(
+                        export_options,
+                        df=st.session_state.get("df"),
+                        df_cleaned=st.session_state.get("df_cleaned"),
+                        trained_model=st.session_state.get("trained_model"),
+                        model_config=st.session_state.get("model_config"),
+                        history=st.session_state.get("history"),
+                        cv_results=st.session_state.get("cv_results"),
+                        parquet_codec=parquet_codec,
+                        timer=timer
+                    )
+                    
+                    # Create ZIP archive in memory
+                    with scheduled("Export archive"):
+                        zip_bytes = archive.build_archive(
+                            members,
+                            codec=archive_codec,
+                            level=compression_level,
+                            max_workers=compression_workers
+                        )
+                    
+                    st.success("✅ Archive generated successfully!")
+                    
+                    # Download button
+                    st.download_button(
+                        label="📥 Download ZIP Archive",
+                        data=zip_bytes,
+                        file_name=f"ml_export_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                        mime="application/zip",
+                        type="primary",
+                        use_container_width=True
+                    )
+                    
+                    # Export summary
+                    st.markdown("### 📋 Archive Contents")
+                    
+                    for option in export_options:
+                        if option == "raw_data":
+                            st.write(f"📊 `raw_data.{data_ext}` - Original dataset")
+                        elif option == "cleaned_data":
+                            st.write(f"🧹 `preprocessed_data.{data_ext}` - Preprocessed dataset")
+                        elif option == "model":
+                            st.write("🧠 `trained_model.pkl` - Serialized Python model")
+                        elif option == "results":
+                            st.write("📈 `results_metrics.json` - Metrics and configuration")
+                        elif option == "report":
+                            st.write("📄 `analysis_report.txt` - Summary report")
+                
+                except Exception as e:
+                    st.error(f"❌ Error generating archive: {str(e)}")
@@ -0,0 +1,127 @@
+"""Server-wide cache of Plotly figures, and figure builders with compact JSON.
+
+`st.plotly_chart` converts its figure to JSON on every call. Plotly writes
+NumPy arrays as base64 typed arrays (and uses orjson when it is installed),
+but Python lists number by number, so traces here are built from arrays
+(base64 arrays need Plotly 6 or later).
+Histograms are binned on the server instead of sending every value.
+
+Figures are cached by the fingerprint of the data they show, the chart
+parameters and the theme, and shared by all sessions. The data passed in is
+assumed not to be modified in place.
+"""
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from mlstudio import memory
+from views import theme
+
+FIGURE_CACHE_SIZE = int(os.environ.get("ML_STUDIO_FIGURE_CACHE_SIZE", 128))
+MAX_BINS = 100
+
+_figures = OrderedDict()  # key -> (figure, approximate bytes)
+_stats = {"hits": 0, "misses": 0, "bytes": 0}
+_fingerprints = {}  # id(obj) -> (weak reference, fingerprint) of DataFrames and arrays
+# Reentrant: a weak reference callback can run while the lock is held
+_lock = threading.RLock()
+
+
+def _digest(obj):
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        digest.update(repr(list(obj.columns) if isinstance(obj, pd.DataFrame) else obj.name).encode())
+    else:
+        array = np.ascontiguousarray(obj)
+        digest.update(array.tobytes())
+        digest.update(f"{array.dtype}{array.shape}".encode())
+    return digest.hexdigest()
+
+
+def fingerprint(obj):
+    """Content hash of a DataFrame, Series, array or list, or a tuple of them.
+
+    Hashes of DataFrames and arrays are remembered for as long as the object lives.
+    """
+    if isinstance(obj, tuple):
+        return "-".join(fingerprint(item) for item in obj)
+    if isinstance(obj, list):
+        return _digest(obj)
+
+    key = id(obj)
+    with _lock:
+        entry = _fingerprints.get(key)
+    if entry is not None and entry[0]() is obj:
+        return entry[1]
+
+    def forget(ref):
+        with _lock:
+            if _fingerprints.get(key, (None,))[0] is ref:
+                del _fingerprints[key]
+
+    value = _digest(obj)
+    with _lock:
+        _fingerprints[key] = (weakref.ref(obj, forget), value)
+    return value
+
+
+def cached_figure(name, data, params, build):
+    """The figure `build()` returns, cached by (name, fingerprint of `data`, `params`, theme)."""
+    key = (name, fingerprint(data), params, theme.plotly_template())
+    with _lock:
+        entry = _figures.get(key)
+        if entry is not None:
+            _figures.move_to_end(key)
+            _stats["hits"] += 1
+            return entry[0]
+        _stats["misses"] += 1
+
+    figure = build()
+    nbytes = memory.sizeof(figure.to_plotly_json())
+    with _lock:
+        previous = _figures.pop(key, None)
+        if previous is not None:
+            _stats["bytes"] -= previous[1]
+        _figures[key] = (figure, nbytes)
+        _stats["bytes"] += nbytes
+        while len(_figures) > FIGURE_CACHE_SIZE:
+            _stats["bytes"] -= _figures.popitem(last=False)[1][1]
+    return figure
+
+
+def cache_info():
+    with _lock:
+        return {"figures": len(_figures), **_stats}
+
+
+memory.register_shared("figure cache", lambda: (len(_figures), _stats["bytes"]))
+
+
+def histogram(values, nbins=None, title=None, x_title=None, color="#6366f1", template=None):
+    """Histogram of `values` binned here, sent as one bar per bin."""
+    values = np.asarray(values, dtype=float).ravel()
+    values = values[np.isfinite(values)]
+    lo, hi = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+    if not hi - lo > 1e-9 * max(abs(lo), abs(hi), 1.0):
+        # (Nearly) constant values: widen the range as NumPy does for a zero range
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.histogram_bin_edges(values, bins=nbins or "auto", range=(lo, hi))
+    if len(edges) > MAX_BINS + 1:
+        edges = np.histogram_bin_edges(values, bins=MAX_BINS, range=(lo, hi))
+    counts, edges = np.histogram(values, bins=edges)
+
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color
+    ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title="count", bargap=0, template=template)
+    return fig
@@ -0,0 +1,877 @@
+"""Model page."""
+import os
+import secrets
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from sklearn.model_selection import train_test_split
+
+from mlstudio import checkpoint, cv, distributed, hogwild, kernels, memory, scheduler, streaming, sweep
+from mlstudio.metrics import compute_metrics
+from mlstudio.progress import ProgressReporter
+from mlstudio.training import (OPTIMIZERS, REGULARIZATIONS, default_threads, gradient_descent, gradient_descent_multi,
+                               load_model, make_optimizer, normalize_inplace, predict, warm_start_params)
+from views.common import scheduled, session_cache, session_timer, user_id
+
+
+def render():
+    timer = session_timer()
+    
+    st.markdown('<div class="section-header"><h3>🧠 Train Your AI Model</h3></div>', unsafe_allow_html=True)
+    
+    data_source = st.radio(
+        "📂 Training Data:",
+        ["Preprocessed dataset", "File on disk (out-of-core)"],
+        horizontal=True,
+        help="Out-of-core mode streams a CSV or Parquet file in chunks instead of loading it in memory"
+    )
+    out_of_core = data_source == "File on disk (out-of-core)"
+    data_path = None
+    
+    if not out_of_core and "df_cleaned" not in st.session_state:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 3rem;">
+            <h3 style="color: #f59e0b;">⚠️ Preprocessing Required</h3>
+            <p style="color: #6b7280;">Please preprocess your data first in the 'Preprocessing' section</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        if out_of_core:
+            data_path = st.text_input(
+                "📄 File path on the server:",
+                help="CSV or Parquet file; rows with missing values are skipped"
+            )
+            if not data_path:
+                st.info("💡 Enter the path of a CSV or Parquet file to continue")
+                st.stop()
+            try:
+                all_columns = streaming.read_columns(data_path)
+            except Exception as e:
+                st.error(f"❌ Cannot read file: {str(e)}")
+                st.stop()
+        else:
+            df = st.session_state["df_cleaned"]
+            all_columns = df.columns.tolist()
+        
+        # Modern configuration interface
+        st.markdown("### ⚙️ Model Configuration")
+        
+        with st.container():
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                st.markdown("""
+                <div class="modern-card">
+                    <h4 style="color: #374151; margin-bottom: 1rem;">🎯 Variable Selection</h4>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                target = st.selectbox(
+                    "🎯 Target Variable:",
+                    all_columns,
+                    help="The variable you want to predict"
+                )
+                
+                available_features = [col for col in all_columns if col != target]
+                features = st.multiselect(
+                    "🧩 Explanatory Variables (features):",
+                    available_features,
+                    default=available_features[:5] if len(available_features) > 5 else available_features,
+                    help="The variables used for prediction"
+                )
+                
+                model_type = st.radio(
+                    "🧠 Model Type:",
+                    ["Regression", "Classification"],
+                    horizontal=True,
+                    help="Regression for continuous values, Classification for categories"
+                )
+                
+                training_mode = st.radio(
+                    "🧪 Training Mode:",
+                    ["Single run"] + ([] if out_of_core else ["Hyperparameter sweep", "Compare learning rates", "Cross-validation",
+                                                              "Async parallel SGD"]) + ["Distributed"],
+                    horizontal=True,
+                    help="A sweep trains many configurations in parallel and keeps the best one; "
+                         "comparing learning rates trains one model per rate in a single vectorized run; "
+                         "async parallel SGD runs lock-free mini-batch updates (Hogwild!) on several processes; "
+                         "distributed training shards the rows over worker processes, here or on other hosts"
+                )
+            
+            with col2:
+                st.markdown("""
+                <div class="modern-card">
+                    <h4 style="color: #374151; margin-bottom: 1rem;">⚡ Training Parameters</h4>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                learning_rate = st.slider(
+                    "📈 Learning Rate:",
+                    0.001, 1.0, 0.01, step=0.001,
+                    help="Controls how fast the model learns"
+                )
+                
+                n_iter = st.slider(
+                    "🔄 Number of Iterations:",
+                    100, 5000, 1000, step=100,
+                    help="Number of training steps"
+                )
+                
+                optimizer = st.selectbox(
+                    "🧭 Optimizer:",
+                    list(OPTIMIZERS),
+                    help="Update rule applied to the gradients"
+                )
+                
+                regularization = st.selectbox(
+                    "🧲 Regularization:",
+                    REGULARIZATIONS,
+                    help="Penalty on large weights to limit overfitting"
+                )
+                alpha = 0.0
+                if regularization != "None":
+                    alpha = st.select_slider(
+                        "Regularization strength (α):",
+                        [0.0001, 0.001, 0.01, 0.1, 1.0],
+                        value=0.01
+                    )
+                
+                test_size = st.slider(
+                    "📊 Test Set Size (%):",
+                    10, 50, 20,
+                    help="Percentage of data reserved for testing"
+                )
+                
+                precision = st.radio(
+                    "🔢 Numeric Precision:",
+                    ["float64", "float32"],
+                    horizontal=True,
+                    help="float32 halves memory use and speeds up matrix products"
+                )
+                dtype = np.float32 if precision == "float32" else np.float64
+                
+                n_threads = 1
+                if not out_of_core and training_mode in ("Single run", "Cross-validation"):
+                    n_threads = st.slider(
+                        "🧵 Gradient threads:",
+                        1, max(2, default_threads()), default_threads(),
+                        help="Each iteration's gradient is computed on row shards in parallel; "
+                             "capped by this job's share of the thread budget while other jobs run"
+                    )
+                
+                backend = "NumPy"
+                if not out_of_core and training_mode in ("Single run", "Cross-validation"):
+                    if kernels.numba_available():
+                        backend = st.radio(
+                            "⚙️ Compute Backend:",
+                            kernels.BACKENDS,
+                            horizontal=True,
+                            help="Numba compiles a kernel that fuses the forward pass, loss and gradient in one loop; "
+                                 "the first run includes a short compilation"
+                        )
+                    else:
+                        st.caption("⚙️ Install `numba` to enable JIT-compiled training kernels")
+                
+                if out_of_core:
+                    chunksize = st.number_input(
+                        "📦 Rows per chunk:",
+                        1000, 10_000_000, streaming.DEFAULT_CHUNKSIZE, step=10_000,
+                        help="Rows read from disk at a time"
+                    )
+                    step_per_chunk = st.checkbox(
+                        "Update weights after every chunk",
+                        help="Mini-batch updates; each iteration is then one pass over the file"
+                    )
+        
+        if training_mode == "Hyperparameter sweep":
+            with st.expander("🔍 Sweep Configuration", expanded=True):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    search = st.radio("Search strategy:", ["Grid", "Random"], horizontal=True)
+                    sweep_learning_rates = st.multiselect(
+                        "Learning rates:",
+                        [0.001, 0.003, 0.01, 0.03, 0.1, 0.3, 1.0],
+                        default=[0.001, 0.01, 0.1]
+                    )
+                    sweep_n_iters = st.multiselect(
+                        "Iterations:",
+                        [100, 500, 1000, 2000, 5000],
+                        default=[500, 1000]
+                    )
+                    if search == "Random":
+                        n_candidates = st.slider("Number of candidates:", 2, 200, 20)
+                        st.caption("Random search samples between the smallest and largest selected values")
+                
+                with col2:
+                    sweep_optimizers = st.multiselect("Optimizers:", list(OPTIMIZERS), default=list(OPTIMIZERS))
+                    sweep_regularizations = st.multiselect("Regularizations:", REGULARIZATIONS, default=["None"])
+                    sweep_alphas = st.multiselect(
+                        "Regularization strengths (α):",
+                        [0.0001, 0.001, 0.01, 0.1, 1.0],
+                        default=[0.01]
+                    )
+                    sweep_workers = st.slider(
+                        "Parallel workers:",
+                        1, max(2, os.cpu_count() or 1), min(4, os.cpu_count() or 1),
+                        help="Candidates are trained in separate processes"
+                    )
+                
+                sweep_lists = [sweep_learning_rates, sweep_n_iters, sweep_optimizers, sweep_regularizations, sweep_alphas]
+                if not all(sweep_lists):
+                    candidates = []
+                elif search == "Grid":
+                    candidates = sweep.grid_candidates(*sweep_lists)
+                else:
+                    candidates = sweep.random_candidates(n_candidates, *sweep_lists)
+                
+                st.info(f"🧮 {len(candidates)} candidates; 20% of the training set is held out for validation")
+        
+        if training_mode == "Compare learning rates":
+            with st.expander("📈 Learning Rates to Compare", expanded=True):
+                compare_rates = st.multiselect(
+                    "Learning rates:",
+                    [0.001, 0.003, 0.01, 0.03, 0.1, 0.3, 0.5, 1.0],
+                    default=[0.001, 0.01, 0.1, 0.5],
+                    help="All rates share the training data and are updated together in one matrix product per iteration"
+                )
+                st.caption("The rate with the lowest final cost is kept as the trained model")
+        
+        if training_mode == "Cross-validation":
+            with st.expander("🔁 Cross-Validation Settings", expanded=True):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    n_folds = st.slider("Number of folds (k):", 3, 10, 5)
+                with col2:
+                    stratified = st.checkbox(
+                        "Stratified folds",
+                        value=model_type == "Classification",
+                        disabled=model_type != "Classification",
+                        help="Keep the class balance of the target in every fold"
+                    )
+                with col3:
+                    cv_workers = st.slider(
+                        "Parallel workers:",
+                        1, max(2, os.cpu_count() or 1), min(n_folds, os.cpu_count() or 1),
+                        key="cv_workers",
+                        help="Folds are trained in separate processes"
+                    )
+                st.caption("Folds cover the whole dataset; the final model is still trained on the train/test split above")
+        
+        if training_mode == "Async parallel SGD":
+            with st.expander("⚡ Async SGD Settings", expanded=True):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    hogwild_epochs = st.slider("Epochs:", 1, 100, 10, help="Passes of every worker over its shard of rows")
+                with col2:
+                    hogwild_batch = st.select_slider("Batch size:", [1, 8, 32, 128, 512], value=hogwild.DEFAULT_BATCH_SIZE)
+                with col3:
+                    hogwild_workers = st.slider(
+                        "Parallel workers:",
+                        1, max(2, os.cpu_count() or 1), os.cpu_count() or 1,
+                        key="hogwild_workers",
+                        help="Each process updates the shared weights without locks"
+                    )
+                st.caption("Plain SGD steps are used (the optimizer setting is ignored); "
+                           "workers race on the shared weights, so a few updates are lost")
+        
+        if training_mode == "Distributed":
+            with st.expander("🌐 Distributed Settings", expanded=True):
+                col1, col2 = st.columns(2)
+                with col1:
+                    dist_local = st.slider(
+                        "Local worker processes:",
+                        0, max(2, os.cpu_count() or 1), 2,
+                        help="Workers started on this machine"
+                    )
+                with col2:
+                    dist_remote = st.number_input(
+                        "Remote workers:", 0, 256, 0,
+                        help="Workers you start on other hosts; training waits for all of them to connect"
+                    )
+                dist_port = 0
+                if dist_remote:
+                    dist_port = st.number_input("Coordinator port:", 1024, 65535, distributed.DEFAULT_PORT)
+                    dist_authkey = st.session_state.setdefault("dist_authkey", secrets.token_hex(16))
+                    st.markdown("**Start each remote worker with:**")
+                    st.code(
+                        f"{distributed.AUTHKEY_ENV}={dist_authkey} python -m mlstudio.distributed "
+                        f"--address <this-host>:{dist_port} [--data local_shard.csv]",
+                        language="bash"
+                    )
+                st.caption("Each step the workers compute the gradient of their rows and the app sums them, "
+                           "so the result matches a single full-batch run"
+                           + ("; each worker keeps every n-th row of the file" if out_of_core else ""))
+        
+        # Warm start from an existing model with the same features and target
+        init_source = "Random initialization"
+        if training_mode in ("Single run", "Cross-validation", "Async parallel SGD", "Distributed"):
+            init_sources = ["Random initialization"]
+            current_model = st.session_state.get("trained_model")
+            if current_model is not None:
+                current_config = st.session_state["model_config"]
+                if (current_config["features"] == features and current_config["target"] == target
+                        and current_config["type"] == model_type):
+                    init_sources.append("Current trained model")
+            init_sources.append("Uploaded model (.pkl)")
+            
+            with st.expander("♻️ Warm Start"):
+                init_source = st.radio(
+                    "Initial weights:",
+                    init_sources,
+                    horizontal=True,
+                    help="Continue training an existing model for more iterations instead of starting from scratch"
+                )
+                if init_source == "Uploaded model (.pkl)":
+                    uploaded_model = st.file_uploader(
+                        "Exported model file (trained_model.pkl):",
+                        type=["pkl"]
+                    )
+                    st.caption("Only weights, statistics and settings are read from the file: other Python objects are rejected")
+                if init_source != "Random initialization":
+                    st.caption("The model's normalization statistics are reused so its weights stay valid")
+        
+        # Periodic checkpoints and resume of interrupted runs
+        enable_checkpoints = resume_clicked = False
+        resumable = {}
+        if training_mode in ("Single run", "Cross-validation"):
+            # Runs are only resumed on the data they were trained on
+            if out_of_core:
+                data_id = checkpoint.data_fingerprint(path=data_path)
+            else:
+                data_id = session_cache("checkpoint_data", df, (tuple(features), target),
+                                        lambda: checkpoint.data_fingerprint(df[features + [target]]))
+            with st.expander("💾 Checkpoints"):
+                enable_checkpoints = st.checkbox(
+                    "Save checkpoints during training",
+                    value=True,
+                    help="Weights, optimizer state and cost history are saved on the server so an interrupted run can be "
+                         "resumed, by you only and on the same data"
+                )
+                checkpoint_interval = st.slider(
+                    "Checkpoint interval (seconds):",
+                    5, 600, checkpoint.DEFAULT_INTERVAL,
+                    disabled=not enable_checkpoints
+                )
+                
+                resumable = {
+                    summary["run_id"]: summary
+                    for summary in checkpoint.list_checkpoints(
+                        user_id(), features=features, target=target, type=model_type,
+                        data_source=data_source, data_path=data_path, data_fingerprint=data_id
+                    )
+                }
+                if resumable:
+                    resume_id = st.selectbox(
+                        "Interrupted runs:",
+                        list(resumable),
+                        format_func=lambda run_id: (
+                            f"{resumable[run_id]['updated']} — iteration {resumable[run_id]['iteration']}"
+                            f"/{resumable[run_id]['config']['n_iter_total']}, cost {resumable[run_id]['cost']:.6f}"
+                        )
+                    )
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        resume_clicked = st.button("▶️ Resume Training", use_container_width=True)
+                    with col2:
+                        if st.button("🗑️ Delete Checkpoint", use_container_width=True):
+                            checkpoint.delete_checkpoint(user_id(), resume_id)
+                            st.rerun()
+                else:
+                    st.caption("No interrupted runs for this configuration")
+        
+        profile_training = st.checkbox(
+            "🔬 Profile the training loop (cProfile)",
+            value=False,
+            help="Adds some overhead; the top functions by cumulative time are shown in the Performance panel"
+        )
+        auto_stop = st.checkbox(
+            "⛔ Stop automatically if the cost diverges",
+            value=True,
+            help="Training stops as soon as the cost becomes infinite/NaN or grows to 100× its initial value"
+        )
+        
+        # Run id of the stopped run when it had a checkpointer, True otherwise
+        stopped_run = st.session_state.pop("training_stopped", None)
+        if stopped_run:
+            st.warning("⏹️ Training was stopped before completion" + (
+                ". It can be resumed from the checkpoint saved when it stopped (💾 Checkpoints)"
+                if stopped_run in resumable else ""))
+        
+        # Validation and training
+        launch_clicked = st.button("🚀 Launch Training", type="primary", use_container_width=True)
+        if launch_clicked or resume_clicked:
+            if not features:
+                st.error("❌ Please select at least one feature")
+                st.stop()
+            if training_mode == "Hyperparameter sweep" and not candidates:
+                st.error("❌ Please select at least one value for each sweep parameter")
+                st.stop()
+            if training_mode == "Compare learning rates" and not compare_rates:
+                st.error("❌ Please select at least one learning rate")
+                st.stop()
+            if training_mode == "Distributed" and not dist_local + dist_remote:
+                st.error("❌ Please use at least one worker")
+                st.stop()
+            
+            # A resumed run continues with the settings it was started with
+            if resume_clicked:
+                resume_state = checkpoint.load_checkpoint(user_id(), resume_id)
+                resume_config = resume_state["config"]
+                learning_rate = resume_config["learning_rate"]
+                optimizer = resume_config["optimizer"]
+                regularization = resume_config["regularization"]
+                alpha = resume_config["alpha"]
+                precision = resume_config["precision"]
+                dtype = np.float32 if precision == "float32" else np.float64
+                test_size = resume_config["test_size"]
+                if out_of_core:
+                    chunksize = resume_config["chunksize"]
+                    step_per_chunk = resume_config["step_per_chunk"]
+                training_mode = "Single run"
+                n_iter = resume_config["n_iter_total"] - resume_state["iteration"]
+                init_source = "Checkpoint"
+            
+            # Resolve the warm-start model
+            init_model, init_history = None, []
+            if init_source == "Checkpoint":
+                init_model = resume_state
+                init_history = list(resume_state["history"])
+            elif init_source == "Current trained model":
+                init_model = st.session_state["trained_model"]
+                init_history = list(st.session_state["history"])
+            elif init_source == "Uploaded model (.pkl)":
+                if uploaded_model is None:
+                    st.error("❌ Please upload a model file to warm-start from")
+                    st.stop()
+                try:
+                    init_model = load_model(uploaded_model)
+                    init_weights_shape = np.shape(init_model["weights"])
+                    missing = {"bias", "X_mean", "X_std"} - set(init_model)
+                except Exception as e:
+                    st.error(f"❌ Cannot read model file: {str(e)}")
+                    st.stop()
+                if missing:
+                    st.error(f"❌ Model file is missing: {', '.join(sorted(missing))}")
+                    st.stop()
+                if init_model.get("features", features) != features or init_weights_shape[0] != len(features):
+                    st.error("❌ The uploaded model was trained on different features")
+                    st.stop()
+                if init_model.get("target", target) != target:
+                    st.error(f"❌ The uploaded model predicts `{init_model['target']}`, not `{target}`")
+                    st.stop()
+                if init_model.get("type", model_type) != model_type:
+                    st.error(f"❌ The uploaded model is a {init_model['type']} model")
+                    st.stop()
+            
+            optimizer_state = None
+            if init_model is not None and init_model.get("optimizer") == optimizer:
+                optimizer_state = init_model.get("optimizer_state")
+            optimizer_obj = make_optimizer(optimizer, learning_rate, optimizer_state)
+            if init_model is not None:
+                start_weights, start_bias, start_stats = warm_start_params(init_model, dtype)
+            else:
+                start_weights, start_bias, start_stats = None, 0.0, None
+            
+            checkpointer = None
+            if enable_checkpoints or resume_clicked:
+                checkpointer = checkpoint.Checkpointer(
+                    {
+                        "features": features,
+                        "target": target,
+                        "type": model_type,
+                        "data_source": data_source,
+                        "data_path": data_path,
+                        "data_fingerprint": data_id,
+                        "learning_rate": learning_rate,
+                        "n_iter_total": resume_config["n_iter_total"] if resume_clicked else n_iter,
+                        "optimizer": optimizer,
+                        "regularization": regularization,
+                        "alpha": alpha,
+                        "precision": precision,
+                        "test_size": test_size,
+                        "chunksize": int(chunksize) if out_of_core else None,
+                        "step_per_chunk": step_per_chunk if out_of_core else None
+                    },
+                    owner=user_id(),
+                    interval=checkpoint_interval,
+                    run_id=resume_id if resume_clicked else None,
+                    start_iteration=resume_state["iteration"] if resume_clicked else 0,
+                    history_prefix=init_history
+                )
+            
+            # Numeric type validation (file columns are converted chunk by chunk)
+            if not out_of_core:
+                for col in features:
+                    # If it's boolean, convert to integer
+                    if df[col].dtype == 'bool':
+                        df[col] = df[col].astype(int)
+                        st.info(f"🔄 Column '{col}' converted from boolean to integer")
+                    # If it's still not numeric, error
+                    elif not np.issubdtype(df[col].dtype, np.number):
+                         st.error(f"❌ Column '{col}' is not numeric. Please apply encoding in the 'Preprocessing' section.")
+                         st.stop()
+                # Do the same for target variable
+                if df[target].dtype == 'bool':
+                   df[target] = df[target].astype(int)
+                   st.info(f"🔄 Target variable '{target}' converted from boolean to integer")
+                elif not np.issubdtype(df[target].dtype, np.number):
+                   st.error(f"❌ Target variable '{target}' is not numeric.")
+                   st.stop()
+            
+            # Training progress bar
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            
+            # Clicking interrupts the running script at its next UI update
+            st.button(
+                "⏹️ Stop Training",
+                on_click=lambda: st.session_state.update(
+                    training_stopped=checkpointer.run_id if checkpointer is not None else True),
+                help="The progress so far is checkpointed when the run stops" if checkpointer is not None else None
+            )
+            
+            on_iteration = None
+            # Trainings are batch jobs: queued behind interactive work, BLAS/OpenMP threads shared with other jobs
+            with scheduled(f"Training ({training_mode})", scheduler.BATCH, status_text) as thread_budget:
+                n_threads = min(n_threads, thread_budget)
+                try:
+                    # Progress updates are throttled in time, not per iteration
+                    def on_progress(fraction, message):
+                        progress_bar.progress(30 + int(fraction * 60))
+                        status_text.text(f"🏃‍♂️ {message}")
+                
+                    # Live convergence chart, redrawn with each progress update from
+                    # the downsampled points collected so far (at most MAX_POINTS)
+                    def live_reporter(columns, label="Iteration"):
+                        live_chart = st.empty()
+                        points = []
+                    
+                        def on_points(iterations, costs):
+                            costs = np.array(costs, dtype=float).reshape(len(iterations), -1)
+                            costs[~np.isfinite(costs)] = np.nan
+                            points.append(pd.DataFrame(costs, index=iterations, columns=columns))
+                            live_chart.line_chart(pd.concat(points), x_label="Iteration", y_label="Cost")
+                    
+                        return ProgressReporter(
+                            n_iter, on_progress, label=label, on_points=on_points,
+                            divergence_factor=100 if auto_stop else None
+                        )
+                
+                    # Coordinator of the distributed mode, once all workers are connected
+                    def start_coordinator():
+                        coordinator = distributed.Coordinator(
+                            dist_local + dist_remote,
+                            host="0.0.0.0" if dist_remote else "127.0.0.1",
+                            port=int(dist_port),
+                            authkey=bytes.fromhex(st.session_state["dist_authkey"]) if dist_remote else None
+                        )
+                        try:
+                            coordinator.start_local_workers(dist_local)
+                            status_text.text(f"🌐 Waiting for {dist_local + dist_remote} workers...")
+                            coordinator.accept()
+                        except BaseException:
+                            # Frees the port and stops the local workers for the next launch
+                            coordinator.close()
+                            raise
+                        return coordinator
+                
+                    if out_of_core and training_mode == "Distributed":
+                        progress_bar.progress(10)
+                        with start_coordinator() as coordinator:
+                            status_text.text("🌐 Workers are loading their shards...")
+                            X_mean, X_std = coordinator.load_file(
+                                data_path, features, target,
+                                chunksize=int(chunksize),
+                                test_fraction=test_size / 100,
+                                dtype=dtype,
+                                stats=start_stats
+                            )
+                            on_iteration = live_reporter(["cost"])
+                            weights, bias, history = timer.call(
+                                "Model / distributed training", coordinator.train,
+                                model_type, learning_rate, n_iter, len(features),
+                                weights=start_weights,
+                                bias=start_bias,
+                                optimizer=optimizer_obj,
+                                regularization=regularization,
+                                alpha=alpha,
+                                callback=on_iteration,
+                                dtype=dtype
+                            )
+                            y_test, y_test_pred = coordinator.evaluate(weights, bias, model_type)
+                        history = init_history + history
+                        X_test_norm = None
+                    elif out_of_core:
+                        status_text.text("🏃‍♂️ Streaming training in progress...")
+                        progress_bar.progress(10)
+                        on_iteration = live_reporter(["cost"], label="Epoch")
+                    
+                        result = timer.call(
+                            "Model / streaming training", streaming.train_streaming,
+                            data_path, features, target, model_type, learning_rate, n_iter,
+                            profile=profile_training,
+                            chunksize=int(chunksize),
+                            test_fraction=test_size / 100,
+                            step_per_chunk=step_per_chunk,
+                            dtype=dtype,
+                            optimizer=optimizer_obj,
+                            regularization=regularization,
+                            alpha=alpha,
+                            weights=start_weights,
+                            bias=start_bias,
+                            stats=start_stats,
+                            callback=on_iteration,
+                            checkpointer=checkpointer
+                        )
+                        weights, bias = result["weights"], result["bias"]
+                        X_mean, X_std = result["X_mean"], result["X_std"]
+                        history = init_history + result["history"]
+                        y_test, y_test_pred = result["y_test"], result["y_pred"]
+                        # Test features are not kept in memory in out-of-core mode
+                        X_test_norm = None
+                    else:
+                        status_text.text("🔄 Preparing data...")
+                        progress_bar.progress(10)
+                    
+                        with timer.stage("Model / data preparation"):
+                            X = df[features].to_numpy(dtype=dtype)
+                            y = df[target].to_numpy(dtype=dtype).reshape(-1, 1)
+                    
+                        if training_mode == "Cross-validation":
+                            status_text.text(f"🔁 Cross-validating over {n_folds} folds...")
+                        
+                            def on_fold(done, total, result):
+                                progress_bar.progress(10 + int((done / total) * 20))
+                                status_text.text(f"🔁 {done}/{total} folds evaluated")
+                        
+                            fold_results = timer.call(
+                                "Model / cross-validation", cv.cross_validate,
+                                X, y, model_type,
+                                dict(learning_rate=learning_rate, n_iter=n_iter, optimizer=optimizer,
+                                     regularization=regularization, alpha=alpha),
+                                n_splits=n_folds,
+                                stratified=stratified and model_type == "Classification",
+                                max_workers=cv_workers,
+                                on_result=on_fold
+                            )
+                            st.session_state["cv_results"] = {
+                                "n_folds": n_folds,
+                                "stratified": stratified and model_type == "Classification",
+                                "summary": cv.summarize(fold_results),
+                                "folds": [{"Fold": r["fold"], **{k: v for k, v in r["metrics"].items() if k != "confusion_matrix"}}
+                                          for r in fold_results]
+                            }
+                    
+                        # Data split on row indices, then the full matrix is released
+                        with timer.stage("Model / train-test split"):
+                            train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=test_size/100, random_state=42)
+                            X_train, X_test = X[train_idx], X[test_idx]
+                            y_train, y_test = y[train_idx], y[test_idx]
+                        del X, y
+                    
+                        # Normalization after split, in place
+                        with timer.stage("Model / normalization"):
+                            X_mean, X_std = normalize_inplace(X_train, X_test, stats=start_stats)
+                        X_train_norm, X_test_norm = X_train, X_test
+                        del X_train, X_test
+                        if checkpointer is not None:
+                            checkpointer.stats = (X_mean, X_std)
+                    
+                        progress_bar.progress(30)
+                    
+                        if training_mode == "Hyperparameter sweep":
+                            status_text.text(f"🔍 Evaluating {len(candidates)} candidates...")
+                        
+                            def on_candidate(done, total, result):
+                                progress_bar.progress(30 + int((done / total) * 60))
+                                status_text.text(f"🔍 {done}/{total} candidates evaluated")
+                        
+                            fit_idx, val_idx = train_test_split(np.arange(len(X_train_norm)), test_size=0.2, random_state=42)
+                            results = timer.call(
+                                "Model / hyperparameter sweep", sweep.run_sweep,
+                                X_train_norm[fit_idx], y_train[fit_idx],
+                                X_train_norm[val_idx], y_train[val_idx],
+                                model_type, candidates,
+                                max_workers=sweep_workers,
+                                on_result=on_candidate
+                            )
+                            st.session_state["sweep_leaderboard"] = sweep.leaderboard(results, model_type)
+                        
+                            # Keep the best candidate as the trained model
+                            best = results[0]
+                            weights, bias, history = best["weights"], best["bias"], best["history"]
+                            learning_rate = best["candidate"]["learning_rate"]
+                            n_iter = best["candidate"]["n_iter"]
+                            optimizer = best["candidate"]["optimizer"]
+                            regularization = best["candidate"]["regularization"]
+                            alpha = best["candidate"]["alpha"]
+                        elif training_mode == "Compare learning rates":
+                            status_text.text(f"🏃‍♂️ Training {len(compare_rates)} models in parallel...")
+                            on_iteration = live_reporter([f"lr={lr:g}" for lr in compare_rates])
+                        
+                            all_weights, all_biases, histories = timer.call(
+                                "Model / gradient loop", gradient_descent_multi,
+                                X_train_norm, y_train, model_type, compare_rates, n_iter,
+                                profile=profile_training,
+                                optimizer=optimizer,
+                                regularization=regularization,
+                                alpha=alpha,
+                                callback=on_iteration
+                            )
+                            st.session_state["lr_comparison"] = {
+                                "learning_rates": compare_rates,
+                                "histories": histories
+                            }
+                        
+                            # Keep the rate with the lowest final cost (diverged runs are skipped)
+                            final_costs = np.array([h[-1] for h in histories])
+                            best = int(np.argmin(np.where(np.isfinite(final_costs), final_costs, np.inf)))
+                            weights = all_weights[:, [best]].copy()
+                            bias = all_biases[best]
+                            history = histories[best]
+                            learning_rate = compare_rates[best]
+                        elif training_mode == "Async parallel SGD":
+                            status_text.text(f"🏃‍♂️ Async SGD on {hogwild_workers} processes...")
+                            n_iter = hogwild_epochs
+                            on_iteration = live_reporter(["cost"], label="Epoch")
+                        
+                            weights, bias, history = timer.call(
+                                "Model / async SGD", hogwild.train_hogwild,
+                                X_train_norm, y_train, model_type, learning_rate, n_iter,
+                                n_workers=hogwild_workers,
+                                batch_size=hogwild_batch,
+                                regularization=regularization,
+                                alpha=alpha,
+                                weights=start_weights,
+                                bias=start_bias,
+                                callback=on_iteration
+                            )
+                            history = init_history + history
+                            optimizer = "SGD (Hogwild)"
+                        elif training_mode == "Distributed":
+                            with start_coordinator() as coordinator:
+                                coordinator.scatter(X_train_norm, y_train)
+                                on_iteration = live_reporter(["cost"])
+                                weights, bias, history = timer.call(
+                                    "Model / distributed training", coordinator.train,
+                                    model_type, learning_rate, n_iter, len(features),
+                                    weights=start_weights,
+                                    bias=start_bias,
+                                    optimizer=optimizer_obj,
+                                    regularization=regularization,
+                                    alpha=alpha,
+                                    callback=on_iteration,
+                                    dtype=dtype
+                                )
+                            history = init_history + history
+                        else:
+                            status_text.text("🏃‍♂️ Training in progress...")
+                            on_iteration = live_reporter(["cost"])
+                        
+                            # Training with progress updates
+                            weights, bias, history = timer.call(
+                                "Model / gradient loop", gradient_descent,
+                                X_train_norm, y_train, model_type, learning_rate, n_iter,
+                                profile=profile_training,
+                                weights=start_weights,
+                                bias=start_bias,
+                                optimizer=optimizer_obj,
+                                regularization=regularization,
+                                alpha=alpha,
+                                callback=on_iteration,
+                                checkpointer=checkpointer,
+                                n_threads=n_threads,
+                                backend=backend
+                            )
+                            history = init_history + history
+                    
+                        progress_bar.progress(90)
+                        status_text.text("📊 Evaluating model...")
+                    
+                        # Final prediction
+                        with timer.stage("Model / evaluation"):
+                            y_test_pred = predict(X_test_norm, weights, bias, model_type)
+                
+                    with timer.stage("Model / metrics"):
+                        metrics = compute_metrics(y_test, y_test_pred, model_type)
+                
+                    # Save to session state
+                    st.session_state["trained_model"] = {
+                        "weights": weights, 
+                        "bias": bias, 
+                        "X_mean": X_mean, 
+                        "X_std": X_std,
+                        "metrics": metrics,
+                        "features": features,
+                        "target": target,
+                        "type": model_type,
+                        "optimizer": optimizer,
+                        "optimizer_state": optimizer_obj.state_dict() if training_mode in ("Single run", "Cross-validation", "Distributed") else None
+                    }
+                    st.session_state["X_test"] = X_test_norm
+                    st.session_state["y_test"] = y_test
+                    st.session_state["y_pred"] = y_test_pred
+                    st.session_state["history"] = history
+                    memory.touch(st.session_state, ["X_test", "y_test", "y_pred", "sweep_leaderboard", "lr_comparison", "cv_results"])
+                    if training_mode != "Hyperparameter sweep":
+                        st.session_state.pop("sweep_leaderboard", None)
+                    if training_mode != "Compare learning rates":
+                        st.session_state.pop("lr_comparison", None)
+                    if training_mode != "Cross-validation":
+                        st.session_state.pop("cv_results", None)
+                    st.session_state["model_config"] = {
+                        "type": model_type,
+                        "features": features,
+                        "target": target,
+                        "learning_rate": learning_rate,
+                        "n_iter": n_iter,
+                        "optimizer": optimizer,
+                        "regularization": regularization,
+                        "alpha": alpha,
+                        "test_size": test_size,
+                        "data_source": data_source,
+                        "precision": precision,
+                        "warm_start": init_source
+                    }
+                
+                    # The run finished, its checkpoint is no longer needed
+                    if checkpointer is not None:
+                        checkpointer.discard()
+                
+                    progress_bar.progress(100)
+                    status_text.text("✅ Training completed successfully!")
+                
+                    st.success("🎉 Model trained successfully! Check the results in the 'Results' tab")
+                    if on_iteration is not None and on_iteration.stopped_at is not None:
+                        st.warning(f"⛔ The cost diverged, training was stopped at iteration {on_iteration.stopped_at}. "
+                                   "Try a lower learning rate")
+                
+                    # Quick performance overview
+                    if model_type == "Regression":
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.metric("📉 MSE", f"{metrics['mse']:.4f}")
+                        with col2:
+                            st.metric("📈 R²", f"{metrics['r2']:.4f}")
+                    else:
+                        st.metric("✅ Accuracy", f"{metrics['accuracy']:.2%}")
+                
+                except Exception as e:
+                    st.error(f"❌ Training error: {str(e)}")
+                    progress_bar.progress(0)
+                    status_text.text("")
+        
+        if "sweep_leaderboard" in st.session_state:
+            st.markdown("### 🏆 Sweep Leaderboard")
+            st.dataframe(pd.DataFrame(st.session_state["sweep_leaderboard"]), use_container_width=True, hide_index=True)
+        
+        if "cv_results" in st.session_state:
+            cv_results = st.session_state["cv_results"]
+            st.markdown(f"### 🔁 Cross-Validation ({cv_results['n_folds']} folds{', stratified' if cv_results['stratified'] else ''})")
+            col1, col2 = st.columns([1, 2])
+            with col1:
+                st.dataframe(pd.DataFrame(cv_results["summary"]), use_container_width=True, hide_index=True)
+            with col2:
+                st.dataframe(pd.DataFrame(cv_results["folds"]), use_container_width=True, hide_index=True)
@@ -0,0 +1,208 @@
+"""Preprocessing page."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from mlstudio import pipeline
+from views import theme
+
+# Page choices -> `mlstudio.pipeline` names
+IMPUTATIONS = {"Drop column": "drop", "Mean": "mean", "Median": "median", "Mode": "mode", "Custom value": "value"}
+SCALERS = {"StandardScaler (Z-score)": "standard", "MinMaxScaler (0-1)": "minmax"}
+
+
+def render():
+    plotly_template = theme.plotly_template()
+    
+    st.markdown('<div class="section-header"><h3>🛠️ Advanced Preprocessing</h3></div>', unsafe_allow_html=True)
+    
+    if "df" not in st.session_state:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 3rem;">
+            <h3 style="color: #f59e0b;">⚠️ Missing data</h3>
+            <p style="color: #6b7280;">Please upload a dataset first in the 'Data' tab</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        df = st.session_state["df"].copy()
+        
+        # Progress bar for preprocessing
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+        
+        # === HANDLING MISSING VALUES ===
+        st.markdown("### 🧼 Handling Missing Values")
+        
+        missing_df = df.isnull().sum()
+        missing_cols = missing_df[missing_df > 0].index.tolist()
+        
+        if not missing_cols:
+            st.success("🎉 No missing values detected in the dataset!")
+        else:
+            st.warning(f"⚠️ {len(missing_cols)} columns contain missing values")
+            
+            # Missing values visualization
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                missing_data = pd.DataFrame({
+                    'Column': missing_cols,
+                    'Missing Values': [missing_df[col] for col in missing_cols],
+                    'Percentage': [f"{(missing_df[col] / len(df) * 100):.1f}%" for col in missing_cols]
+                })
+                st.dataframe(missing_data, use_container_width=True)
+            
+            with col2:
+                fig_missing = px.bar(
+                    missing_data,
+                    x='Missing Values',
+                    y='Column',
+                    orientation='h',
+                    title="Missing Values by Column",
+                    color='Missing Values',
+                    color_continuous_scale="Reds",
+                    template=plotly_template
+                )
+                st.plotly_chart(fig_missing, use_container_width=True)
+            
+            # Treatment interface
+            with st.expander("🔧 Treatment Configuration", expanded=True):
+                method_map = {}
+                
+                for col in missing_cols:
+                    st.markdown(f"**📊 Column: `{col}`** ({missing_df[col]} missing values)")
+                    
+                    col1, col2 = st.columns([2, 1])
+                    with col1:
+                        method = st.selectbox(
+                            f"Method for {col}:",
+                            ["No action", "Drop column", "Mean", "Median", "Mode", "Custom value"],
+                            key=f"method_{col}"
+                        )
+                    
+                    with col2:
+                        if method == "Custom value":
+                            custom_value = st.text_input(f"Value for {col}:", key=f"custom_{col}")
+                            method_map[col] = (method, custom_value)
+                        else:
+                            method_map[col] = (method, None)
+                
+                if st.button("🚀 Apply treatment", type="primary"):
+                    progress_bar.progress(25)
+                    status_text.text("Processing missing values...")
+                    
+                    for col, (strategy, custom) in method_map.items():
+                        if strategy == "No action":
+                            continue
+                        if strategy == "Custom value" and pd.api.types.is_numeric_dtype(df[col]) \
+                                and pd.isna(pd.to_numeric(custom, errors="coerce")):
+                            st.error(f"❌ `{col}` is numeric: enter a number as custom value")
+                            continue
+                        applied = pipeline.fill_missing(df, col, IMPUTATIONS[strategy], custom)
+                        if strategy == "Drop column":
+                            st.info(f"🗑️ Column `{col}` dropped")
+                        elif strategy == "Custom value":
+                            st.success(f"✅ `{col}` filled with '{custom}'")
+                        elif applied:
+                            st.success(f"✅ `{col}` filled with {strategy.lower()}")
+        
+        progress_bar.progress(50)
+        
+        # === CATEGORICAL VARIABLE ENCODING ===
+        st.markdown("---")
+        st.markdown("### 🧠 Categorical Variable Encoding")
+        
+        cat_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
+        
+        if cat_cols:
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                selected_cat_cols = st.multiselect(
+                    "📌 Columns to encode (One-Hot Encoding):",
+                    cat_cols,
+                    default=cat_cols[:3] if len(cat_cols) > 3 else cat_cols
+                )
+                
+                if st.button("🔄 Apply Encoding", type="secondary"):
+                    if selected_cat_cols:
+                        progress_bar.progress(75)
+                        status_text.text("Encoding categorical variables...")
+                        
+                        df = pipeline.one_hot_encode(df, selected_cat_cols)
+
+                        st.success(f"✅ Encoding applied to: {', '.join(selected_cat_cols)}")
+            
+            with col2:
+                # Preview of encoding impact
+                if selected_cat_cols:
+                    total_new_cols = sum([df[col].nunique() - 1 for col in selected_cat_cols if col in df.columns])
+                    st.metric("New columns created", total_new_cols)
+                    st.metric("Current number of columns", len(df.columns))
+        else:
+            st.info("✅ No categorical variables detected")
+        
+        # === NORMALIZATION ===
+        st.markdown("---")
+        st.markdown("### 📏 Normalization of Numerical Variables")
+        
+        num_cols = df.select_dtypes(include=["int", "float"]).columns.tolist()
+        
+        if num_cols:
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                selected_num_cols = st.multiselect(
+                    "🧮 Variables to normalize:",
+                    num_cols,
+                    default=num_cols[:5] if len(num_cols) > 5 else num_cols
+                )
+                
+                scaler_choice = st.radio(
+                    "Normalization method:",
+                    ["None", "StandardScaler (Z-score)", "MinMaxScaler (0-1)"],
+                    horizontal=True
+                )
+                
+                if st.button("📊 Apply normalization", type="secondary"):
+                    if scaler_choice != "None" and selected_num_cols:
+                        progress_bar.progress(90)
+                        status_text.text("Normalizing variables...")
+                        
+                        pipeline.scale(df, selected_num_cols, SCALERS[scaler_choice])
+                        st.success(f"✅ {scaler_choice} successfully applied")
+            
+            with col2:
+                if selected_num_cols and len(selected_num_cols) > 0:
+                    # Preview of before/after statistics
+                    st.markdown("**📊 Overview of changes:**")
+                    sample_col = selected_num_cols[0]
+                    if sample_col in df.columns:
+                        st.metric("Min", f"{df[sample_col].min():.3f}")
+                        st.metric("Max", f"{df[sample_col].max():.3f}")
+                        st.metric("Mean", f"{df[sample_col].mean():.3f}")
+        
+        progress_bar.progress(100)
+        status_text.text("✅ Preprocessing completed!")
+        
+        # Save cleaned dataset
+        st.session_state["df_cleaned"] = df
+        
+        # Final summary
+        st.markdown("---")
+        st.markdown("### 📋 Summary of the Preprocessed Dataset")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("📦 Rows", f"{df.shape[0]:,}")
+        with col2:
+            st.metric("🧱 Columns", df.shape[1])
+        with col3:
+            st.metric("🔍 Missing values", df.isnull().sum().sum())
+        with col4:
+            memory_usage = df.memory_usage(deep=True).sum() / 1024**2
+            st.metric("💾 Size", f"{memory_usage:.1f} MB")
+        
+        # Final preview
+        st.markdown("**🔍 Preview of the preprocessed dataset:**")
+        st.dataframe(df.head(), use_container_width=True)
@@ -0,0 +1,400 @@
+"""Results page."""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from views import theme
+from views.figures import cached_figure, histogram
+
+
+def render():
+    plotly_template = theme.plotly_template()
+    
+    st.markdown('<div class="section-header"><h3>📈 Results Analysis</h3></div>', unsafe_allow_html=True)
+    
+    if "trained_model" not in st.session_state or "history" not in st.session_state:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 3rem;">
+            <h3 style="color: #f59e0b;">⚠️ No Trained Model</h3>
+            <p style="color: #6b7280;">Please train a model first in the 'Model' tab</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        model = st.session_state["trained_model"]
+        # Test arrays may have been evicted to stay within the memory budget
+        y_test = st.session_state.get("y_test")
+        y_pred = st.session_state.get("y_pred")
+        model_type = st.session_state["model_config"]["type"]
+        cost_history = st.session_state["history"]
+        features = st.session_state["model_config"]["features"]
+        X_mean = model["X_mean"]
+        X_std = model["X_std"]
+        weights = model["weights"]
+        metrics = model["metrics"]
+        
+        # Header with model information
+        st.markdown(f"""
+        <div class="modern-card">
+            <h3 style="color: #6366f1; margin-bottom: 1rem;">🤖 Model: {model_type}</h3>
+            <p style="color: #6b7280; margin: 0;">
+                <strong>Features:</strong> {', '.join(features[:3])}{'...' if len(features) > 3 else ''} 
+                | <strong>Target:</strong> {st.session_state["model_config"]["target"]}
+                | <strong>Test samples:</strong> {len(y_test) if y_test is not None else "n/a"}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # === PERFORMANCE METRICS ===
+        st.markdown("### 📊 Performance Metrics")
+        
+        if model_type == "Regression":
+            mse = metrics["mse"]
+            rmse = metrics["rmse"]
+            r2 = metrics["r2"]
+            mae = metrics["mae"]
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{mse:.4f}</div>
+                    <div class="metric-label">📉 MSE</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{rmse:.4f}</div>
+                    <div class="metric-label">📐 RMSE</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{r2:.4f}</div>
+                    <div class="metric-label">📈 R²</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col4:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{mae:.4f}</div>
+                    <div class="metric-label">📏 MAE</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        else:  # Classification
+            acc = metrics["accuracy"]
+            precision = metrics["precision"]
+            recall = metrics["recall"]
+            f1 = metrics["f1_score"]
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{acc:.2%}</div>
+                    <div class="metric-label">✅ Accuracy</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{precision:.2%}</div>
+                    <div class="metric-label">🎯 Precision</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{recall:.2%}</div>
+                    <div class="metric-label">📢 Recall</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col4:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-value">{f1:.2%}</div>
+                    <div class="metric-label">🏅 F1-Score</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if "cv_results" in st.session_state:
+            cv_results = st.session_state["cv_results"]
+            st.markdown(f"**🔁 Cross-validation over {cv_results['n_folds']} folds:** " + " | ".join(
+                f"{row['Metric']}: {row['Mean']:.4f} ± {row['Std']:.4f}" for row in cv_results["summary"]
+            ))
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # === VISUALIZATIONS ===
+        # Only the selected tab runs; the others are skipped until opened
+        tab1, tab2, tab3, tab4 = st.tabs(["📉 Convergence", "🔍 Predictions", "🧠 Features", "🎯 Matrix"],
+                                         key="results_tab", on_change="rerun")
+        
+        with tab1:
+            if tab1.open:
+                def cost_figure():
+                    # Modern convergence curve
+                    fig_cost = go.Figure()
+                    fig_cost.add_trace(go.Scatter(
+                        y=np.asarray(cost_history, dtype=float),
+                        mode='lines',
+                        line=dict(color='#6366f1', width=3),
+                        name='Cost',
+                        fill='tonexty',
+                        fillcolor='rgba(99, 102, 241, 0.1)'
+                    ))
+                    fig_cost.update_layout(
+                        title="📉 Cost Evolution During Training",
+                        xaxis_title="Iteration",
+                        yaxis_title="Cost",
+                        template=plotly_template,
+                        height=400,
+                        font=dict(family="Inter")
+                    )
+                    return fig_cost
+                
+                fig_cost = cached_figure("results/cost", cost_history, (), cost_figure)
+                st.plotly_chart(fig_cost, use_container_width=True)
+            
+                # Learning rate comparison overlay
+                if "lr_comparison" in st.session_state:
+                    comparison = st.session_state["lr_comparison"]
+                    fig_compare = go.Figure()
+                    for rate, curve in zip(comparison["learning_rates"], comparison["histories"]):
+                        fig_compare.add_trace(go.Scatter(
+                            y=np.asarray(curve, dtype=float),
+                            mode='lines',
+                            line=dict(width=2),
+                            name=f"lr = {rate}"
+                        ))
+                    fig_compare.update_layout(
+                        title="📉 Cost Evolution by Learning Rate",
+                        xaxis_title="Iteration",
+                        yaxis_title="Cost",
+                        template=plotly_template,
+                        height=400,
+                        font=dict(family="Inter")
+                    )
+                    st.plotly_chart(fig_compare, use_container_width=True)
+            
+                # Convergence statistics
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Initial Cost", f"{cost_history[0]:.6f}")
+                with col2:
+                    st.metric("Final Cost", f"{cost_history[-1]:.6f}")
+                with col3:
+                    improvement = ((cost_history[0] - cost_history[-1]) / cost_history[0]) * 100
+                    st.metric("Improvement", f"{improvement:.2f}%")
+        
+        with tab2:
+            if tab2.open:
+                if y_test is None:
+                    st.info("ℹ️ Test predictions were released to stay within the session memory budget. Train the model again to see them")
+                else:
+                    def prediction_figure():
+                        # Predictions vs actual graph
+                        fig_pred = go.Figure()
+            
+                        # Perfect prediction reference line
+                        min_val = min(y_test.min(), y_pred.min())
+                        max_val = max(y_test.max(), y_pred.max())
+                        fig_pred.add_trace(go.Scatter(
+                            x=[min_val, max_val],
+                            y=[min_val, max_val],
+                            mode='lines',
+                            line=dict(color='red', dash='dash', width=2),
+                            name='Perfect Prediction'
+                        ))
+            
+                        # Prediction points
+                        fig_pred.add_trace(go.Scatter(
+                            x=y_test.flatten(),
+                            y=y_pred.flatten(),
+                            mode='markers',
+                            marker=dict(
+                                color='#6366f1',
+                                size=8,
+                                opacity=0.7,
+                                line=dict(color='white', width=1)
+                            ),
+                            name='Predictions'
+                        ))
+            
+                        fig_pred.update_layout(
+                            title="🔍 Predictions vs Actual Values",
+                            xaxis_title="Actual Values",
+                            yaxis_title="Predictions",
+                            template=plotly_template,
+                            height=400,
+                            font=dict(family="Inter")
+                        )
+                        return fig_pred
+                    
+                    fig_pred = cached_figure("results/predictions", (y_test, y_pred), (), prediction_figure)
+                    st.plotly_chart(fig_pred, use_container_width=True)
+        
+        with tab3:
+            if tab3.open:
+                # Feature importance
+                importance_df = pd.DataFrame({
+                    'Feature': features,
+                    'Weight': weights.flatten(),
+                    'Importance': np.abs(weights.flatten())
+                }).sort_values('Importance', ascending=True)
+            
+                def importance_figure():
+                    fig_weights = px.bar(
+                        importance_df,
+                        x='Importance',
+                        y='Feature',
+                        orientation='h',
+                        title="🧠 Feature Importance (Absolute Weight Values)",
+                        color='Importance',
+                        color_continuous_scale="viridis",
+                        template=plotly_template
+                    )
+                    fig_weights.update_layout(height=400)
+                    return fig_weights
+                
+                fig_weights = cached_figure("results/features", weights, tuple(features), importance_figure)
+                st.plotly_chart(fig_weights, use_container_width=True)
+            
+                # Detailed table
+                st.markdown("**📊 Weight Details:**")
+                st.dataframe(importance_df.sort_values('Importance', ascending=False), use_container_width=True)
+        
+        with tab4:
+            if tab4.open:
+                if model_type == "Classification":
+                    # Modern confusion matrix
+                    cm = metrics["confusion_matrix"]
+                
+                    fig_cm = px.imshow(
+                        cm,
+                        text_auto=True,
+                        aspect="auto",
+                        color_continuous_scale="Blues",
+                        title="🎯 Confusion Matrix",
+                        template=plotly_template
+                    )
+                    fig_cm.update_layout(
+                        xaxis_title="Predictions",
+                        yaxis_title="Actual Values",
+                        height=400
+                    )
+                    st.plotly_chart(fig_cm, use_container_width=True)
+                elif y_test is None:
+                    st.info("ℹ️ Test predictions were released to stay within the session memory budget. Train the model again to see them")
+                else:
+                    def error_figure():
+                        # For regression, show error distribution
+                        errors = y_test.flatten() - y_pred.flatten()
+                
+                        fig_errors = histogram(
+                            errors,
+                            nbins=30,
+                            title="📊 Prediction Error Distribution",
+                            color="#6366f1",
+                            template=plotly_template
+                        )
+                        fig_errors.update_layout(
+                            xaxis_title="Error (Actual - Predicted)",
+                            yaxis_title="Frequency",
+                            height=400
+                        )
+                        return fig_errors
+                    
+                    fig_errors = cached_figure("results/errors", (y_test, y_pred), (), error_figure)
+                    st.plotly_chart(fig_errors, use_container_width=True)
+        
+        # === INTERACTIVE PREDICTION ===
+        st.markdown("---")
+        st.markdown("### 🔮 Interactive Prediction")
+        
+        with st.expander("✨ Test your model with new data", expanded=True):
+            with st.form("prediction_form"):
+                st.markdown("**📝 Enter feature values:**")
+                
+                # Organize inputs in columns
+                n_cols = min(3, len(features))
+                cols = st.columns(n_cols)
+                user_input = []
+                
+                for i, feature in enumerate(features):
+                    col = cols[i % n_cols]
+                    with col:
+                        value = st.number_input(
+                            f"🔢 {feature}",
+                            key=f"input_{feature}",
+                            help=f"Value for feature '{feature}'"
+                        )
+                        user_input.append(value)
+                
+                submitted = st.form_submit_button("🚀 Make Prediction", type="primary", use_container_width=True)
+            
+            if submitted:
+                try:
+                    input_array = np.array(user_input).reshape(1, -1)
+                    input_array_norm = (input_array - X_mean) / X_std
+                    
+                    if model_type == "Regression":
+                        prediction = np.dot(input_array_norm, weights) + model["bias"]
+                        
+                        st.markdown("""
+                        <div class="modern-card" style="text-align: center;">
+                            <h3 style="color: #10b981; margin-bottom: 1rem;">💡 Prediction Result</h3>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        col1, col2, col3 = st.columns([1, 2, 1])
+                        with col2:
+                            st.markdown(f"""
+                            <div class="metric-card" style="padding: 2rem;">
+                                <div style="font-size: 2rem; font-weight: 700; color: #6366f1;">{prediction[0][0]:.4f}</div>
+                                <div style="font-size: 1rem; color: #6b7280;">Predicted Value</div>
+                            </div>
+                            """, unsafe_allow_html=True)
+                    
+                    else:  # Classification
+                        z = np.dot(input_array_norm, weights) + model["bias"]
+                        proba = 1 / (1 + np.exp(-z))
+                        classe = 1 if proba >= 0.5 else 0
+                        
+                        st.markdown("""
+                        <div class="modern-card" style="text-align: center;">
+                            <h3 style="color: #10b981; margin-bottom: 1rem;">🎯 Classification Result</h3>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.markdown(f"""
+                            <div class="metric-card" style="padding: 2rem;">
+                                <div style="font-size: 2rem; font-weight: 700; color: #6366f1;">{classe}</div>
+                                <div style="font-size: 1rem; color: #6b7280;">Predicted Class</div>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        
+                        with col2:
+                            st.markdown(f"""
+                            <div class="metric-card" style="padding: 2rem;">
+                                <div style="font-size: 2rem; font-weight: 700; color: #8b5cf6;">{proba[0][0]:.2%}</div>
+                                <div style="font-size: 1rem; color: #6b7280;">Probability</div>
+                            </div>
+                            """, unsafe_allow_html=True)
+                
+                except Exception as e:
+                    st.error(f"❌ Prediction error: {str(e)}")
@@ -0,0 +1,882 @@
+"""Styles of the light and dark themes."""
+import streamlit as st
+
+# Custom CSS for a modern and elegant design
+DARK_CSS = """
+    <style>
+    /* Import Google Fonts */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+    
+    /* Variables CSS pour le mode sombre */
+    :root {
+        --primary-color: #818cf8;
+        --secondary-color: #a78bfa;
+        --accent-color: #22d3ee;
+        --success-color: #34d399;
+        --warning-color: #fbbf24;
+        --error-color: #f87171;
+        --background-gradient: linear-gradient(135deg, #4338ca 0%, #7c3aed 100%);
+        --card-shadow: 0 10px 25px rgba(0,0,0,0.3);
+        --border-radius: 12px;
+        --bg-primary: #0f172a;
+        --bg-secondary: #1e293b;
+        --bg-tertiary: #334155;
+        --text-primary: #f1f5f9;
+        --text-secondary: #cbd5e1;
+        --text-muted: #94a3b8;
+        --border-color: #475569;
+    }
+    
+    /* Force dark mode on all elements */
+    .stApp, .main, .block-container {
+        background-color: var(--bg-primary) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Global text styling */
+    * {
+        color: var(--text-primary) !important;
+        font-family: 'Inter', sans-serif !important;
+    }
+    
+    /* Sidebar styling */
+    .css-1d391kg, .css-1cypcdb, .css-17eq0hr, section[data-testid="stSidebar"] {
+        background-color: var(--bg-secondary) !important;
+    }
+    
+    section[data-testid="stSidebar"] > div {
+        background-color: var(--bg-secondary) !important;
+    }
+    
+    /* Sidebar content */
+    .css-1d391kg {
+        background: linear-gradient(180deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%) !important;
+    }
+
+    /* Headers and text */
+    h1, h2, h3, h4, h5, h6 {
+        color: var(--text-primary) !important;
+    }
+    
+    p, span, div, label, .stMarkdown {
+        color: var(--text-secondary) !important;
+    }
+
+    /* Header principal avec gradient sombre */
+    .main-header {
+        background: var(--background-gradient) !important;
+        color: white !important;
+        padding: 2rem;
+        border-radius: var(--border-radius);
+        margin-bottom: 2rem;
+        text-align: center;
+        box-shadow: var(--card-shadow);
+    }
+    
+    .main-header h1 {
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+        text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+        color: white !important;
+    }
+    
+    .main-header p {
+        font-size: 1.1rem;
+        opacity: 0.9;
+        font-weight: 300;
+        color: white !important;
+    }
+
+    /* Welcome page specific styles */
+    .welcome-hero {
+        background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%) !important;
+        color: var(--text-primary) !important;
+        padding: 3rem;
+        border-radius: var(--border-radius);
+        margin-bottom: 2rem;
+        text-align: center;
+        box-shadow: var(--card-shadow);
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .welcome-hero::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: linear-gradient(45deg, rgba(129, 140, 248, 0.1) 0%, rgba(167, 139, 250, 0.1) 100%);
+        z-index: 1;
+    }
+    
+    .welcome-hero > * {
+        position: relative;
+        z-index: 2;
+    }
+    
+    .feature-card {
+        background: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        padding: 2rem;
+        border-radius: var(--border-radius);
+        box-shadow: var(--card-shadow);
+        border: 1px solid var(--border-color) !important;
+        margin-bottom: 1.5rem;
+        transition: all 0.3s ease;
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .feature-card::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 4px;
+        height: 100%;
+        background: linear-gradient(180deg, var(--primary-color) 0%, var(--secondary-color) 100%);
+        transition: width 0.3s ease;
+    }
+    
+    .feature-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 20px 40px rgba(0,0,0,0.4);
+    }
+    
+    .feature-card:hover::before {
+        width: 100%;
+        opacity: 0.1;
+    }
+    
+    .feature-icon {
+        font-size: 3rem;
+        margin-bottom: 1rem;
+        display: block;
+        background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    }
+    
+    .stats-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+        gap: 1.5rem;
+        margin: 2rem 0;
+    }
+    
+    .stat-card {
+        background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%) !important;
+        color: var(--text-primary) !important;
+        padding: 1.5rem;
+        border-radius: var(--border-radius);
+        text-align: center;
+        border: 1px solid var(--border-color) !important;
+        transition: transform 0.2s ease;
+    }
+    
+    .stat-card:hover {
+        transform: scale(1.05);
+    }
+    
+    .stat-number {
+        font-size: 2rem;
+        font-weight: 700;
+        color: var(--primary-color) !important;
+        display: block;
+        margin-bottom: 0.5rem;
+    }
+    
+    .stat-label {
+        font-size: 0.875rem;
+        color: var(--text-muted) !important;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    /* Cards modernes pour mode sombre */
+    .modern-card {
+        background: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        padding: 1.5rem;
+        border-radius: var(--border-radius);
+        box-shadow: var(--card-shadow);
+        border: 1px solid var(--border-color) !important;
+        margin-bottom: 1rem;
+        transition: transform 0.2s ease, box-shadow 0.2s ease;
+    }
+    
+    .modern-card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 15px 35px rgba(0,0,0,0.4);
+    }
+    
+    .modern-card h4 {
+        color: var(--text-primary) !important;
+        margin-bottom: 1rem;
+    }
+    
+    .modern-card p, .modern-card li {
+        color: var(--text-secondary) !important;
+    }
+
+    /* Métriques stylées pour mode sombre */
+    .metric-container {
+        display: flex;
+        justify-content: space-around;
+        margin: 1rem 0;
+    }
+    
+    .metric-card {
+        background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%) !important;
+        color: var(--text-primary) !important;
+        padding: 1rem;
+        border-radius: var(--border-radius);
+        text-align: center;
+        min-width: 120px;
+        border: 1px solid var(--border-color) !important;
+    }
+    
+    .metric-value {
+        font-size: 1.5rem;
+        font-weight: 700;
+        color: var(--primary-color) !important;
+    }
+    
+    .metric-label {
+        font-size: 0.875rem;
+        color: var(--text-muted) !important;
+        margin-top: 0.25rem;
+    }
+
+    /* Boutons modernes pour mode sombre */
+    .stButton > button {
+        background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%) !important;
+        color: white !important;
+        border: none !important;
+        border-radius: var(--border-radius);
+        padding: 0.75rem 1.5rem;
+        font-weight: 600;
+        transition: all 0.2s ease;
+        box-shadow: 0 4px 12px rgba(129, 140, 248, 0.3);
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-1px);
+        box-shadow: 0 6px 20px rgba(129, 140, 248, 0.4);
+        background: linear-gradient(135deg, var(--secondary-color) 0%, var(--primary-color) 100%) !important;
+    }
+
+    /* DataFrame et tableaux - Updated selectors */
+    .stDataFrame, .stDataFrame div, [data-testid="stDataFrame"] {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 1px solid var(--border-color) !important;
+    }
+    
+    .stDataFrame table, [data-testid="stDataFrame"] table {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    .stDataFrame th, [data-testid="stDataFrame"] th {
+        background-color: var(--bg-tertiary) !important;
+        color: var(--text-primary) !important;
+        border-bottom: 1px solid var(--border-color) !important;
+    }
+    
+    .stDataFrame td, [data-testid="stDataFrame"] td {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-secondary) !important;
+        border-bottom: 1px solid var(--border-color) !important;
+    }
+
+    /* st.metric widget - Updated selectors */
+    [data-testid="stMetric"], .stMetric {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 1px solid var(--border-color) !important;
+        border-radius: var(--border-radius) !important;
+        padding: 1rem !important;
+    }
+    
+    [data-testid="stMetric"] > div, .stMetric > div {
+        color: var(--text-primary) !important;
+    }
+    
+    [data-testid="stMetric"] label, .stMetric label {
+        color: var(--text-secondary) !important;
+    }
+
+    /* Formulaires : selects, sliders, inputs - Updated selectors */
+    .stSelectbox > div > div, [data-testid="stSelectbox"] > div > div {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 2px solid var(--border-color) !important;
+        border-radius: var(--border-radius);
+    }
+    
+    .stSelectbox > div > div > div, [data-testid="stSelectbox"] > div > div > div {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    .stMultiSelect > div > div, [data-testid="stMultiSelect"] > div > div {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 2px solid var(--border-color) !important;
+    }
+    
+    .stRadio > div, [data-testid="stRadio"] > div {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    .stRadio label, [data-testid="stRadio"] label {
+        color: var(--text-primary) !important;
+    }
+    
+    .stCheckbox > label, [data-testid="stCheckbox"] > label {
+        color: var(--text-primary) !important;
+    }
+    
+    .stNumberInput > div > div > input, [data-testid="stNumberInput"] > div > div > input {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 2px solid var(--border-color) !important;
+    }
+    
+    .stTextInput > div > div > input, [data-testid="stTextInput"] > div > div > input {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 2px solid var(--border-color) !important;
+    }
+
+    .stSlider > div, [data-testid="stSlider"] > div {
+        color: var(--text-primary) !important;
+    }
+    
+    .stSlider > div > div > div > div, [data-testid="stSlider"] > div > div > div > div {
+        background-color: var(--primary-color) !important;
+    }
+
+    /* File uploader - Updated selectors */
+    .stFileUploader > div, [data-testid="stFileUploader"] > div {
+        background-color: var(--bg-secondary) !important;
+        border: 2px dashed var(--border-color) !important;
+        border-radius: var(--border-radius);
+    }
+    
+    .stFileUploader label, [data-testid="stFileUploader"] label {
+        color: var(--text-primary) !important;
+    }
+
+    /* Alertes stylées pour mode sombre - Updated selectors */
+    .stAlert, [data-testid="stAlert"] {
+        border-radius: var(--border-radius);
+        border: none;
+        box-shadow: var(--card-shadow);
+    }
+    
+    .stSuccess, [data-testid="stSuccess"] {
+        background-color: rgba(52, 211, 153, 0.1) !important;
+        color: var(--success-color) !important;
+        border-left: 4px solid var(--success-color) !important;
+    }
+    
+    .stError, [data-testid="stError"] {
+        background-color: rgba(248, 113, 113, 0.1) !important;
+        color: var(--error-color) !important;
+        border-left: 4px solid var(--error-color) !important;
+    }
+    
+    .stWarning, [data-testid="stWarning"] {
+        background-color: rgba(251, 191, 36, 0.1) !important;
+        color: var(--warning-color) !important;
+        border-left: 4px solid var(--warning-color) !important;
+    }
+    
+    .stInfo, [data-testid="stInfo"] {
+        background-color: rgba(34, 211, 238, 0.1) !important;
+        color: var(--accent-color) !important;
+        border-left: 4px solid var(--accent-color) !important;
+    }
+
+    /* Progress bars - Updated selectors */
+    .stProgress > div > div, [data-testid="stProgress"] > div > div {
+        background: linear-gradient(90deg, var(--primary-color) 0%, var(--accent-color) 100%) !important;
+        border-radius: 10px;
+    }
+
+    /* Section headers */
+    .section-header {
+        display: flex;
+        align-items: center;
+        margin: 2rem 0 1rem 0;
+        padding-bottom: 0.5rem;
+        border-bottom: 2px solid var(--border-color);
+    }
+    
+    .section-header h3 {
+        color: var(--primary-color) !important;
+        font-weight: 600;
+        margin: 0;
+    }
+
+    /* Tabs - Updated selectors */
+    .stTabs [data-baseweb="tab-list"], [data-testid="stTabs"] [data-baseweb="tab-list"] {
+        background-color: var(--bg-secondary) !important;
+        border-radius: var(--border-radius);
+    }
+    
+    .stTabs [data-baseweb="tab"], [data-testid="stTabs"] [data-baseweb="tab"] {
+        background-color: transparent !important;
+        color: var(--text-secondary) !important;
+        border-radius: var(--border-radius);
+    }
+    
+    .stTabs [aria-selected="true"], [data-testid="stTabs"] [aria-selected="true"] {
+        background-color: var(--primary-color) !important;
+        color: white !important;
+    }
+
+    /* Expander - Updated selectors */
+    .streamlit-expanderHeader, [data-testid="stExpander"] .streamlit-expanderHeader {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 1px solid var(--border-color) !important;
+        border-radius: var(--border-radius);
+    }
+    
+    .streamlit-expanderContent, [data-testid="stExpander"] .streamlit-expanderContent {
+        background-color: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 1px solid var(--border-color) !important;
+        border-top: none !important;
+    }
+
+    /* Tooltips - Updated selectors */
+    div[data-testid="stTooltip"] {
+        background-color: var(--bg-tertiary) !important;
+        color: var(--text-primary) !important;
+        border-radius: 6px !important;
+        font-size: 0.8rem !important;
+        border: 1px solid var(--border-color) !important;
+    }
+
+    /* Download button - Updated selectors */
+    .stDownloadButton > button, [data-testid="stDownloadButton"] > button {
+        background: linear-gradient(135deg, var(--success-color) 0%, var(--accent-color) 100%) !important;
+        color: white !important;
+        border: none !important;
+        border-radius: var(--border-radius);
+        font-weight: 600;
+    }
+
+    /* Form - Updated selectors */
+    .stForm, [data-testid="stForm"] {
+        background-color: var(--bg-secondary) !important;
+        border: 1px solid var(--border-color) !important;
+        border-radius: var(--border-radius);
+        padding: 1rem;
+    }
+
+    /* Toggle/Checkbox styling */
+    .stToggle > div, [data-testid="stToggle"] > div {
+        background-color: var(--bg-secondary) !important;
+    }
+
+    /* Column containers */
+    .css-1r6slb0, .css-12w0qpk {
+        background-color: var(--bg-primary) !important;
+    }
+
+    /* Additional comprehensive styling */
+    .element-container, .stMarkdown, .stText {
+        color: var(--text-primary) !important;
+    }
+
+    /* Plotly charts background */
+    .js-plotly-plot {
+        background-color: var(--bg-secondary) !important;
+    }
+
+    /* Animation pour les éléments */
+    @keyframes fadeInUp {
+        from {
+            opacity: 0;
+            transform: translateY(20px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
+    }
+    
+    .fade-in {
+        animation: fadeInUp 0.6s ease-out;
+    }
+    
+    @keyframes pulse {
+        0%, 100% {
+            transform: scale(1);
+        }
+        50% {
+            transform: scale(1.05);
+        }
+    }
+    
+    .pulse {
+        animation: pulse 2s infinite;
+    }
+    
+    /* Responsive design */
+    @media (max-width: 768px) {
+        .main-header h1, .welcome-hero h1 {
+            font-size: 2rem;
+        }
+        
+        .metric-container, .stats-grid {
+            flex-direction: column;
+            gap: 1rem;
+        }
+        
+        .feature-card {
+            padding: 1.5rem;
+        }
+        
+        .feature-icon {
+            font-size: 2.5rem;
+        }
+    }
+    </style>
+    """
+
+LIGHT_CSS = """
+    <style>
+        /* Import Google Fonts */
+        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+        
+        /* Variables CSS pour la cohérence */
+        :root {
+            --primary-color: #6366f1;
+            --secondary-color: #8b5cf6;
+            --accent-color: #06b6d4;
+            --success-color: #10b981;
+            --warning-color: #f59e0b;
+            --error-color: #ef4444;
+            --background-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            --card-shadow: 0 10px 25px rgba(0,0,0,0.1);
+            --border-radius: 12px;
+        }
+        
+        /* Styles globaux */
+        .main {
+            font-family: 'Inter', sans-serif;
+        }
+        
+        /* Header principal avec gradient */
+        .main-header {
+            background: var(--background-gradient);
+            padding: 2rem;
+            border-radius: var(--border-radius);
+            margin-bottom: 2rem;
+            color: white;
+            text-align: center;
+            box-shadow: var(--card-shadow);
+        }
+        
+        .main-header h1 {
+            font-size: 2.5rem;
+            font-weight: 700;
+            margin-bottom: 0.5rem;
+            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+        }
+        
+        .main-header p {
+            font-size: 1.1rem;
+            opacity: 0.9;
+            font-weight: 300;
+        }
+        
+        /* Welcome page specific styles */
+        .welcome-hero {
+            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
+            padding: 3rem;
+            border-radius: var(--border-radius);
+            margin-bottom: 2rem;
+            text-align: center;
+            box-shadow: var(--card-shadow);
+            position: relative;
+            overflow: hidden;
+        }
+        
+        .welcome-hero::before {
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            bottom: 0;
+            background: linear-gradient(45deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
+            z-index: 1;
+        }
+        
+        .welcome-hero > * {
+            position: relative;
+            z-index: 2;
+        }
+        
+        .feature-card {
+            background: white;
+            padding: 2rem;
+            border-radius: var(--border-radius);
+            box-shadow: var(--card-shadow);
+            border: 1px solid #e5e7eb;
+            margin-bottom: 1.5rem;
+            transition: all 0.3s ease;
+            position: relative;
+            overflow: hidden;
+        }
+        
+        .feature-card::before {
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 4px;
+            height: 100%;
+            background: linear-gradient(180deg, var(--primary-color) 0%, var(--secondary-color) 100%);
+            transition: width 0.3s ease;
+        }
+        
+        .feature-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
+        }
+        
+        .feature-card:hover::before {
+            width: 100%;
+            opacity: 0.1;
+        }
+        
+        .feature-icon {
+            font-size: 3rem;
+            margin-bottom: 1rem;
+            display: block;
+            background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+        }
+        
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1.5rem;
+            margin: 2rem 0;
+        }
+        
+        .stat-card {
+            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
+            padding: 1.5rem;
+            border-radius: var(--border-radius);
+            text-align: center;
+            border: 1px solid #cbd5e1;
+            transition: transform 0.2s ease;
+        }
+        
+        .stat-card:hover {
+            transform: scale(1.05);
+        }
+        
+        .stat-number {
+            font-size: 2rem;
+            font-weight: 700;
+            color: var(--primary-color);
+            display: block;
+            margin-bottom: 0.5rem;
+        }
+        
+        .stat-label {
+            font-size: 0.875rem;
+            color: #64748b;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+        
+        /* Cards modernes */
+        .modern-card {
+            background: white;
+            padding: 1.5rem;
+            border-radius: var(--border-radius);
+            box-shadow: var(--card-shadow);
+            border: 1px solid #e5e7eb;
+            margin-bottom: 1rem;
+            transition: transform 0.2s ease, box-shadow 0.2s ease;
+        }
+        
+        .modern-card:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 15px 35px rgba(0,0,0,0.15);
+        }
+        
+        /* Métriques stylées */
+        .metric-container {
+            display: flex;
+            justify-content: space-around;
+            margin: 1rem 0;
+        }
+        
+        .metric-card {
+            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
+            padding: 1rem;
+            border-radius: var(--border-radius);
+            text-align: center;
+            min-width: 120px;
+            border: 1px solid #cbd5e1;
+        }
+        
+        .metric-value {
+            font-size: 1.5rem;
+            font-weight: 700;
+            color: var(--primary-color);
+        }
+        
+        .metric-label {
+            font-size: 0.875rem;
+            color: #64748b;
+            margin-top: 0.25rem;
+        }
+        
+        /* Boutons modernes */
+        .stButton > button {
+            background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
+            color: white;
+            border: none;
+            border-radius: var(--border-radius);
+            padding: 0.75rem 1.5rem;
+            font-weight: 600;
+            transition: all 0.2s ease;
+            box-shadow: 0 4px 12px rgba(99, 102, 241, 0.3);
+        }
+        
+        .stButton > button:hover {
+            transform: translateY(-1px);
+            box-shadow: 0 6px 20px rgba(99, 102, 241, 0.4);
+        }
+        
+        /* Sidebar moderne */
+        .css-1d391kg {
+            background: linear-gradient(180deg, #f8fafc 0%, #e2e8f0 100%);
+        }
+        
+        /* Alertes stylées */
+        .stAlert {
+            border-radius: var(--border-radius);
+            border: none;
+            box-shadow: var(--card-shadow);
+        }
+        
+        /* Formulaires */
+        .stSelectbox > div > div {
+            border-radius: var(--border-radius);
+            border: 2px solid #e5e7eb;
+            transition: border-color 0.2s ease;
+        }
+        
+        .stSelectbox > div > div:focus-within {
+            border-color: var(--primary-color);
+            box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1);
+        }
+        
+        /* Dataframes */
+        .stDataFrame {
+            border-radius: var(--border-radius);
+            overflow: hidden;
+            box-shadow: var(--card-shadow);
+        }
+        
+        /* Progress bars */
+        .stProgress > div > div {
+            background: linear-gradient(90deg, var(--primary-color) 0%, var(--accent-color) 100%);
+            border-radius: 10px;
+        }
+        
+        /* Section headers */
+        .section-header {
+            display: flex;
+            align-items: center;
+            margin: 2rem 0 1rem 0;
+            padding-bottom: 0.5rem;
+            border-bottom: 2px solid #e5e7eb;
+        }
+        
+        .section-header h3 {
+            color: var(--primary-color);
+            font-weight: 600;
+            margin: 0;
+        }
+        
+        /* Animation pour les éléments */
+        @keyframes fadeInUp {
+            from {
+                opacity: 0;
+                transform: translateY(20px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+        
+        .fade-in {
+            animation: fadeInUp 0.6s ease-out;
+        }
+        
+        @keyframes pulse {
+            0%, 100% {
+                transform: scale(1);
+            }
+            50% {
+                transform: scale(1.05);
+            }
+        }
+        
+        .pulse {
+            animation: pulse 2s infinite;
+        }
+        
+        /* Responsive design */
+        @media (max-width: 768px) {
+            .main-header h1, .welcome-hero h1 {
+                font-size: 2rem;
+            }
+            
+            .metric-container, .stats-grid {
+                flex-direction: column;
+                gap: 1rem;
+            }
+            
+            .feature-card {
+                padding: 1.5rem;
+            }
+            
+            .feature-icon {
+                font-size: 2.5rem;
+            }
+        }
+    </style>
+    """
+
+
+def apply(dark_mode):
+    st.markdown(DARK_CSS if dark_mode else LIGHT_CSS, unsafe_allow_html=True)
+
+
+def plotly_template():
+    # Set Plotly theme based on the selected mode
+    return "plotly_dark" if st.session_state.get("dark_mode") else "plotly_white"
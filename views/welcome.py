@@ -0,0 +1,237 @@
+"""Welcome page."""
+import streamlit as st
+
+
+def render():
+    # Hero Section
+    st.markdown("""
+    <div class="welcome-hero fade-in">
+        <h1 style="font-size: 3.5rem; font-weight: 800; margin-bottom: 1rem; background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">
+            🚀 ML Visual Studio
+        </h1>
+        <p style="font-size: 1.3rem; margin-bottom: 2rem; opacity: 0.8;">
+            Next-generation artificial intelligence platform for data analysis, modeling, and visualization
+        </p>
+        <p style="font-size: 1rem; opacity: 0.7; max-width: 600px; margin: 0 auto;">
+            Transform your data into intelligent insights with our comprehensive machine learning toolkit. 
+            From data preprocessing to model deployment, everything you need in one modern interface.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Statistics Section
+    st.markdown("### 📊 Platform Capabilities")
+    
+    st.markdown("""
+    <div class="stats-grid">
+        <div class="stat-card">
+            <span class="stat-number">6</span>
+            <div class="stat-label">Core Modules</div>
+        </div>
+        <div class="stat-card">
+            <span class="stat-number">CSV</span>
+            <div class="stat-label">Data Formats</div>
+        </div>
+        <div class="stat-card">
+            <span class="stat-number">2</span>
+            <div class="stat-label">ML Algorithms</div>
+        </div>
+        <div class="stat-card">
+            <span class="stat-number">100%</span>
+            <div class="stat-label">Visual Interface</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Features Section
+    st.markdown("### ✨ Key Features")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="feature-card fade-in">
+            <span class="feature-icon">📊</span>
+            <h3 style="color: #374151; margin-bottom: 1rem;">Data Management</h3>
+            <p style="color: #6b7280; line-height: 1.6;">
+                Import, explore, and analyze your datasets with powerful visualization tools. 
+                Support for CSV files with intelligent data type detection and missing value analysis.
+            </p>
+            <ul style="color: #6b7280; margin-top: 1rem;">
+                <li>Automatic data profiling</li>
+                <li>Interactive data preview</li>
+                <li>Smart data type detection</li>
+                <li>Missing value visualization</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-card fade-in">
+            <span class="feature-icon">🛠️</span>
+            <h3 style="color: #374151; margin-bottom: 1rem;">Advanced Preprocessing</h3>
+            <p style="color: #6b7280; line-height: 1.6;">
+                Prepare your data for machine learning with comprehensive preprocessing tools. 
+                Handle missing values, encode categorical variables, and normalize features.
+            </p>
+            <ul style="color: #6b7280; margin-top: 1rem;">
+                <li>Missing value imputation</li>
+                <li>One-hot encoding</li>
+                <li>Feature scaling & normalization</li>
+                <li>Data transformation pipeline</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-card fade-in">
+            <span class="feature-icon">📈</span>
+            <h3 style="color: #374151; margin-bottom: 1rem;">Model Performance</h3>
+            <p style="color: #6b7280; line-height: 1.6;">
+                Comprehensive model evaluation with detailed metrics, visualizations, and performance analysis. 
+                Track training progress and validate model accuracy.
+            </p>
+            <ul style="color: #6b7280; margin-top: 1rem;">
+                <li>Real-time training metrics</li>
+                <li>Performance visualizations</li>
+                <li>Feature importance analysis</li>
+                <li>Interactive predictions</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="feature-card fade-in">
+            <span class="feature-icon">📋</span>
+            <h3 style="color: #374151; margin-bottom: 1rem;">Interactive Dashboard</h3>
+            <p style="color: #6b7280; line-height: 1.6;">
+                Explore your data through beautiful, interactive visualizations. 
+                Create charts, analyze correlations, and discover patterns in your dataset.
+            </p>
+            <ul style="color: #6b7280; margin-top: 1rem;">
+                <li>Dynamic chart generation</li>
+                <li>Correlation analysis</li>
+                <li>Distribution visualization</li>
+                <li>Statistical summaries</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-card fade-in">
+            <span class="feature-icon">🧠</span>
+            <h3 style="color: #374151; margin-bottom: 1rem;">Machine Learning</h3>
+            <p style="color: #6b7280; line-height: 1.6;">
+                Train powerful machine learning models with custom-built algorithms. 
+                Support for both regression and classification tasks with hyperparameter tuning.
+            </p>
+            <ul style="color: #6b7280; margin-top: 1rem;">
+                <li>Linear & Logistic Regression</li>
+                <li>Custom hyperparameters</li>
+                <li>Training visualization</li>
+                <li>Model persistence</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-card fade-in">
+            <span class="feature-icon">📦</span>
+            <h3 style="color: #374151; margin-bottom: 1rem;">Export & Deployment</h3>
+            <p style="color: #6b7280; line-height: 1.6;">
+                Export your models, data, and results in multiple formats. 
+                Generate comprehensive reports and download everything as a convenient ZIP archive.
+            </p>
+            <ul style="color: #6b7280; margin-top: 1rem;">
+                <li>Model serialization (PKL)</li>
+                <li>Data export (CSV)</li>
+                <li>Results export (JSON)</li>
+                <li>Automated reports</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Getting Started Section
+    st.markdown("---")
+    st.markdown("### 🚀 Getting Started")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 2rem;">
+            <h2 style="color: #6366f1; margin-bottom: 1rem;">1️⃣</h2>
+            <h4 style="color: #374151; margin-bottom: 1rem;">Upload Data</h4>
+            <p style="color: #6b7280; font-size: 0.9rem;">
+                Start by uploading your CSV dataset in the <strong>Data</strong> section. 
+                Our platform will automatically analyze and profile your data.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 2rem;">
+            <h2 style="color: #8b5cf6; margin-bottom: 1rem;">2️⃣</h2>
+            <h4 style="color: #374151; margin-bottom: 1rem;">Explore & Preprocess</h4>
+            <p style="color: #6b7280; font-size: 0.9rem;">
+                Use the <strong>Dashboard</strong> to explore your data, then apply preprocessing 
+                techniques to prepare it for machine learning.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="modern-card" style="text-align: center; padding: 2rem;">
+            <h2 style="color: #06b6d4; margin-bottom: 1rem;">3️⃣</h2>
+            <h4 style="color: #374151; margin-bottom: 1rem;">Train & Export</h4>
+            <p style="color: #6b7280; font-size: 0.9rem;">
+                Train your model in the <strong>Model</strong> section, analyze results, 
+                and export everything for future use.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Call to Action
+    st.markdown("---")
+    st.markdown("""
+    <div style="text-align: center; padding: 2rem; background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%); border-radius: 12px; margin: 2rem 0;">
+        <h3 style="color: #374151; margin-bottom: 1rem;">Ready to Start Your ML Journey?</h3>
+        <p style="color: #6b7280; margin-bottom: 2rem; max-width: 500px; margin-left: auto; margin-right: auto;">
+            Begin by uploading your dataset and let our intelligent platform guide you through 
+            the complete machine learning workflow.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Quick Tips
+    st.markdown("### 💡 Pro Tips")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="modern-card">
+            <h4 style="color: #10b981; margin-bottom: 1rem;">🎯 Data Quality</h4>
+            <ul style="color: #6b7280; font-size: 0.9rem;">
+                <li>Ensure your CSV has clear column headers</li>
+                <li>Check for consistent data types</li>
+                <li>Remove or handle extreme outliers</li>
+                <li>Verify data encoding (UTF-8 recommended)</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="modern-card">
+            <h4 style="color: #f59e0b; margin-bottom: 1rem;">⚡ Performance</h4>
+            <ul style="color: #6b7280; font-size: 0.9rem;">
+                <li>Start with smaller datasets for testing</li>
+                <li>Monitor training progress in real-time</li>
+                <li>Export results regularly for backup</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)